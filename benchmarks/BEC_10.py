@@ -0,0 +1,200 @@
+# dependencies
+import argparse
+import json
+import numpy as np
+import os
+import platform
+import sys
+import time
+
+# add path to local libraries
+sys.path.append(os.path.abspath(os.path.join('.')))
+# import system
+from systems.BoseEinsteinCondensate import BEC_10
+
+# all parameters
+params = {
+    'benchmarks': {
+        'file_path' : 'benchmarks/baselines/BEC_10.json',
+        'repeats'   : 5,
+        'tolerance' : 0.8,
+        'dims_row'  : [10001, 400001, 800001],
+        'dims_map'  : [1001, 101],
+        'num_calls' : 1000
+    },
+    'system': {
+        'Delta_tilde'   : -1.0,
+        'delta'         : 0.0,
+        'G'             : 2 * np.pi * 1e3,
+        'g_tilde_norm'  : 0.0,
+        'gamma_m'       : 2 * np.pi * 0.8,
+        'gamma_o'       : 2 * np.pi * 1e3,
+        'k'             : 1,
+        'L_p'           : 1,
+        'l'             : 20,
+        'lambda_lc'     : 589e-9,
+        'm'             : 23,
+        'mu'            : 0.5,
+        'N'             : 1e4,
+        'P_lc'          : 1e-15,
+        'P_lp_norm'     : 0.01,
+        'R'             : 10e-6,
+        't_approx'      : 'none',
+        't_Delta_norm'  : 'Omega_m',
+        't_Delta_offset': 'zero',
+        't_delta_norm'  : 'Omega_m',
+        't_delta_offset': 'Omega_m',
+        't_line'        : 's',
+        't_oss_method'  : 'cubic',
+        't_P_lc_norm'   : 'none'
+    }
+}
+
+# function to obtain the best time of repeated calls
+def get_time(func, repeats):
+    times = list()
+    for _ in range(repeats):
+        t_start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t_start)
+    return min(times)
+
+# function to obtain the constants for a row of probe detunings
+def get_c_row(dim, t_precision='double'):
+    system = BEC_10(
+        params=dict(params['system'], t_precision=t_precision)
+    )
+    _, _, c = system.get_ivc()
+    c[1] = c[1] + np.linspace(-0.5, 0.5, dim) * c[1]
+    return system, c
+
+# function to obtain the constants for a map over the laser detuning and the control power
+def get_c_map(dims):
+    system = BEC_10(
+        params=params['system']
+    )
+    c = system.get_c_batch(
+        axes={
+            'Delta_tilde'   : np.linspace(-2.0, 2.0, dims[0]),
+            'P_lc'          : np.linspace(0.1e-15, 10e-15, dims[1])
+        }
+    )
+    return system, c
+
+# function to obtain the benchmarks formatted as name, number of points and callable
+def get_benchmarks():
+    # frequently used variables
+    num_calls = params['benchmarks']['num_calls']
+    dims_map = params['benchmarks']['dims_map']
+    benchmarks = list()
+
+    # initialization
+    def func_ivc():
+        for _ in range(num_calls):
+            BEC_10(
+                params=params['system']
+            ).get_ivc()
+    benchmarks.append(('get_ivc', num_calls, func_ivc))
+
+    # transmission and phase over rows of probe detunings
+    for dim in params['benchmarks']['dims_row']:
+        system, c = get_c_row(dim)
+        benchmarks.append(('get_transmission_{}'.format(dim), dim, lambda system=system, c=c: system.get_transmission(c=c)))
+        benchmarks.append(('get_transmission_phase_{}'.format(dim), dim, lambda system=system, c=c: system.get_transmission_phase(c=c)))
+        system, c = get_c_row(dim, 'single')
+        benchmarks.append(('get_transmission_single_{}'.format(dim), dim, lambda system=system, c=c: system.get_transmission(c=c)))
+
+    # mean optical occupancies for single points and maps
+    system = BEC_10(
+        params=params['system']
+    )
+    def func_N_os():
+        for _ in range(num_calls):
+            system.get_mean_optical_occupancies()
+    benchmarks.append(('get_mean_optical_occupancies', num_calls, func_N_os))
+    system, c = get_c_map(dims_map)
+    num_points = int(np.prod(dims_map))
+    benchmarks.append(('get_mean_optical_occupancies_batch_{}x{}'.format(*dims_map), num_points, lambda: system.get_mean_optical_occupancies_batch(c=c)))
+
+    # coefficients of the characteristic polynomial
+    with np.errstate(invalid='ignore'):
+        modes = np.moveaxis(system.get_modes_steady_state(
+            c=c
+        ), 1, 0)
+    def func_coeffs_A():
+        with np.errstate(invalid='ignore'):
+            system.get_coeffs_A(
+                modes=modes,
+                c=c
+            )
+    benchmarks.append(('get_coeffs_A_{}x{}'.format(*dims_map), num_points, func_coeffs_A))
+
+    # roots of the polynomial in probe detuning
+    benchmarks.append(('get_deltas_{}x{}'.format(*dims_map), num_points, lambda: system.get_deltas(c=c)))
+
+    # stability zones
+    benchmarks.append(('get_stability_batch_{}x{}'.format(*dims_map), num_points, lambda: system.get_stability_batch(c=c)))
+
+    return benchmarks
+
+if __name__ == '__main__':
+    # options
+    parser = argparse.ArgumentParser(description='Benchmarks for the hot paths of BEC_10.')
+    parser.add_argument('--save', action='store_true', help='save the results as the baselines')
+    parser.add_argument('--filter', default='', help='run only the benchmarks containing this string')
+    args = parser.parse_args()
+
+    # frequently used variables
+    file_path = params['benchmarks']['file_path']
+    repeats = params['benchmarks']['repeats']
+    tolerance = params['benchmarks']['tolerance']
+
+    # load baselines
+    baselines = dict()
+    if os.path.isfile(file_path):
+        with open(file_path, 'r') as file:
+            baselines = json.load(file)['results']
+
+    # run benchmarks
+    results = dict()
+    regressions = list()
+    missing = list()
+    print('{:<44}{:>10}{:>12}{:>16}{:>10}'.format('benchmark', 'points', 'time (s)', 'points/s', 'ratio'))
+    for name, num_points, func in get_benchmarks():
+        if args.filter not in name:
+            continue
+        # warm up caches and compiled functions
+        func()
+        t = get_time(func, repeats)
+        results[name] = num_points / t
+        # compare with baseline
+        ratio = results[name] / baselines[name] if name in baselines else np.nan
+        flag = ' REGRESSION' if ratio < tolerance else ''
+        if flag:
+            regressions.append(name)
+        if name not in baselines:
+            flag = ' MISSING'
+            missing.append(name)
+        print('{:<44}{:>10}{:>12.4f}{:>16.1f}{:>10.2f}{}'.format(name, num_points, t, results[name], ratio, flag))
+
+    # save baselines
+    if args.save:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'w') as file:
+            json.dump({
+                'machine': {
+                    'platform': platform.platform(),
+                    'processor': platform.processor(),
+                    'python': platform.python_version(),
+                    'numpy': np.__version__
+                },
+                'results': dict(baselines, **results)
+            }, file, indent=4)
+
+    # exit with failure for regressions and missing baselines
+    if len(regressions) > 0:
+        print('Regressions in points/s below {} times the baselines: {}'.format(tolerance, ', '.join(regressions)))
+    if len(missing) > 0 and not args.save:
+        print('Missing baselines in {} (run with --save to record them): {}'.format(file_path, ', '.join(missing)))
+    if len(regressions) > 0 or (len(missing) > 0 and not args.save):
+        sys.exit(1)
@@ -0,0 +1,448 @@
+# dependencies
+import argparse
+import numpy as np
+import os
+import scipy.linalg as sl
+import sys
+import tempfile
+
+# add path to local libraries
+sys.path.append(os.path.abspath(os.path.join('.')))
+# import system and solvers
+from systems.BoseEinsteinCondensate import BEC_10
+from utils import kernels
+from utils.loopers import get_axes, get_system_params_row, run_loopers_rows
+from utils.solvers import get_lyapunov_solutions, get_N_os_cubic
+from utils.storage import ResultCache
+
+# all parameters
+params = {
+    'checks': {
+        'seed'      : 0,
+        'dim_N_os'  : 20000,
+        'dim_delta' : 200001,
+        'dim_lyap'  : 1000
+    },
+    'looper': {
+        'X'     : {
+            'var'   : 'delta',
+            'min'   : -0.002,
+            'max'   : 0.002,
+            'dim'   : 2001
+        },
+        'Y'     : {
+            'var'   : 'P_lc',
+            'val'   : [0.5e-15, 1e-15, 1.5e-15]
+        }
+    },
+    'system': {
+        'Delta_tilde'   : -1.0,
+        'delta'         : 0.0,
+        'G'             : 2 * np.pi * 1e3,
+        'g_tilde_norm'  : 0.0,
+        'gamma_m'       : 2 * np.pi * 0.8,
+        'gamma_o'       : 2 * np.pi * 1e3,
+        'k'             : 1,
+        'L_p'           : 1,
+        'l'             : 20,
+        'lambda_lc'     : 589e-9,
+        'm'             : 23,
+        'mu'            : 0.5,
+        'N'             : 1e4,
+        'P_lc'          : 1e-15,
+        'P_lp_norm'     : 0.01,
+        'R'             : 10e-6,
+        't_approx'      : 'none',
+        't_Delta_norm'  : 'Omega_m',
+        't_Delta_offset': 'zero',
+        't_delta_norm'  : 'Omega_m',
+        't_delta_offset': 'Omega_m',
+        't_line'        : 's',
+        't_oss_method'  : 'cubic',
+        't_P_lc_norm'   : 'none'
+    }
+}
+
+# function to obtain the derived constants and controls of a row with the scattering line
+def func_c(system_params):
+    # initialize system
+    system = BEC_10(
+        params=system_params
+    )
+    # extract parameters
+    _, _, c = system.get_ivc()
+    return c, system_params['t_line']
+
+# function to obtain the group delay over a chunk of a row
+def func_group_delay(consts, idxs):
+    # extract parameters of the chunk
+    c, t_line = consts
+    c = [np.asarray(c_i)[idxs] if np.ndim(c_i) > 0 else c_i for c_i in c]
+    # return group delay
+    return kernels.get_group_delay(
+        c=c,
+        t_approx=params['system']['t_approx'],
+        t_line=t_line,
+        t_oss_method=params['system']['t_oss_method']
+    )
+
+# function to check the closed-form occupancies against the roots of the polynomial
+def check_N_os_cubic():
+    # frequently used variables
+    rng = np.random.default_rng(params['checks']['seed'])
+    dim = params['checks']['dim_N_os']
+
+    # random points including bistable ones
+    C = rng.uniform(-1.0, 1.0, dim)
+    Delta_0 = rng.uniform(-4.0, 4.0, dim)
+    kappa = rng.uniform(0.1, 2.0, dim)
+    A_l_sq = 10**rng.uniform(-3.0, 2.0, dim)
+
+    # closed-form branches
+    N_os, num_branches = get_N_os_cubic(
+        C=C,
+        Delta_0=Delta_0,
+        kappa=kappa,
+        A_l_sq=A_l_sq
+    )
+
+    # positive real roots of the polynomial for each point
+    errors = list()
+    num_mismatches = 0
+    for i in range(dim):
+        roots = np.roots([4 * C[i]**2, 8 * C[i] * Delta_0[i], 4 * Delta_0[i]**2 + kappa[i]**2, - 4 * A_l_sq[i]])
+        roots = np.sort(np.real(roots[(np.abs(np.imag(roots)) <= 1e-6 * np.abs(roots)) & (np.real(roots) > 0)]))
+        if len(roots) != num_branches[i]:
+            num_mismatches += 1
+            continue
+        errors.append(np.max(np.abs(N_os[:len(roots), i] - roots) / roots))
+
+    # branch counts may only differ near the folds where the roots coincide
+    if num_mismatches > dim * 1e-3:
+        return np.inf, 1e-8
+
+    return np.max(errors), 1e-8
+
+# function to check the closed-form occupancies without the laser and without the shift
+def check_N_os_cubic_limits():
+    # frequently used variables
+    rng = np.random.default_rng(params['checks']['seed'])
+    dim = params['checks']['dim_N_os']
+
+    # random points including a vanishing coefficient
+    C = np.where(rng.uniform(size=dim) < 0.25, 0.0, rng.uniform(-1.0, 1.0, dim))
+    Delta_0 = rng.uniform(-4.0, 4.0, dim)
+    kappa = rng.uniform(0.1, 2.0, dim)
+    A_l_sq = 10**rng.uniform(-3.0, 2.0, dim)
+
+    # single zero branch in the absence of the laser
+    N_os, num_branches = get_N_os_cubic(
+        C=C,
+        Delta_0=Delta_0,
+        kappa=kappa,
+        A_l_sq=0.0
+    )
+    if np.any(num_branches != 1) or np.any(N_os[0] != 0.0):
+        return np.inf, 1e-12
+
+    # single linear branch in the absence of the shift
+    N_os, num_branches = get_N_os_cubic(
+        C=0.0,
+        Delta_0=Delta_0,
+        kappa=kappa,
+        A_l_sq=A_l_sq
+    )
+    if np.any(num_branches != 1):
+        return np.inf, 1e-12
+    N_os_ref = 4 * A_l_sq / (4 * Delta_0**2 + kappa**2)
+
+    return np.max(np.abs(N_os[0] - N_os_ref) / N_os_ref), 1e-12
+
+# function to check the analytical group delay against the numerical derivative of the phase
+def check_group_delay():
+    # frequently used variables
+    dim = params['checks']['dim_delta']
+    errors = list()
+
+    # for each approximation and scattering line
+    for t_approx in ['none', 'del', 'res', 'del-res']:
+        for t_line in ['s', 'as']:
+            system = BEC_10(
+                params=dict(params['system'], t_approx=t_approx, t_line=t_line)
+            )
+            _, _, c = system.get_ivc()
+            # probe detunings within a few mechanical linewidths of the resonance
+            c = list(c)
+            c[1] = c[1] + np.linspace(-5.0, 5.0, dim) * c[6]
+
+            # analytical and numerical group delays
+            tau = system.get_group_delay(
+                c=c
+            )
+            phi = np.unwrap(system.get_transmission_phase(
+                c=c
+            ))
+            tau_num = np.gradient(phi, c[1])
+
+            # exclude the end points of the second-order differences
+            errors.append(np.max(np.abs(tau[1:-1] - tau_num[1:-1])) / np.max(np.abs(tau[1:-1])))
+
+            # kernel with the fallback names of the scattering line
+            tau_kernel = kernels.get_group_delay(
+                c=c,
+                t_approx=t_approx,
+                t_line={'s': 'S', 'as': 'aS'}[t_line],
+                t_oss_method=params['system']['t_oss_method']
+            )
+            errors.append(np.max(np.abs(tau_kernel - tau)) / np.max(np.abs(tau)))
+
+    return np.max(errors), 1e-6
+
+# function to check the chunked reductions of the group delay against the rows of the kernel
+def check_group_delay_rows():
+    # frequently used variables
+    params_system = dict(params['system'], t_line='aS')
+    axes = get_axes(params['looper'])
+
+    # reductions over chunks of the rows with the fallback name of the anti-Stokes line
+    _, vs = run_loopers_rows(
+        func=func_group_delay,
+        params=params['looper'],
+        params_system=params_system,
+        reductions=['min', 'max'],
+        dim_chunk=300,
+        func_consts=func_c
+    )
+
+    # full rows of the anti-Stokes line
+    vs_ref = list()
+    for i in range(len(axes[0]['val'])):
+        system = BEC_10(
+            params=dict(get_system_params_row(params_system, axes, (i, )), t_line='as')
+        )
+        _, _, c = system.get_ivc()
+        tau = system.get_group_delay(
+            c=c
+        )
+        vs_ref.append([np.min(tau), np.max(tau)])
+    vs_ref = np.array(vs_ref)
+
+    return np.max(np.abs(vs - vs_ref)) / np.max(np.abs(vs_ref)), 1e-12
+
+# function to check the batched Lyapunov solutions against SciPy and their residuals for the system
+def check_lyapunov_solutions():
+    # frequently used variables
+    rng = np.random.default_rng(params['checks']['seed'])
+    dim = params['checks']['dim_lyap']
+
+    # random stable drift matrices and positive semi-definite noise matrices
+    As = rng.normal(size=(dim, 6, 6))
+    As -= (np.max(np.real(np.linalg.eigvals(As)), axis=-1) + 0.1)[:, np.newaxis, np.newaxis] * np.eye(6)
+    Ds = rng.normal(size=(dim, 6, 6))
+    Ds = Ds @ np.swapaxes(Ds, -1, -2)
+
+    # batched and reference solutions
+    Vs = get_lyapunov_solutions(
+        As=As,
+        Ds=Ds
+    )
+    Vs_ref = np.array([sl.solve_continuous_lyapunov(As[i], - Ds[i]) for i in range(dim)])
+    error = np.max(np.abs(Vs - Vs_ref)) / np.max(np.abs(Vs_ref))
+
+    # residuals of the steady-state correlations of the system
+    system = BEC_10(
+        params=params['system']
+    )
+    c = system.get_c_batch(
+        axes={
+            'Delta_tilde'   : np.linspace(-2.0, 2.0, 41),
+            'P_lc'          : np.linspace(0.1e-15, 10e-15, 11)
+        }
+    )
+    with np.errstate(invalid='ignore'):
+        Vs = system.get_corrs_steady_state(
+            c=c
+        )
+        As = system.get_A_batch(
+            modes=system._get_modes_lowest(
+                c=c
+            ),
+            c=c
+        )
+        Ds = system.get_D_batch(
+            c=c
+        )
+    _stable = np.all(np.isfinite(Vs), axis=(-2, -1))
+    _residuals = As[_stable] @ Vs[_stable] + Vs[_stable] @ np.swapaxes(As[_stable], -1, -2) + np.broadcast_to(Ds, As.shape)[_stable]
+    error_system = np.max(np.abs(_residuals)) / np.max(np.abs(np.broadcast_to(Ds, As.shape)[_stable]))
+
+    return max(error, error_system), 1e-10
+
+# function to check the sweeps in parallel and from the cache against the serial sweep
+def check_loopers_rows():
+    # frequently used variables
+    errors = list()
+
+    # serial sweep over chunks of the rows
+    _, vs = run_loopers_rows(
+        func=func_group_delay,
+        params=params['looper'],
+        params_system=params['system'],
+        dim_chunk=300,
+        func_consts=func_c
+    )
+
+    with tempfile.TemporaryDirectory() as dir_path:
+        cache = ResultCache(
+            dir_path=dir_path,
+            models=[BEC_10]
+        )
+        # sweep with a pool of workers streamed into the cache
+        _, vs_pool = run_loopers_rows(
+            func=func_group_delay,
+            params=params['looper'],
+            params_system=params['system'],
+            dim_chunk=300,
+            cache=cache,
+            num_processes=2,
+            func_consts=func_c
+        )
+        errors.append(np.max(np.abs(vs_pool - vs)) / np.max(np.abs(vs)))
+
+        # rerun loaded from the entry of the cache
+        key = cache.get_key(
+            params=params['looper'],
+            params_system=params['system'],
+            func=[func_c, func_group_delay],
+            attrs={
+                'reductions': None
+            }
+        )
+        store = cache.get(
+            key=key
+        )
+        if store is None:
+            return np.inf, 1e-12
+        store.close()
+        _, vs_cache = run_loopers_rows(
+            func=func_group_delay,
+            params=params['looper'],
+            params_system=params['system'],
+            dim_chunk=300,
+            cache=cache,
+            func_consts=func_c
+        )
+        errors.append(np.max(np.abs(vs_cache - vs)) / np.max(np.abs(vs)))
+
+    return max(errors), 1e-12
+
+# function to check the occupancies of the decoupled sidemodes against the thermal occupancies of their baths
+def check_sidemode_occupancies():
+    # frequently used variables
+    n_ths = [0.0, 3.0, 1e3]
+    errors = list()
+
+    # sidemodes decoupled from the light and from each other
+    system = BEC_10(
+        params=dict(params['system'], g_tilde_norm=0.0)
+    )
+    c = system.get_c_batch(
+        axes={
+            'P_lc'  : np.zeros(4)
+        }
+    )
+
+    # for each thermal occupancy of the baths
+    for n_th in n_ths:
+        n_ms = system.get_sidemode_occupancies(
+            c=c,
+            n_ths=[n_th, 2 * n_th]
+        )
+        errors.append(np.max(np.abs(n_ms[0] - n_th)) / (n_th + 1))
+        errors.append(np.max(np.abs(n_ms[1] - 2 * n_th)) / (2 * n_th + 1))
+
+    return max(errors), 1e-10
+
+# function to check the steady states and the derived quantities without the control laser
+def check_steady_state_without_laser():
+    # frequently used variables
+    errors = list()
+
+    # for each method of the optical steady state
+    for t_oss_method in ['basic', 'cubic']:
+        system = BEC_10(
+            params=dict(params['system'], P_lc=0.0, t_oss_method=t_oss_method)
+        )
+        _, _, c = system.get_ivc()
+
+        # single zero branch
+        Modes = system.get_modes_steady_state(
+            c=c
+        )
+        if len(Modes) != 1:
+            return np.inf, 1e-12
+        errors.append(np.max(np.abs(Modes)))
+
+        # transmission and normalized linewidth at resonance without cooperativity
+        T = system.get_transmission_resonance(
+            c=c
+        )
+        fwhm = system.get_fwhm_norm_resonance(
+            c=c
+        )
+        _, Omegas, _, _ = system.get_effective_values(
+            c=c
+        )
+        errors.append(abs(T))
+        errors.append(abs(fwhm - c[6] / Omegas[0]) / (c[6] / Omegas[0]))
+
+        # batched transmission and stability over powers starting without the laser
+        c = system.get_c_batch(
+            axes={
+                'P_lc'  : np.linspace(0.0, 1.5e-15, 4)
+            }
+        )
+        Ts = system.get_transmission(
+            c=c
+        )
+        num_unstable, _ = system.get_stability_batch(
+            c=c
+        )
+        if not np.all(np.isfinite(Ts)) or np.any(num_unstable[0] < 0):
+            return np.inf, 1e-12
+
+    return max(errors), 1e-12
+
+# checks formatted as name and callable returning the error and its tolerance
+checks = [
+    ('get_N_os_cubic vs numpy.roots', check_N_os_cubic),
+    ('get_N_os_cubic without laser or shift', check_N_os_cubic_limits),
+    ('get_group_delay vs numpy.gradient', check_group_delay),
+    ('group delay reductions vs rows', check_group_delay_rows),
+    ('get_lyapunov_solutions vs scipy.linalg', check_lyapunov_solutions),
+    ('run_loopers_rows in parallel and cached', check_loopers_rows),
+    ('get_sidemode_occupancies vs thermal baths', check_sidemode_occupancies),
+    ('steady states without the control laser', check_steady_state_without_laser)
+]
+
+if __name__ == '__main__':
+    # options
+    parser = argparse.ArgumentParser(description='Numerical checks for the solvers and the analytical expressions of BEC_10.')
+    parser.add_argument('--filter', default='', help='run only the checks containing this string')
+    args = parser.parse_args()
+
+    # run checks
+    failures = list()
+    for name, func in checks:
+        if args.filter not in name:
+            continue
+        error, tol = func()
+        flag = '' if error <= tol else ' FAILED'
+        if flag:
+            failures.append(name)
+        print('{:<48}{:>12.2e}{:>12.2e}{}'.format(name, error, tol, flag))
+
+    # exit with failure for failed checks
+    if len(failures) > 0:
+        print('Failed checks: {}'.format(', '.join(failures)))
+        sys.exit(1)
@@ -5,19 +5,21 @@ import sys
 
 # qom modules
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.BoseEinsteinCondensate import BEC_10
+# import utilities
+from utils import kernels
+from utils.loopers import run_loopers_rows
+from utils.storage import ResultCache
 
 # all parameters
 params = {
     'looper': {
         'show_progress'     : True,
         'file_path_prefix'  : 'data/v3.5_qom-v1.0.1/10a_inset',
-        'grad'              : True,
         'X'                 : {
             'var'   : 'delta',
             'min'   : -0.002,
@@ -80,35 +82,45 @@ params = {
     }
 }
 
-# function to obtain the normalized transmission phase
-def func_transmission_phase_norm(system_params):
+# function to obtain the derived constants and controls of a row
+def func_c(system_params):
     # initialize system
     system = BEC_10(
         params=system_params
     )
     # extract parameters
     _, _, c = system.get_ivc()
-    # get transmission phase
-    phi = system.get_transmission_phase(
-        c=c
-    )
-    # normalize by additive detuning
-    _, Omegas, _, _ = system.get_effective_values(
-        c=c
+    return c
+
+# function to obtain the group delay over a chunk of a row
+def func_group_delay(c, idxs):
+    # extract parameters of the chunk
+    c = [np.asarray(c_i)[idxs] if np.ndim(c_i) > 0 else c_i for c_i in c]
+    # return group delay
+    return kernels.get_group_delay(
+        c=c,
+        t_approx=params['system']['t_approx'],
+        t_line=params['system']['t_line'],
+        t_oss_method=params['system']['t_oss_method']
     )
-    # return normalized value
-    return phi / (Omegas[0] + Omegas[1]) * 2
 
 if __name__ == '__main__':
-    # looper
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_transmission_phase_norm,
+    # looper with the maximum group delay per row
+    axes, vs = run_loopers_rows(
+        func=func_group_delay,
         params=params['looper'],
-        params_system=params['system']
+        params_system=params['system'],
+        cache=ResultCache(
+            dir_path='data/v3.5_qom-v1.0.1/cache',
+            models=[BEC_10]
+        ),
+        reductions=['max'],
+        dim_chunk=40001,
+        num_processes=None,
+        func_consts=func_c
     )
-    xs = looper.axes['Y']['val']
-    vs = [[np.max(v) for v in looper.results['V']]]
+    xs = axes[0]['val']
+    vs = [vs[:, 0]]
 
     # plotter
     plotter = MPLPlotter(axes={
@@ -4,13 +4,14 @@ import os
 import sys
 
 # qom modules
-from qom.utils.solvers import get_func_stability_zone
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
+from qom.ui.plotters import MPLPlotter
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.BoseEinsteinCondensate import BEC_10
+# import utilities
+from utils.loopers import get_axes
 
 # all parameters
 params = {
@@ -32,11 +33,6 @@ params = {
             'scale' : 'linear'
         }
     },
-    'solver': {
-        'show_progress'         : False,
-        'use_system_method'     : True,
-        'system_measure_name'   : 'coeffs_A'
-    },
     'system': {
         'Delta_tilde'   : -1.0,
         'delta'         : 0.0,
@@ -97,25 +93,39 @@ params = {
     }
 }
 
-# function to obtain the stability zone
-def func_stability_zone(system_params):
-    # return function
-    return get_func_stability_zone(
-        SystemClass=BEC_10,
-        params=params['solver'],
-        steady_state=True,
-        use_rhc=False
-    )(
-        system_params=system_params
+# function to obtain the stability zones over the grid
+def func_stability_zones(axes):
+    # initialize system
+    system = BEC_10(
+        params=params['system']
+    )
+    # get stacked constants of the grid
+    c = system.get_c_batch(
+        axes={axis['var']: axis['val'] for axis in axes}
+    )
+    # get stability of all the branches
+    num_unstable, _ = system.get_stability_batch(
+        c=c
     )
+    # zones indexed by the multistability and the number of stable branches
+    num_branches = np.sum(num_unstable >= 0, axis=0)
+    num_stable = np.sum(num_unstable == 0, axis=0)
+    return np.where(num_branches > 1, 8, 4) * (num_branches > 0) + num_stable
 
-# looper
 if __name__ == '__main__':
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_stability_zone,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=True,
-        params_plotter=params['plotter']
-    )
\ No newline at end of file
+    # stability zones with the outer axis along the rows
+    axes = get_axes(params['looper'])
+    xs = axes[1]['val']
+    ys = axes[0]['val']
+    vs = func_stability_zones(axes)
+
+    # plotter
+    plotter = MPLPlotter(axes={
+        'X': xs,
+        'Y': ys
+    }, params=params['plotter'])
+    plotter.update(
+        vs=vs,
+        xs=xs
+    )
+    plotter.show()
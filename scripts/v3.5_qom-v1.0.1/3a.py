@@ -10,6 +10,8 @@ from qom.utils.loopers import wrap_looper
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.BoseEinsteinCondensate import BEC_10
+# import utilities
+from utils.storage import get_params_looper
 
 # all parameters
 params = {
@@ -105,7 +107,12 @@ def func_transmission(system_params):
 looper = wrap_looper(
     looper_name='XYLooper',
     func=func_transmission,
-    params=params['looper'],
+    params=get_params_looper(
+        params=params['looper'],
+        params_system=params['system'],
+        func=func_transmission,
+        models=[BEC_10]
+    ),
     params_system=params['system'],
     plot=True,
     params_plotter=params['plotter']
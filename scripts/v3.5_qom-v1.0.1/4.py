@@ -11,6 +11,9 @@ from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.BoseEinsteinCondensate import BEC_10
+# import utilities
+from utils.spectra import get_fwhm_center, get_maxima_center
+from utils.storage import get_params_looper
 
 # all parameters
 params = {
@@ -127,7 +130,12 @@ if __name__ == '__main__':
     looper = run_loopers_in_parallel(
         looper_name='XYLooper',
         func=func_transmission,
-        params=params['looper'],
+        params=get_params_looper(
+            params=params['looper'],
+            params_system=params['system'],
+            func=func_transmission,
+            models=[BEC_10]
+        ),
         params_system=params['system'],
         num_processes=2
     )
@@ -135,45 +143,23 @@ if __name__ == '__main__':
     # extract axes
     xs = looper.axes['X']['val']
     ys = looper.axes['Y']['val']
-    vs = looper.results['V']
+    vs = np.array(looper.results['V'])
     # calculate maximum transmission
-    Ts_maxi = [0]
-    for i in range(1, len(vs)):
-        Ts = vs[i]
-        dim = len(Ts)
-        k = int(dim / 2) + 1 if dim % 2 == 0 else int(dim / 2)
-        # locate change of derivative from positive to negative from center
-        while k <= dim - 2:
-            if Ts[k] - Ts[k - 1] >= 0 and Ts[k + 1] - Ts[k] <= 0:
-                Ts_maxi.append(Ts[k])
-                break
-            if Ts[- k - 1] - Ts[- k] >= 0 and Ts[- k - 2] - Ts[- k - 1] <= 0:
-                Ts_maxi.append(Ts[- k - 1])
-                break
-            k += 1
+    Ts_maxi = [0] + get_maxima_center(
+        xs=xs,
+        vs=vs[1:],
+        interpolate=False
+    ).tolist()
 
     # calculate transmission at resonance
     Ts_reso = [v[int(len(v) / 2)] for v in vs]
 
     # calculate normailzed FWHM
-    Gamma_ms_reso = [0]
-    for i in range(1, len(vs)):
-        Ts = vs[i]
-        dim = len(Ts)
-        mid = int(dim / 2) + 1 if dim % 2 == 0 else int(dim / 2)
-        k = mid
-        # locate half maxima
-        idxs = list()
-        flags = [0, 0]
-        while k <= dim - 2 and len(idxs) < 2:
-            if Ts[k] <= Ts_reso[i] / 2 and flags[1] == 0:
-                idxs.append(k)
-                flags[1] = 1
-            if Ts[- k - 1] <= Ts_reso[i] / 2 and flags[0] == 0:
-                idxs.append(- k - 1)
-                flags[0] = 1
-            k += 1
-        Gamma_ms_reso.append(np.abs(xs[idxs[-1]] - xs[idxs[0]]))
+    Gamma_ms_reso = [0] + get_fwhm_center(
+        xs=xs,
+        vs=vs[1:],
+        interpolate=False
+    ).tolist()
 
     # looper for transmission at resonance
     looper_Ts_reso = wrap_looper(
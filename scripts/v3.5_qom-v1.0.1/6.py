@@ -11,6 +11,9 @@ from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.BoseEinsteinCondensate import BEC_10
+# import utilities
+from utils.spectra import get_splittings_center
+from utils.storage import get_params_looper
 
 # all parameters
 params = {
@@ -101,35 +104,25 @@ if __name__ == '__main__':
     looper = run_loopers_in_parallel(
         looper_name='XYZLooper',
         func=func_transmission,
-        params=params['looper'],
+        params=get_params_looper(
+            params=params['looper'],
+            params_system=params['system'],
+            func=func_transmission,
+            models=[BEC_10]
+        ),
         params_system=params['system']
     )
     delta_norms = looper.axes['X']['val']
     xs = looper.axes['Y']['val']
     ys = looper.axes['Z']['val']
-    vs = looper.results['V']
+    vs = np.array(looper.results['V'])
 
     # calculate peak differences
-    ddelta_norms = list()
-    for i in range(len(vs)):
-        ddelta_norms_temp = list()
-        for j in range(len(vs[0])):
-            # for each transparency profile
-            Ts = vs[i][j]
-            dim = len(Ts)
-            k = int(dim / 2) + 1 if dim % 2 == 0 else int(dim / 2)
-            # locate change of derivative from positive to negative from center
-            idxs = list()
-            while k <= dim - 2 and len(idxs) < 2:
-                if Ts[k] - Ts[k - 1] >= 0 and Ts[k + 1] - Ts[k] <= 0:
-                    idxs.append(k)
-                if Ts[- k - 1] - Ts[- k] >= 0 and Ts[- k - 2] - Ts[- k - 1] <= 0:
-                    idxs.append(- k - 1)
-                k += 1
-            # update list with difference between peaks
-            ddelta_norms_temp.append(np.abs(delta_norms[idxs[-1]] - delta_norms[idxs[0]]))
-        # update main list
-        ddelta_norms.append(ddelta_norms_temp)
+    ddelta_norms = get_splittings_center(
+        xs=delta_norms,
+        vs=vs,
+        interpolate=False
+    )
 
     # plotter
     plotter = MPLPlotter(axes={
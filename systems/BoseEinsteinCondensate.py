@@ -6,16 +6,26 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2020-12-21"
-__updated__ = "2024-01-18"
+__updated__ = "2026-10-18"
 
 # dependencies
-from sympy import Symbol
+from collections import OrderedDict
+import logging
 import numpy as np
 import scipy.constants as sc
 
 # qom modules
 from qom.systems import BaseSystem
 
+# local modules
+from utils.integrators import get_modes_rk4
+from utils import kernels
+from utils.samplers import get_samples_adaptive
+from utils.solvers import get_lyapunov_solutions, get_N_os_cubic, get_roots_batch
+
+# module logger
+logger = logging.getLogger(__name__)
+
 class BEC_10(BaseSystem):
     r"""Class to simulate a BEC-OM system with a weak probe laser and a strong control laser containing OAM.
 
@@ -27,7 +37,7 @@ class BEC_10(BaseSystem):
         key                 meaning
         ================    ====================================================
         Delta_tilde         (*float*) laser detuning :math:`\tilde{\Delta}` with normalization determined by the value of ``t_Delta_norm`` and offset determined by the value of ``t_Delta_offset``. Default is :math:`-1.0` units with the value of ``t_Delta_norm`` set to ``'Omega_m'`` and ``t_Delta_offset`` set to ``'zero'``.
-        delta               (*float*) probe detuning :math:`\delta` with normalization determined by the value of ``t_delta_norm`` and offset determined by the value of ``t_delta_offset``. Default is :math:`0.0` units with the value of ``t_delta_norm`` set to ``'Omega_m'`` and ``t_delta_offset`` set to ``'Omega_m'``.
+        delta               (*float* or *numpy.ndarray*) probe detuning :math:`\delta` with normalization determined by the value of ``t_delta_norm`` and offset determined by the value of ``t_delta_offset``. Default is :math:`0.0` units with the value of ``t_delta_norm`` set to ``'Omega_m'`` and ``t_delta_offset`` set to ``'Omega_m'``.
         G                   (*float*) sidemode coupling constant :math:`G` in Hertz. Default is :math:`2 \pi \times 10^{3}` Hz.
         g_tilde_norm        (*float*) normalized atom-atom interaction strength :math:`4 I N \tilde{g} / \hbar`. Default is :math:`0.0`.
         gamma_m             (*float*) mechanical decay rate :math:`\gamma_{m}` in Hertz. Default is :math:`2 \pi \times 0.8` Hz.
@@ -42,6 +52,7 @@ class BEC_10(BaseSystem):
         P_lc                (*float*) power of the control laser :math:`P_{lc}` normalized by the critical power :math:`P_{lp_{cr}}` if the value of ``t_P_lc_norm`` is ``'cr'``, otherwise the fixed value in Watts. Default is :math:`1 \times 10^{-15}` Watts with the value of ``t_P_lc_norm`` set to ``'none'``.
         P_lp_norm           (*float*) power of the probe laser :math:`P_{lp}` normalized by :math:`P_{lc}`. Default is :math:`0.01`.
         R                   (*float*) radius of the ring :math:`R` in metres. Default is :math:`12 \times 10^{-6}` m.
+        T                   (*float*) temperature of the sidemodes :math:`T` in Kelvin. Default is :math:`20 \times 10^{-9}` K.
         t_approx            (*str*) type of approximation. Options are ``'del'`` for approximation on delta, ``'res'`` for resolved sideband approximation, ``'del-res'`` for both and ``'none'`` (fallback). Default is ``'none'``.
         t_Delta_norm        (*str*) type of normalization for the laser detuning. Options are ``'cr'`` for critical detuning :math:`\tilde{Delta}_{cr}`, ``'gamma_m'`` for sidemode decay rate, ``'gamma_o'`` for optical decay rate, ``'Omega_c'`` for first sidemode, ``'Omega_d'`` for second sidemode, ``'Omega_m'`` for additive detuning, ``'Omega_n'`` for subtractive detuning, otherwise :math:`1.0` (fallback). Default is ``'none'``.
         t_Delta_offset      (*str*) type of offset for the laser detuning. Options are ``'cr'`` for critical detuning, ``'gamma_m'`` for sidemode decay rate, ``'gamma_o'`` for optical decay rate, ``'Omega_c'`` or ``'-Omega_c'`` for first sidemode, ``'Omega_d'`` or ``'-Omega_d'`` for second sidemode, ``'Omega_m'`` or ``'-Omega_m'`` for additive detuning, ``'Omega_n'`` or ``'-Omega_n'`` for subtractive detuning, otherwise no offset (fallback). Default is ``'zero'``.
@@ -50,6 +61,7 @@ class BEC_10(BaseSystem):
         t_line              (*str*) type of scattering line. Options are ``'s'`` or ``'S'`` (fallback) for Stokes and ``'as'`` or ``'aS'`` for anti-Stokes. Default is ``'s'``.
         t_oss_method        (*str*) type of method to use for calculating the optical steady state. Options are ``'basic'`` which ignores the coefficient of ``N_o`` (fallback) and ``'cubic'`` to solve the cubic equation. Default is ``'cubic'``.
         t_P_lc_norm         (*str*) type of normalization for :math:`P_{lc}`. Options are ``'cr'`` for critical power, otherwise :math:`1.0` (fallback). Default is ``'none'``.
+        t_precision         (*str*) precision of the transmission kernels. Options are ``'single'`` for float32 and complex64 with the error estimated against a sample in double precision, and ``'double'`` (fallback). Default is ``'double'``.
         ================    ====================================================
     cb_update : callable, optional
         Callback function to update status and progress, formatted as ``cb_update(status, progress, reset)``, where ``status`` is a string, ``progress`` is an integer and ``reset`` is a boolean.
@@ -73,6 +85,7 @@ class BEC_10(BaseSystem):
         'P_lc'          : 1e-15,
         'P_lp_norm'     : 0.01,
         'R'             : 10e-6,
+        'T'             : 20e-9,
         't_approx'      : 'none',
         't_Delta_norm'  : 'Omega_m',
         't_Delta_offset': 'zero',
@@ -80,11 +93,28 @@ class BEC_10(BaseSystem):
         't_delta_offset': '-Omega_m',
         't_line'        : 's',
         't_oss_method'  : 'cubic',
-        't_P_lc_norm'   : 'none'
+        't_P_lc_norm'   : 'none',
+        't_precision'   : 'double'
     }
 
+    # maximum number of cached steady states
+    cache_size_steady_state = 1024
+    # steady states shared by all instances in the process
+    _cache_steady_state = OrderedDict()
+    # compiled coefficients of the polynomial in probe detuning
+    _funcs_coeffs_deltas = None
+    # maximum number of points sampled to estimate the error of the single precision
+    num_samples_precision = 64
+    # tolerance of the error of the single precision
+    tol_precision = 1e-3
+
     def __init__(self, params, cb_update=None):
         """Class constructor for BEC_10."""
+
+        # derived values memoized over the constants they depend on
+        self._memo = dict()
+        # error of the last evaluation in single precision
+        self.error_precision = None
         
         # initialize super class
         super().__init__(
@@ -95,6 +125,301 @@ class BEC_10(BaseSystem):
             cb_update=cb_update
         )
 
+    def _get_c(self, params):
+        """Method to obtain the derived constants and controls from the system parameters.
+
+        The numerical values of the parameters can either be scalars or broadcastable arrays.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters for the system.
+
+        Returns
+        -------
+        c : list
+            Derived constants and controls in the order of ``get_ivc``.
+        """
+
+        # extract frequently used variables
+        Delta_tilde = params['Delta_tilde']
+        delta = params['delta']
+        G = params['G']
+        g_tilde_norm = params['g_tilde_norm']
+        gamma_m = params['gamma_m']
+        gamma_o = params['gamma_o']
+        k = params['k']
+        L_p = params['L_p']
+        l = params['l']
+        lambda_lc = params['lambda_lc']
+        m = params['m']
+        mu = params['mu']
+        N = params['N']
+        P_lc = params['P_lc']
+        P_lp_norm = params['P_lp_norm']
+        R = params['R']
+        t_Delta_norm = params['t_Delta_norm']
+        t_Delta_offset = params['t_Delta_offset']
+        t_delta_norm = params['t_delta_norm']
+        t_delta_offset = params['t_delta_offset']
+        t_P_lc_norm = params['t_P_lc_norm']
+
+        # moment of inertia
+        I = m * sc.physical_constants['atomic mass constant'][0] * R**2
+
+        # atomic interaction strengths
+        g_tilde = g_tilde_norm * sc.hbar / 4 / I / N
+
+        # frequently used variable
+        temp = 2 * g_tilde * N
+
+        # first sidemode
+        omega_c = sc.hbar * (L_p + 2 * l)**2 / 2 / I
+        omega_c_tilde = omega_c + temp
+        Omega_c = np.sqrt((omega_c + 2 * temp)**2 - temp**2)
+        # second sidemode
+        omega_d = sc.hbar * (L_p - 2 * l)**2 / 2 / I
+        omega_d_tilde = omega_d + temp
+        Omega_d = np.sqrt((omega_d + 2 * temp)**2 - temp**2)
+        
+        # frequently used variables
+        A_mathcal = temp * (omega_c - omega_d)
+        A_2 = A_mathcal**2 + Omega_c**2 * Omega_d**2
+        C = G**2 * (omega_c_tilde + omega_d_tilde) / np.sqrt(A_2)
+
+        # critical detuning
+        Delta_tilde_cr = - np.sqrt(3) * gamma_o / 2
+        # frequency of the control laser
+        omega_lc = 2 * np.pi * sc.c / lambda_lc
+        # critical power of the control laser
+        P_cr = gamma_o**2 * sc.hbar * omega_lc / 3 / np.sqrt(3) / C / mu
+
+        # mean and difference of frequencies
+        Omega_m = (Omega_c + Omega_d) / 2
+        Omega_n = (Omega_c - Omega_d) * k
+
+        # selector for detuning and offset
+        _selector = {
+            'cr': Delta_tilde_cr,
+            'gamma_m': gamma_m,
+            'gamma_o': gamma_o,
+            'Omega_c': Omega_c,
+            '-Omega_c': -Omega_c,
+            'Omega_d': Omega_d,
+            '-Omega_d': -Omega_d,
+            'Omega_m': Omega_m,
+            '-Omega_m': -Omega_m,
+            'Omega_n': Omega_n,
+            '-Omega_n': -Omega_n
+        }
+        # laser detuning
+        Delta_tilde = Delta_tilde * np.abs(_selector.get(t_Delta_norm, 1.0)) + _selector.get(t_Delta_offset, 0.0)
+        # probe detuning
+        delta = delta * np.abs(_selector.get(t_delta_norm, 1.0)) + _selector.get(t_delta_offset, Delta_tilde if t_delta_offset == 'Delta' else 0.0)
+        
+        # selector for control power
+        _selector_P_lc = {
+            'cr': P_cr
+        }
+        # power of the control laser
+        P_lc = P_lc * _selector_P_lc.get(t_P_lc_norm, 1.0)
+        # amplitude of the control laser
+        eta_lc = np.sqrt(mu * gamma_o * P_lc / sc.hbar / omega_lc)
+
+        # power of the probe laser
+        P_lp = P_lp_norm * P_lc
+        # frequency of the probe laser
+        omega_lp = delta + omega_lc
+        # amplitude of the probe laser
+        eta_lp = np.sqrt(mu * gamma_o * P_lp / sc.hbar / omega_lp)
+
+        # constant parameters
+        c = [Delta_tilde, delta] + \
+            [eta_lc, eta_lp] + \
+            [G, g_tilde] + \
+            [gamma_m, gamma_o] + \
+            [mu, N] + \
+            [omega_c, omega_d]
+
+        # # display parameter values
+        # logger.debug('G={}, g_tilde_norm={}, gamma_m={}, gamma_o={}, L_p={}, l={}, lamnda_lc={}, m={}, mu={}, N={}\n'.format(G, g_tilde_norm, gamma_m, gamma_o, L_p, l, lambda_lc, m, mu, N))
+        # # display critical values values
+        # logger.debug('omega_lc={}, Delta_tilde_cr={}, P_cr={}, Omegas={}, Delta_tilde={}, C={}\n'.format(omega_lc, Delta_tilde_cr, P_cr, [Omega_c, Omega_d], Delta_tilde, C))
+        # # display condition for weak perturbations
+        # logger.debug('hbar L_p^2 / 2 I + 2 g_tilde N={}, g_a^2 / Delta_a={}, 4 g_tilde N={}\n'.format(sc.hbar * L_p**2 / 2 / I + 2 * g_tilde * N, 2 * np.sqrt(2) * params[4] / np.sqrt(params[9]), 4 * g_tilde * N))
+
+        return c
+
+    def _get_coeffs_Ss(self, c):
+        r"""Method to obtain the coefficients of the noise spectra independent of the mean optical occupancy.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        a_sn : float or numpy.ndarray
+            Coefficient of the shot noise :math:`S_{sn} = a_{sn} / | \alpha_{s} |^{2}`.
+        b_rp : float or numpy.ndarray
+            Coefficient of the radiation pressure noise :math:`S_{rp} = b_{rp} | \alpha_{s} |^{2}`.
+        c_th : float or numpy.ndarray
+            Coefficient of the thermal noise :math:`S_{th} = c_{th} \coth (\hbar \delta / 2 k_{B} T)`.
+        alpha_s_sq : float or numpy.ndarray
+            Mean optical occupancy at the lowest branch of the steady state.
+        """
+
+        # extract frequently used variables
+        delta = c[1]
+        G = c[4]
+        gamma_m = c[6]
+        gamma_o = c[7]
+
+        # get steady-state values
+        _, alpha_s, _, (_, Omegas, _, C) = self.get_values_steady_state(
+            c=c
+        )
+        alpha_s_sq = np.real(np.conjugate(alpha_s) * alpha_s)
+
+        # shot noise
+        a_sn = (delta**2 + gamma_o**2 / 4) / 4 / G**2 / gamma_o
+
+        # radiation pressure noise
+        _chis = [1 / (Omegas[i]**2 - 1j * delta * gamma_m - delta**2) for i in range(2)]
+        _F = C**2 / G**4 * np.real(np.conjugate(Omegas[0] * _chis[0]) * Omegas[0] * _chis[0]) * np.real(np.conjugate(Omegas[1] * _chis[1]) * Omegas[1] * _chis[1]) * ((delta**2 - Omegas[0] * Omegas[1])**2 + gamma_m**2 * delta**2)
+        b_rp = gamma_o * G**2 * _F / (delta**2 + gamma_o**2 / 4)
+
+        # thermal noise
+        c_th = gamma_m * delta * (Omegas[0] * np.real(np.conjugate(_chis[0]) * _chis[0]) + Omegas[1] * np.real(np.conjugate(_chis[1]) * _chis[1]))
+
+        return a_sn, b_rp, c_th, alpha_s_sq
+
+    def _get_funcs_coeffs_deltas(self):
+        """Method to compile the coefficients of the polynomial in probe detuning from its symbolic expression.
+
+        Returns
+        -------
+        func : callable
+            Function returning the coefficients in descending powers of the probe detuning, formatted as ``func(Delta, G, gamma_m, gamma_o, A_mathcal, Omega_c, Omega_d, omega_c_tilde, omega_d_tilde, N_o)``.
+        """
+
+        # load symbolic dependencies only when compiling
+        from sympy import cancel, I, lambdify, Poly, Symbol, symbols, together
+
+        # symbolic parameters
+        params = symbols('Delta G gamma_m gamma_o A_mathcal Omega_c Omega_d omega_c_tilde omega_d_tilde N_o', real=True)
+        Delta, G, gamma_m, gamma_o, A_mathcal, Omega_c, Omega_d, omega_c_tilde, omega_d_tilde, N_o = params
+        Omegas = [Omega_c, Omega_d]
+        omega_tildes = [omega_c_tilde, omega_d_tilde]
+        # inverse susceptibilities
+        chis_inv = symbols('chi_c_inv chi_d_inv')
+
+        # probe detuning
+        delta = Symbol('delta', complex=True)
+        # effective values
+        Gamma_m = gamma_o / 2 - I * (Delta + delta)
+        Gamma_p = gamma_o / 2 + I * (Delta - delta)
+        chis =  [1 / chis_inv[i] for i in range(2)]
+        # Lambda
+        _num = A_mathcal * chis[0] * chis[1] * (omega_tildes[0] - omega_tildes[1])
+        _num += sum([chis[i] * omega_tildes[i] for i in range(2)])
+        _den = A_mathcal**2 * chis[0] * chis[1] + 1
+        Lambda = _num / _den
+
+        # equation for delta
+        eqtn_delta = Gamma_m * Gamma_p + 2 * Delta * G**2 * Lambda * N_o
+        eqtn_delta *= _den / chis[0] / chis[1]
+        eqtn_delta = cancel(together(eqtn_delta))
+        # substitute susceptibilities
+        eqtn_delta = eqtn_delta.subs({chis_inv[i]: Omegas[i]**2 - I * delta * gamma_m - delta**2 for i in range(2)}).expand()
+
+        # list of coefficients
+        coeffs = Poly(eqtn_delta, delta).all_coeffs()
+
+        return lambdify(params, coeffs, 'numpy')
+
+    def _get_memoized(self, name, c, idxs, func):
+        """Method to obtain values derived from the derived constants and controls, memoized over the entries they depend on.
+
+        A single set of values is kept per name and is recomputed whenever any of the entries differs in shape or content from the ones it was obtained for, so that the methods evaluated for the same constants share the values.
+
+        Parameters
+        ----------
+        name : str
+            Name of the values.
+        c : numpy.ndarray
+            Derived constants and controls.
+        idxs : list
+            Indices of the entries of the constants the values depend on.
+        func : callable
+            Function returning the values, formatted as ``func()``.
+
+        Returns
+        -------
+        values : any
+            Values returned by the function.
+        """
+
+        # entries of the constants
+        key = [np.asarray(c[i]) for i in idxs]
+
+        # memoized values for the same entries
+        memo = self._memo.get(name)
+        if memo is not None and all(_key.shape == _key_memo.shape and np.array_equal(_key, _key_memo) for _key, _key_memo in zip(key, memo[0])):
+            return memo[1]
+
+        # copy the entries to detect changes in place
+        values = func()
+        self._memo[name] = ([np.array(_key) for _key in key], values)
+
+        return values
+
+    def _get_modes_lowest(self, c):
+        r"""Method to obtain the classical modes at the lowest branch of the steady state for all the values of the derived constants and controls.
+
+        The mechanical amplitudes are obtained from the positions as :math:`\beta = q / 2`, which is the convention of ``get_A`` and ``get_mode_rates``.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        modes : numpy.ndarray
+            Classical modes with shape ``(3, *dims)``.
+        """
+
+        # frequently used variables
+        dims = np.broadcast(*c).shape
+
+        # get steady state modes
+        Modes = self.get_modes_steady_state(
+            c=c
+        )
+        modes = np.array([np.broadcast_to(mode, dims) for mode in Modes[0]], dtype=np.complex_)
+        modes[1:] = modes[1:] / 2
+
+        return modes
+
+    def _get_values_steady_state(self, c, batched):
+        """Method to evaluate the steady-state values independent of the probe detuning without caching."""
+
+        # get steady-state values
+        N_os, alpha_s, Delta, values = kernels.get_values_steady_state(
+            c=c,
+            t_oss_method=self.params['t_oss_method'],
+            values=self.get_effective_values(
+                c=c
+            )
+        )
+        # existing branches for unbatched constants, including the zero branch without the control laser
+        if not batched:
+            N_os = [float(N_o) for N_o in N_os if N_o >= 0.0]
+
+        return N_os, alpha_s, Delta, values
+
     def get_A(self, modes, c, t=None):
         """Method to obtain the drift matrix.
 
@@ -113,6 +438,32 @@ class BEC_10(BaseSystem):
             Drift matrix.
         """
 
+        # update drift matrix
+        self.A[:] = self.get_A_batch(
+            modes=modes,
+            c=c
+        )
+
+        return self.A
+
+    def get_A_batch(self, modes, c):
+        """Method to obtain the drift matrices for a batch of classical modes and derived constants and controls.
+
+        Unlike ``get_A``, the matrices are returned as a new array without updating the instance.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(3, *dims)``.
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        A : numpy.ndarray
+            Drift matrices with shape ``(*dims, 6, 6)``.
+        """
+
         # extract frequently used variables
         Delta_tilde = c[0]
         G = c[4]
@@ -126,35 +477,38 @@ class BEC_10(BaseSystem):
         temp = 2 * g_tilde * N
 
         # derived frequencies
-        Delta = Delta_tilde - 2 * G * np.real(np.sum(betas))
+        Delta = Delta_tilde - 2 * G * np.real(betas[0] + betas[1])
+
+        # initialize drift matrices
+        A = np.zeros(np.broadcast(*c, *modes).shape + (6, 6), dtype=np.float_)
         
         # optical mode
-        self.A[0][0] = - gamma_o / 2
-        self.A[0][1] = - Delta
-        self.A[0][2] = np.sqrt(2) * G * np.imag(alpha)
-        self.A[0][4] = np.sqrt(2) * G * np.imag(alpha)
-        self.A[1][0] = Delta
-        self.A[1][1] = - gamma_o / 2
-        self.A[1][2] = - np.sqrt(2) * G * np.real(alpha)
-        self.A[1][4] = - np.sqrt(2) * G * np.real(alpha)
+        A[..., 0, 0] = - gamma_o / 2
+        A[..., 0, 1] = - Delta
+        A[..., 0, 2] = np.sqrt(2) * G * np.imag(alpha)
+        A[..., 0, 4] = np.sqrt(2) * G * np.imag(alpha)
+        A[..., 1, 0] = Delta
+        A[..., 1, 1] = - gamma_o / 2
+        A[..., 1, 2] = - np.sqrt(2) * G * np.real(alpha)
+        A[..., 1, 4] = - np.sqrt(2) * G * np.real(alpha)
         # first mechanical mode
-        self.A[2][3] = omegas[0] + 2 * temp
-        self.A[2][5] = - temp
-        self.A[3][0] = - np.sqrt(2) * G * np.real(alpha)
-        self.A[3][1] = - np.sqrt(2) * G * np.imag(alpha)
-        self.A[3][2] = - omegas[0] + 2 * temp
-        self.A[3][3] = - gamma_m
-        self.A[3][4] = - temp
+        A[..., 2, 3] = omegas[0] + 2 * temp
+        A[..., 2, 5] = - temp
+        A[..., 3, 0] = - np.sqrt(2) * G * np.real(alpha)
+        A[..., 3, 1] = - np.sqrt(2) * G * np.imag(alpha)
+        A[..., 3, 2] = - omegas[0] + 2 * temp
+        A[..., 3, 3] = - gamma_m
+        A[..., 3, 4] = - temp
         # second mechanical mode
-        self.A[4][3] = - temp
-        self.A[4][5] = omegas[1] + 2 * temp
-        self.A[5][0] = - np.sqrt(2) * G * np.real(alpha)
-        self.A[5][1] = - np.sqrt(2) * G * np.imag(alpha)
-        self.A[5][2] = - temp
-        self.A[5][4] = - omegas[1] + 2 * temp
-        self.A[5][5] = - gamma_m
+        A[..., 4, 3] = - temp
+        A[..., 4, 5] = omegas[1] + 2 * temp
+        A[..., 5, 0] = - np.sqrt(2) * G * np.real(alpha)
+        A[..., 5, 1] = - np.sqrt(2) * G * np.imag(alpha)
+        A[..., 5, 2] = - temp
+        A[..., 5, 4] = - omegas[1] + 2 * temp
+        A[..., 5, 5] = - gamma_m
 
-        return self.A
+        return A
 
     def get_absorption(self, c):
         """Method to obtain the absorption.
@@ -166,27 +520,51 @@ class BEC_10(BaseSystem):
 
         Returns
         -------
-        absorp : float
+        absorp : float or numpy.ndarray
             Absorption.
         """
 
-        # get transmission coefficient
-        # anti-Stokes field
-        if self.params['t_line'] == 'as':
-            _, _t = self.get_transmission_coeffs(
-                c=c
-            )
-        # Stokes field
-        else:
-            _t, _ = self.get_transmission_coeffs(
-                c=c
-            )
+        # get transmission coefficient of the selected line
+        _t = self.get_transmission_kernel()(
+            c=c
+        )
 
         # extract absorption
         absorp = np.real(1 - _t)
 
         return absorp
 
+    def get_c_batch(self, axes, meshgrid=True):
+        """Method to obtain the derived constants and controls for a batch of system parameters.
+
+        Parameters
+        ----------
+        axes : dict
+            Values of the swept system parameters, formatted as ``{name: values}``. The remaining parameters are taken from ``params``.
+        meshgrid : bool, optional
+            Option to obtain the constants over the outer grid of all the values. If ``False``, the values are broadcasted element-wise. Default is ``True``.
+
+        Returns
+        -------
+        c : numpy.ndarray
+            Derived constants and controls with shape ``(12, *dims)``, where each row is a contiguous array over the grid.
+        """
+
+        # extract the swept values
+        values = [np.asarray(axes[key], dtype=np.float_) for key in axes]
+        values = np.meshgrid(*values, indexing='ij') if meshgrid else np.broadcast_arrays(*values)
+
+        # update parameters
+        params = dict(self.params)
+        params.update(zip(axes.keys(), values))
+
+        # get constants
+        c = self._get_c(
+            params=params
+        )
+
+        return np.array(np.broadcast_arrays(*c), dtype=np.float_)
+
     def get_coeffs_A(self, modes, c, t=None):
         """Method to obtain the coefficients of the characteristic equation of the drift matrix.
 
@@ -201,54 +579,19 @@ class BEC_10(BaseSystem):
 
         Returns
         -------
-        coeffs : list
-            Coefficients of the characteristic equation of the drift matrix.
+        coeffs : list or numpy.ndarray
+            Coefficients of the characteristic equation of the drift matrix. For batched modes or constants, an array with shape ``(*dims, 7)`` is returned.
         """
 
-        # extract frequently used variables
-        Delta_tilde = c[0]
-        G = c[4]
-        gamma_m = c[6]
-        gamma_o = c[7]
-        t_oss_method = self.params['t_oss_method']
-        alpha = modes[0]
-
-        # get effective values
-        A_mathcal, Omegas, omega_tildes, C = self.get_effective_values(
-            c=c
+        return kernels.get_coeffs_A(
+            modes=modes,
+            c=c,
+            values=self.get_effective_values(
+                c=c
+            ),
+            t_oss_method=self.params['t_oss_method']
         )
-        # calculate mean optical occupancy
-        N_o = np.real(np.conjugate(alpha) * alpha)
-        # calculate effiective detuning
-        Delta = Delta_tilde + (C * N_o if 'cubic' in t_oss_method else 0)
-
-        # frequently used expressions
-        A_2 = A_mathcal**2 + Omegas[0]**2 * Omegas[1]**2
-        D_2 = Delta**2 + gamma_o**2 / 4
-        D_N = 2 * Delta * G**2 * N_o * (omega_tildes[0] + omega_tildes[1])
-        O_2 = Omegas[0]**2 + Omegas[1]**2
-
-        # coefficients
-        coeffs = list()
-        # a_0
-        coeffs.append(1)
-        # a_1
-        coeffs.append(2 * gamma_m + gamma_o)
-        # a_2
-        coeffs.append(D_2 + O_2 + gamma_m**2 + 2 * gamma_m * gamma_o)
-        # a_3
-        coeffs.append(2 * D_2 * gamma_m + O_2 * (gamma_m + gamma_o) + gamma_m**2 * gamma_o)
-        # a_4
-        coeffs.append(A_2 + D_2 * (O_2 + gamma_m**2) + D_N + O_2 * gamma_m * gamma_o)
-        # a_5
-        coeffs.append(A_2 * gamma_o + D_2 * O_2 * gamma_m + D_N * gamma_m)
-        # a_6
-        coeffs.append(A_2 * D_2 + np.sqrt(A_2) * D_N)
-        # # alternate expression
-        # coeffs.append(A_2 * D_2 + 2 * A_mathcal * Delta * G**2 * N_o * (omega_tildes[0] - omega_tildes[1]) + 2 * Delta * G**2 * N_o * (Omegas[0]**2 * omega_tildes[1] + Omegas[1]**2 * omega_tildes[0]))
 
-        return coeffs
-    
     def get_coeffs_N_o(self, c):
         """Method to obtain coefficients of the polynomial in mean optical occupancy.
         
@@ -316,6 +659,52 @@ class BEC_10(BaseSystem):
 
         return C_mathcal
 
+    def get_corrs_steady_state(self, c, n_ths=None):
+        r"""Method to obtain the steady-state quadrature correlations from the Lyapunov equation.
+
+        The drift and noise matrices are obtained at the lowest branch of the steady state for all the values of the derived constants and controls, and the equations :math:`A V + V A^{T} + D = 0` are solved together.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        n_ths : list, optional
+            Thermal occupancies of the baths of the first and the second sidemodes (refer to ``get_D_batch``). Default is the vacuum.
+
+        Returns
+        -------
+        corrs : numpy.ndarray
+            Quadrature correlations with shape ``(6, 6)``. For batched constants, the shape is ``(*dims, 6, 6)``. The correlations of unstable points are ``numpy.nan``.
+        """
+
+        # get drift and noise matrices
+        with np.errstate(invalid='ignore'):
+            As = self.get_A_batch(
+                modes=self._get_modes_lowest(
+                    c=c
+                ),
+                c=c
+            )
+        Ds = self.get_D_batch(
+            c=c,
+            n_ths=n_ths
+        )
+
+        # stable points
+        rates, _ = self.get_drift_spectrum_batch(
+            c=c
+        )
+        _stable = rates < 0
+
+        # solve Lyapunov equations
+        corrs = np.full(As.shape, np.nan, dtype=np.float_)
+        corrs[_stable] = get_lyapunov_solutions(
+            As=As[_stable],
+            Ds=Ds[_stable]
+        )
+
+        return corrs
+
     def get_D(self, modes, corrs, c, t):
         """Method to obtain the noise matrix.
         
@@ -350,8 +739,46 @@ class BEC_10(BaseSystem):
 
         return self.D
     
-    def get_deltas(self, c):
-        """Method to obtain the complex solution of the denominator of the output amplitudes.
+    def get_D_batch(self, c, n_ths=None):
+        r"""Method to obtain the noise matrices for a batch of derived constants and controls.
+
+        The mechanical noise enters the momentum quadratures as :math:`\gamma_{m} (2 n_{th} + 1)`, where :math:`n_{th}` is the thermal occupancy of the bath of each sidemode.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        n_ths : list, optional
+            Thermal occupancies of the baths of the first and the second sidemodes, each broadcastable with the constants. Default is the vacuum with :math:`n_{th} = 0`.
+        
+        Returns
+        -------
+        D : numpy.ndarray
+            Noise matrices with shape ``(*dims, 6, 6)``.
+        """
+
+        # extract frequently used variables
+        eta_lp = c[3]
+        gamma_m = c[6]
+        gamma_o = c[7]
+        mu = c[8]
+        n_ths = n_ths if n_ths is not None else [0.0, 0.0]
+
+        # initialize noise matrices
+        D = np.zeros(np.broadcast(*c).shape + (6, 6), dtype=np.float_)
+
+        # update noise matrices
+        D[..., 0, 0] = eta_lp + mu * gamma_o / 2
+        D[..., 1, 1] = eta_lp + mu * gamma_o / 2
+        D[..., 3, 3] = gamma_m * (2 * n_ths[0] + 1)
+        D[..., 5, 5] = gamma_m * (2 * n_ths[1] + 1)
+
+        return D
+
+    def get_coeffs_deltas(self, c):
+        """Method to obtain the coefficients of the polynomial in probe detuning whose roots are the complex solutions of the denominator of the output amplitudes.
+
+        The coefficients are evaluated using numerical functions compiled once from the symbolic expression of the denominator.
         
         Parameters
         ----------
@@ -360,8 +787,8 @@ class BEC_10(BaseSystem):
         
         Returns
         -------
-        deltas : list
-            Complex roots of probe detuning.
+        coeffs : numpy.ndarray
+            Coefficients in descending powers of the probe detuning with shape ``(*dims, 7)``.
         """
 
         # extract frequently used variables
@@ -370,53 +797,103 @@ class BEC_10(BaseSystem):
         gamma_m = c[6]
         gamma_o = c[7]
 
-        # get effective values
-        A_mathcal, Omegas, omega_tildes, C = self.get_effective_values(
+        # get steady-state values
+        N_os, _, _, (A_mathcal, Omegas, omega_tildes, C) = self.get_values_steady_state(
             c=c
         )
-        # calculate mean optical occupancy
-        N_o, _ = self.get_mean_optical_occupancies()
-        N_o = N_o[0]
+        N_o = N_os[0]
         # calculate effiective detuning
         Delta = Delta_tilde + C * N_o
 
-        # probe detuning
-        delta = Symbol('delta', complex=True)
-        # effective values
-        Gamma_m = gamma_o / 2 - 1j * (Delta + delta)
-        Gamma_p = gamma_o / 2 + 1j * (Delta - delta)
-        chis =  [1 / (Omegas[i]**2 - 1j * delta * gamma_m - delta**2) for i in range(2)]
-        # Lambda
-        _num = A_mathcal * chis[0] * chis[1] * (omega_tildes[0] - omega_tildes[1])
-        _num += sum([chis[i] * omega_tildes[i] for i in range(2)])
-        _den = A_mathcal**2 * chis[0] * chis[1] + 1
-        Lambda = _num / _den
+        # compile functions once
+        if BEC_10._funcs_coeffs_deltas is None:
+            BEC_10._funcs_coeffs_deltas = self._get_funcs_coeffs_deltas()
 
-        # equation for delta
-        eqtn_delta = Gamma_m * Gamma_p + 2 * Delta * G**2 * Lambda * N_o
-        eqtn_delta *= _den / chis[0] / chis[1]
-        eqtn_delta = eqtn_delta.factor().expand()
+        # evaluate coefficients
+        coeffs = BEC_10._funcs_coeffs_deltas(Delta, G, gamma_m, gamma_o, A_mathcal, Omegas[0], Omegas[1], omega_tildes[0], omega_tildes[1], N_o)
+
+        return np.stack(np.broadcast_arrays(*[np.asarray(coeff, dtype=np.complex_) for coeff in coeffs]), axis=-1)
+
+    def get_deltas(self, c):
+        """Method to obtain the complex solution of the denominator of the output amplitudes.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        deltas : list or numpy.ndarray
+            Complex roots of probe detuning. For batched constants, an array with shape ``(*dims, 6)`` is returned.
+        """
+
+        # get coefficients
+        coeffs = self.get_coeffs_deltas(
+            c=c
+        )
 
         # solve for delta
-        coeff_1 = eqtn_delta.coeff(delta)
-        coeff_2 = eqtn_delta.coeff(delta**2)
-        coeff_3 = eqtn_delta.coeff(delta**3)
-        coeff_4 = eqtn_delta.coeff(delta**4)
-        coeff_5 = eqtn_delta.coeff(delta**5)
-        coeff_6 = eqtn_delta.coeff(delta**6)
-        coeff_0 = eqtn_delta - coeff_6 * delta**6 - coeff_5 * delta**5 - coeff_4 * delta**4 - coeff_3 * delta**3 - coeff_2 * delta**2 - coeff_1 * delta
-        coeff_0 = coeff_0.expand()
-        # list of coefficients
-        coeffs = [coeff_6, coeff_5, coeff_4, coeff_3, coeff_2, coeff_1, coeff_0]
+        deltas = get_roots_batch(
+            coeffs=coeffs
+        )
+
+        return deltas.tolist() if deltas.ndim == 1 else deltas
+
+    def get_deltas_adaptive(self, c, delta_min, delta_max, measure='transmission', tol=1e-3, dim_init=101, dim_max=10001):
+        """Method to obtain an adaptive grid of probe detunings concentrated around the transparency windows.
+
+        The grid is seeded at the real parts of the complex roots obtained from ``get_deltas`` with their imaginary parts as the widths, and refined until the interpolation error of the measure is below the tolerance.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        delta_min : float
+            Minimum value of the probe detuning in the units of ``c[1]``.
+        delta_max : float
+            Maximum value of the probe detuning in the units of ``c[1]``.
+        measure : str, optional
+            Name of the measure to sample. Options are ``'absorption'``, ``'dispersion'``, ``'group_delay'``, ``'transmission'`` (default) and ``'transmission_phase'``.
+        tol : float, optional
+            Tolerance of the interpolation error relative to the range of the measure. Default is ``1e-3``.
+        dim_init : int, optional
+            Number of uniformly spaced initial points. Default is ``101``.
+        dim_max : int, optional
+            Maximum number of points. Default is ``10001``.
 
-        # convert to numpy constants
-        for i in range(len(coeffs)):
-            coeffs[i] = np.complex(np.real(coeffs[i]), np.imag(coeffs[i]))
+        Returns
+        -------
+        deltas : numpy.ndarray
+            Sorted values of the probe detuning.
+        values : numpy.ndarray
+            Values of the measure.
+        """
 
-        # convert to list
-        deltas = np.roots(coeffs).tolist()
+        # get poles of the output amplitudes
+        poles = np.asarray(self.get_deltas(
+            c=c
+        ))
+
+        # function to evaluate the measure
+        _func_measure = getattr(self, 'get_' + measure)
+        def func(deltas):
+            _c = list(c)
+            _c[1] = deltas
+            return _func_measure(
+                c=_c
+            )
 
-        return deltas
+        return get_samples_adaptive(
+            func=func,
+            x_min=delta_min,
+            x_max=delta_max,
+            seeds=np.real(poles),
+            widths=np.imag(poles),
+            tol=tol,
+            dim_init=dim_init,
+            dim_max=dim_max
+        )
 
     def get_dispersion(self, c):
         """Method to obtain the dispersion.
@@ -428,27 +905,56 @@ class BEC_10(BaseSystem):
 
         Returns
         -------
-        disper : float
+        disper : float or numpy.ndarray
             Dispersion.
         """
 
-        # get transmission coefficient
-        # anti-Stokes field
-        if self.params['t_line'] == 'as':
-            _, _t = self.get_transmission_coeffs(
-                c=c
-            )
-        # Stokes field
-        else:
-            _t, _ = self.get_transmission_coeffs(
-                c=c
-            )
+        # get transmission coefficient of the selected line
+        _t = self.get_transmission_kernel()(
+            c=c
+        )
 
         # extract dispersion
         disper = np.imag(1 - _t)
 
         return disper
 
+    def get_drift_spectrum_batch(self, c):
+        """Method to obtain the maximum growth rates and the mode frequencies from the eigenvalues of the drift matrices at the lowest branch of the steady state.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        rates : numpy.ndarray
+            Maximum real parts of the eigenvalues with shape ``(*dims)``. Positive values denote unstable points.
+        frequencies : numpy.ndarray
+            Absolute imaginary parts of the eigenvalues for each conjugate pair in ascending order with shape ``(*dims, 3)``.
+        """
+
+        # get drift matrices
+        with np.errstate(invalid='ignore'):
+            As = self.get_A_batch(
+                modes=self._get_modes_lowest(
+                    c=c
+                ),
+                c=c
+            )
+
+        # eigenvalues of all matrices
+        _finite = np.all(np.isfinite(As), axis=(-2, -1))
+        eigs = np.full(As.shape[:-1], np.nan, dtype=np.complex_)
+        eigs[_finite] = np.linalg.eigvals(As[_finite])
+
+        # extract maps
+        rates = np.max(np.real(eigs), axis=-1)
+        frequencies = np.sort(np.abs(np.imag(eigs)), axis=-1)[..., 1::2]
+
+        return rates, frequencies
+
     def get_effective_values(self, c):
         """Method to obtain the effective values.
         
@@ -469,31 +975,15 @@ class BEC_10(BaseSystem):
             The coefficient of the mean optical occupancy.
         """
 
-        # extract frequently used variables
-        G = c[4]
-        g_tilde = c[5]
-        N = c[9]
-        omegas = [c[10], c[11]]
-        temp = 2 * g_tilde * N
-        
-        # first element
-        A_mathcal = temp * (omegas[0] - omegas[1])
-        # second element
-        Omega_c = np.sqrt((omegas[0] + 2 * temp)**2 - temp**2)
-        Omega_d = np.sqrt((omegas[1] + 2 * temp)**2 - temp**2)
-        Omegas = [Omega_c, Omega_d]
-        # third element
-        omega_c_tilde = omegas[0] + temp
-        omega_d_tilde = omegas[1] + temp
-        omega_tildes = [omega_c_tilde, omega_d_tilde]
-        # fourth element
-        A_2 = A_mathcal**2 + Omega_c**2 * Omega_d**2
-        C = G**2 * (omega_c_tilde + omega_d_tilde) / np.sqrt(A_2)
-        # # alternate expression
-        # C = G**2 * (A_mathcal * (omega_c_tilde - omega_d_tilde) + Omega_c**2 * omega_d_tilde + Omega_d**2 * omega_c_tilde) / A2
+        return self._get_memoized(
+            name='effective_values',
+            c=c,
+            idxs=[4, 5, 9, 10, 11],
+            func=lambda: kernels.get_effective_values(
+                c=c
+            )
+        )
 
-        return A_mathcal, Omegas, omega_tildes, C
-    
     def get_fwhm_norm_resonance(self, c):
         """Method to obtain the normalized FWHM at resonance using the analytical expression.
         
@@ -524,6 +1014,32 @@ class BEC_10(BaseSystem):
 
         return fwhm
 
+    def get_group_delay(self, c):
+        r"""Method to obtain the group delay of the transmitted probe field using the analytical derivative of the transmission phase.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        tau : float or numpy.ndarray
+            Group delay :math:`\tau = d \phi / d \delta`.
+        """
+
+        # get transmission coefficient of the selected line and its derivative
+        _t, _dt = self.get_transmission_kernel(
+            grad=True
+        )(
+            c=c
+        )
+
+        # calculate group delay
+        tau = np.imag(_dt / _t)
+
+        return tau
+
     def get_ivc(self):
         r"""Method to obtain the initial values of the modes, correlations and derived constants and controls.
         
@@ -538,120 +1054,30 @@ class BEC_10(BaseSystem):
 
         c : list
             Constants of the IVP.
-            First :math:`4 \times 3^{2}` elements contain the noise matrix.
-            Rest of the elements contain the system parameters ``params`` in the following order:
-            ========    =============================================
-            index       parameter
-            ========    =============================================
-            0           cavity detuning :math:`\tilde{\Delta}`.
-            1           probe detuning :math:`\delta`.
-            2           control laser amplitude :math:`\eta_{lc}`.
-            3           probe laser amplitude :math:`\eta_{lp}`.
-            4           sidemode coupling constant :math:`G`.
-            5           atom-atom interaction strength :math:`\tilde{g}`.
-            6           mechanical decay rate :math:`\gamma_{m}`.
-            7           optical decay rate :math:`\gamma_{o}`.
-            8           cavity coupling parameter :math:`\mu`.
-            9           number of BEC atoms :math:`N`.
-            10          first sidemode frequency :math:`\omega_{c}`.
-            11          second sidemode frequency :math:`\omega_{d}`.
-            ========    =============================================
-        """
-
-        # extract frequently used variables
-        Delta_tilde = self.params['Delta_tilde']
-        delta = self.params['delta']
-        G = self.params['G']
-        g_tilde_norm = self.params['g_tilde_norm']
-        gamma_m = self.params['gamma_m']
-        gamma_o = self.params['gamma_o']
-        k = self.params['k']
-        L_p = self.params['L_p']
-        l = self.params['l']
-        lambda_lc = self.params['lambda_lc']
-        m = self.params['m']
-        mu = self.params['mu']
-        N = self.params['N']
-        P_lc = self.params['P_lc']
-        P_lp_norm = self.params['P_lp_norm']
-        R = self.params['R']
-        t_Delta_norm = self.params['t_Delta_norm']
-        t_Delta_offset = self.params['t_Delta_offset']
-        t_delta_norm = self.params['t_delta_norm']
-        t_delta_offset = self.params['t_delta_offset']
-        t_P_lc_norm = self.params['t_P_lc_norm']
-
-        # moment of inertia
-        I = m * sc.physical_constants['atomic mass constant'][0] * R**2
-
-        # atomic interaction strengths
-        g_tilde = g_tilde_norm * sc.hbar / 4 / I / N
-
-        # frequently used variable
-        temp = 2 * g_tilde * N
-
-        # first sidemode
-        omega_c = sc.hbar * (L_p + 2 * l)**2 / 2 / I
-        omega_c_tilde = omega_c + temp
-        Omega_c = np.sqrt((omega_c + 2 * temp)**2 - temp**2)
-        # second sidemode
-        omega_d = sc.hbar * (L_p - 2 * l)**2 / 2 / I
-        omega_d_tilde = omega_d + temp
-        Omega_d = np.sqrt((omega_d + 2 * temp)**2 - temp**2)
-        
-        # frequently used variables
-        A_mathcal = temp * (omega_c - omega_d)
-        A_2 = A_mathcal**2 + Omega_c**2 * Omega_d**2
-        C = G**2 * (omega_c_tilde + omega_d_tilde) / np.sqrt(A_2)
-
-        # critical detuning
-        Delta_tilde_cr = - np.sqrt(3) * gamma_o / 2
-        # frequency of the control laser
-        omega_lc = 2 * np.pi * sc.c / lambda_lc
-        # critical power of the control laser
-        P_cr = gamma_o**2 * sc.hbar * omega_lc / 3 / np.sqrt(3) / C / mu
-
-        # mean and difference of frequencies
-        Omega_m = (Omega_c + Omega_d) / 2
-        Omega_n = (Omega_c - Omega_d) * k
-
-        # selector for detuning and offset
-        _selector = {
-            'cr': Delta_tilde_cr,
-            'gamma_m': gamma_m,
-            'gamma_o': gamma_o,
-            'Omega_c': Omega_c,
-            '-Omega_c': -Omega_c,
-            'Omega_d': Omega_d,
-            '-Omega_d': -Omega_d,
-            'Omega_m': Omega_m,
-            '-Omega_m': -Omega_m,
-            'Omega_n': Omega_n,
-            '-Omega_n': -Omega_n
-        }
-        # laser detuning
-        Delta_tilde = Delta_tilde * np.abs(_selector.get(t_Delta_norm, 1.0)) + _selector.get(t_Delta_offset, 0.0)
-        # probe detuning
-        delta = delta * np.abs(_selector.get(t_delta_norm, 1.0)) + _selector.get(t_delta_offset, Delta_tilde if t_delta_offset == 'Delta' else 0.0)
-        
-        # selector for control power
-        _selector_P_lc = {
-            'cr': P_cr
-        }
-        # power of the control laser
-        P_lc = P_lc * _selector_P_lc.get(t_P_lc_norm, 1.0)
-        # amplitude of the control laser
-        eta_lc = np.sqrt(mu * gamma_o * P_lc / sc.hbar / omega_lc)
-
-        # power of the probe laser
-        P_lp = P_lp_norm * P_lc
-        # frequency of the probe laser
-        omega_lp = delta + omega_lc
-        # amplitude of the probe laser
-        eta_lp = np.sqrt(mu * gamma_o * P_lp / sc.hbar / omega_lp)
+            First :math:`4 \times 3^{2}` elements contain the noise matrix.
+            Rest of the elements contain the system parameters ``params`` in the following order:
+            ========    =============================================
+            index       parameter
+            ========    =============================================
+            0           cavity detuning :math:`\tilde{\Delta}`.
+            1           probe detuning :math:`\delta`.
+            2           control laser amplitude :math:`\eta_{lc}`.
+            3           probe laser amplitude :math:`\eta_{lp}`.
+            4           sidemode coupling constant :math:`G`.
+            5           atom-atom interaction strength :math:`\tilde{g}`.
+            6           mechanical decay rate :math:`\gamma_{m}`.
+            7           optical decay rate :math:`\gamma_{o}`.
+            8           cavity coupling parameter :math:`\mu`.
+            9           number of BEC atoms :math:`N`.
+            10          first sidemode frequency :math:`\omega_{c}`.
+            11          second sidemode frequency :math:`\omega_{d}`.
+            ========    =============================================
+        """
 
         # scattering line
         self.params['t_line'] = 'as' if self.params['t_line'] == 'as' or self.params['t_line'] == 'aS' else 's'
+        # precision of the transmission kernels
+        self.params['t_precision'] = 'single' if self.params['t_precision'] == 'single' else 'double'
  
         # initial mode values as 1D list
         iv_modes = np.zeros(3, dtype=np.complex_)
@@ -663,19 +1089,9 @@ class BEC_10(BaseSystem):
         iv_corrs[5][5] = 0.5
         
         # constant parameters
-        c = [Delta_tilde, delta] + \
-            [eta_lc, eta_lp] + \
-            [G, g_tilde] + \
-            [gamma_m, gamma_o] + \
-            [mu, N] + \
-            [omega_c, omega_d]
-
-        # # display parameter values
-        # logger.debug('G={}, g_tilde_norm={}, gamma_m={}, gamma_o={}, L_p={}, l={}, lamnda_lc={}, m={}, mu={}, N={}\n'.format(G, g_tilde_norm, gamma_m, gamma_o, L_p, l, lambda_lc, m, mu, N))
-        # # display critical values values
-        # logger.debug('omega_lc={}, Delta_tilde_cr={}, P_cr={}, Omegas={}, Delta_tilde={}, C={}\n'.format(omega_lc, Delta_tilde_cr, P_cr, [Omega_c, Omega_d], Delta_tilde, C))
-        # # display condition for weak perturbations
-        # logger.debug('hbar L_p^2 / 2 I + 2 g_tilde N={}, g_a^2 / Delta_a={}, 4 g_tilde N={}\n'.format(sc.hbar * L_p**2 / 2 / I + 2 * g_tilde * N, 2 * np.sqrt(2) * params[4] / np.sqrt(params[9]), 4 * g_tilde * N))
+        c = self._get_c(
+            params=self.params
+        )
 
         return iv_modes, iv_corrs, c
 
@@ -703,6 +1119,74 @@ class BEC_10(BaseSystem):
 
         return lieftimes
 
+    def get_log_negativities(self, c):
+        r"""Method to obtain the steady-state logarithmic negativities between the optical mode and the mechanical sidemodes.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        E_Ns : numpy.ndarray
+            Logarithmic negativities :math:`E_{N} = \max [0, - \ln (2 \nu_{-})]` of the optical mode with the first and the second sidemodes, with shape ``(2, *dims)``.
+        """
+
+        # get quadrature correlations
+        corrs = self.get_corrs_steady_state(
+            c=c
+        )
+
+        # initialize list
+        E_Ns = list()
+        # for each mechanical sidemode
+        for j in [2, 4]:
+            _idxs = [0, 1, j, j + 1]
+            with np.errstate(invalid='ignore'):
+                # blocks of the bipartite correlation matrix
+                _det_a = np.linalg.det(corrs[..., 0:2, 0:2])
+                _det_b = np.linalg.det(corrs[..., j:j + 2, j:j + 2])
+                _det_c = np.linalg.det(corrs[..., 0:2, j:j + 2])
+                _det_V = np.linalg.det(corrs[..., _idxs, :][..., :, _idxs])
+                # smallest symplectic eigenvalue of the partial transpose
+                _sigma = _det_a + _det_b - 2 * _det_c
+                nu = np.sqrt((_sigma - np.sqrt(_sigma**2 - 4 * _det_V)) / 2)
+            E_Ns.append(np.maximum(0, - np.log(2 * nu)))
+
+        return np.array(E_Ns, dtype=np.float_)
+
+    def get_mean_optical_occupancies_batch(self, c):
+        """Method to obtain the mean optical occupancies for a batch of derived constants and controls.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls with broadcastable elements.
+
+        Returns
+        -------
+        N_os : numpy.ndarray
+            Mean optical occupancies in ascending order with shape ``(3, *dims)``, padded with ``numpy.nan`` where the branches do not exist.
+        num_branches : numpy.ndarray
+            Number of real branches at each point.
+        """
+
+        # frequently used variables
+        A_l_norm, Delta_0_norm, kappa_norm, C = self.get_params_steady_state(
+            c=c
+        )
+
+        # solve the cubic equation for all points
+        N_os, num_branches = get_N_os_cubic(
+            C=C,
+            Delta_0=Delta_0_norm,
+            kappa=kappa_norm,
+            A_l_sq=np.real(np.conjugate(A_l_norm) * A_l_norm)
+        )
+
+        return N_os, num_branches
+
     def get_mode_rates(self, modes, c, t=None):
         """Method to obtain the rates of change of the modes.
 
@@ -739,7 +1223,7 @@ class BEC_10(BaseSystem):
         temp = 2 * g_tilde * N
 
         # derived frequencies
-        Delta = Delta_tilde - np.sqrt(2) * G * np.real(np.sum(betas))
+        Delta = Delta_tilde - np.sqrt(2) * G * np.real(betas[0] + betas[1])
 
         # optical mode
         dalpha_dt = (- gamma_o / 2 + 1j * Delta) * alpha + eta_lc
@@ -774,44 +1258,20 @@ class BEC_10(BaseSystem):
         Returns 
         -------
         Modes : numpy.ndarray
-            Steady state modes.
+            Steady state modes with shape ``(num_branches, 3)``. For batched constants, the shape is ``(3, 3, *dims)`` with ``numpy.nan`` for the missing branches.
         """
 
-        # extract frequently used variables
-        Delta_tilde = c[0]
-        eta_lc = c[2]
-        G = c[4]
-        gamma_o = c[7]
-        t_oss_method = self.params['t_oss_method']
-
-        # get effective values
-        A_mathcal, Omegas, omega_tildes, C = self.get_effective_values(
+        # get mean optical occupancies
+        N_os, _, _, values = self.get_values_steady_state(
             c=c
         )
 
-        # frequently used expressions
-        A2 = A_mathcal**2 + Omegas[0]**2 * Omegas[1]**2
-        A2_sqrt = np.sqrt(A2)
-
-        # initialize lists
-        Modes = list()
-
-        # get mean optical occupancies
-        N_os = self.get_mean_optical_occupancies()
-        # for each mean optical occupancy
-        for N_o in N_os:
-            # calculate mode amplitudes
-            alpha = eta_lc / (gamma_o / 2 - 1j * (Delta_tilde + (C * N_o if 'cubic' in t_oss_method else 0)))
-            q_c = - G * omega_tildes[1] * N_o / A2_sqrt
-            q_d = - G * omega_tildes[0] * N_o / A2_sqrt
-            # # alternate expressions
-            # q_c = - G * (Omegas[1]**2 * omega_tildes[0] - A_mathcal * omega_tildes[1]) * N_o / A2
-            # q_d = - G * (Omegas[0]**2 * omega_tildes[1] + A_mathcal * omega_tildes[0]) * N_o / A2
-
-            # append to list
-            Modes.append([alpha, q_c, q_d])
-
-        return np.array(Modes, dtype=np.complex_)
+        return kernels.get_modes_steady_state(
+            c=c,
+            N_os=N_os,
+            values=values,
+            t_oss_method=self.params['t_oss_method']
+        )
 
     def get_N_o_norms(self, params):
         """Method to obtain the mean optical occupancy per oscillation.
@@ -886,6 +1346,40 @@ class BEC_10(BaseSystem):
 
         return peaks
 
+    def get_sidemode_occupancies(self, c, n_ths=None):
+        r"""Method to obtain the steady-state occupancies of the mechanical sidemodes.
+
+        The occupancies are defined as :math:`n_{m} = (\langle \delta q^{2} \rangle + \langle \delta p^{2} \rangle - 1) / 2` relative to the vacuum variances of :math:`1 / 2`, so that a decoupled sidemode relaxes to the occupancy :math:`n_{th}` of its bath. The mechanical noise acts only on the momentum quadratures (refer to ``get_D_batch``), which does not preserve the positivity of the state in the presence of the couplings. Values below zero are therefore not physical occupancies; they are returned unchanged and a warning is logged.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        n_ths : list, optional
+            Thermal occupancies of the baths of the first and the second sidemodes. Default is the vacuum.
+
+        Returns
+        -------
+        n_ms : numpy.ndarray
+            Occupancies of the first and the second sidemodes with shape ``(2, *dims)``. The occupancies of unstable points are ``numpy.nan``.
+        """
+
+        # get quadrature correlations
+        corrs = self.get_corrs_steady_state(
+            c=c,
+            n_ths=n_ths
+        )
+
+        # occupancies relative to the vacuum variances of 1 / 2
+        n_ms = np.array([(corrs[..., j, j] + corrs[..., j + 1, j + 1] - 1) / 2 for j in [2, 4]], dtype=np.float_)
+
+        # flag negative occupancies
+        _negative = n_ms < 0.0
+        if np.any(_negative):
+            logger.warning('Negative sidemode occupancies at {} of {} values with minimum {:0.2e}'.format(np.count_nonzero(_negative), n_ms.size, np.min(n_ms[_negative])))
+
+        return n_ms
+
     def get_Ss(self, c):
         """Method to obtain the shot noise, radiaton pressure noise and thermal noise.
         
@@ -899,37 +1393,120 @@ class BEC_10(BaseSystem):
         S : list
             Shot noise, radiaton pressure noise and thermal noise.
         """
-        # frequently used variables
+
+        return list(self.get_Ss_batch(
+            c=c
+        ))
+
+    def get_Ss_batch(self, c, T=None):
+        """Method to obtain the shot noise, radiaton pressure noise and thermal noise for a batch of derived constants and controls.
+
+        The steady state is shared by all the values of the probe detuning.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        T : float or numpy.ndarray, optional
+            Temperature of the sidemodes in Kelvin, broadcastable with the constants. Default is the value of the system parameter ``'T'``.
+
+        Returns
+        -------
+        Ss : numpy.ndarray
+            Shot noise, radiaton pressure noise and thermal noise with shape ``(3, *dims)``.
+        """
+
+        # extract frequently used variables
         delta = c[1]
-        G = c[4]
-        gamma_m = c[6]
+        T = T if T is not None else self.params['T']
+
+        # get noise coefficients
+        a_sn, b_rp, c_th, alpha_s_sq = self._get_coeffs_Ss(
+            c=c
+        )
+
+        # shot noise
+        S_sn = a_sn / alpha_s_sq
+        # radiation pressure noise
+        S_rp = b_rp * alpha_s_sq
+        # thermal noise
+        S_th = c_th / np.tanh(sc.hbar * delta / 2 / sc.k / T)
+
+        return np.array(np.broadcast_arrays(S_sn, S_rp, S_th), dtype=np.float_)
+
+    def get_sql_crossover(self, c):
+        r"""Method to obtain the crossover of the shot noise and the radiation pressure noise at the standard quantum limit.
+
+        The shot noise scales as :math:`a / N_{o}` and the radiation pressure noise as :math:`b N_{o}`, so that their sum is minimized to the standard quantum limit :math:`2 \sqrt{a b}` at :math:`N_{o} = \sqrt{a / b}`. The corresponding power of the control laser is obtained by inverting the steady-state equation.
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        N_os : numpy.ndarray
+            Mean optical occupancies at the crossover with shape ``(*dims)``.
+        P_lcs : numpy.ndarray
+            Powers of the control laser at the crossover in Watts.
+        S_sqls : numpy.ndarray
+            Noise at the standard quantum limit.
+        """
+
+        # extract frequently used variables
+        Delta_tilde = c[0]
         gamma_o = c[7]
+        mu = c[8]
         t_oss_method = self.params['t_oss_method']
-        T = 20e-9
 
-        # get effective values
-        _, Omegas, _, C = self.get_effective_values(
+        # get noise coefficients
+        a_sn, b_rp, _, _ = self._get_coeffs_Ss(
             c=c
         )
 
-        # get mean occupancy amplitude
-        alpha_ss = self.get_modes_steady_state(
+        # crossover
+        N_os = np.sqrt(a_sn / b_rp)
+        S_sqls = 2 * np.sqrt(a_sn * b_rp)
+
+        # invert the steady-state equation for the amplitude of the control laser
+        _, _, _, C = self.get_effective_values(
             c=c
-        )[:, 0]
-        alpha_s_sq = np.real(np.conjugate(alpha_ss[0]) * alpha_ss[0])
+        )
+        Delta = Delta_tilde + (C * N_os if 'cubic' in t_oss_method else 0)
+        eta_lc_sq = (Delta**2 + gamma_o**2 / 4) * N_os
+        # power of the control laser
+        omega_lc = 2 * np.pi * sc.c / self.params['lambda_lc']
+        P_lcs = eta_lc_sq * sc.hbar * omega_lc / mu / gamma_o
 
-        # shot noise
-        S_sn = (delta**2 + gamma_o**2 / 4) / 4 / G**2 / gamma_o / alpha_s_sq
+        # broadcast to the shape of the constants
+        N_os, P_lcs, S_sqls, _ = np.broadcast_arrays(N_os, P_lcs, S_sqls, np.empty(np.broadcast(*c).shape))
 
-        # radiation pressure noise
-        _chis = [1 / (Omegas[i]**2 - 1j * delta * gamma_m - delta**2) for i in range(2)]
-        _F = C**2 / G**4 * np.real(np.conjugate(Omegas[0] * _chis[0]) * Omegas[0] * _chis[0]) * np.real(np.conjugate(Omegas[1] * _chis[1]) * Omegas[1] * _chis[1]) * ((delta**2 - Omegas[0] * Omegas[1])**2 + gamma_m**2 * delta**2)
-        S_rp = gamma_o * G**2 * _F * alpha_s_sq / (delta**2 + gamma_o**2 / 4)
+        return N_os, P_lcs, S_sqls
 
-        # thermal noise
-        S_th = gamma_m * delta * (Omegas[0] * np.real(np.conjugate(_chis[0]) * _chis[0]) + Omegas[1] * np.real(np.conjugate(_chis[1]) * _chis[1])) / np.tanh(sc.hbar * delta / 2 / sc.k / T)
-        
-        return [S_sn, S_rp, S_th]
+    def get_stability_batch(self, c):
+        """Method to obtain the Routh-Hurwitz stability of the steady states for a batch of derived constants and controls.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls with broadcastable elements.
+
+        Returns
+        -------
+        num_unstable : numpy.ndarray
+            Number of eigenvalues of the drift matrix with positive real parts for each branch of the steady state, with shape ``(3, *dims)``. A value of ``0`` denotes a stable branch and ``-1`` denotes a missing branch.
+        margins : numpy.ndarray
+            Smallest normalized Hurwitz minor for each branch of the steady state, with shape ``(3, *dims)``. The values are ``numpy.nan`` for the missing branches.
+        """
+
+        return kernels.get_stability(
+            c=c,
+            t_oss_method=self.params['t_oss_method'],
+            values=self.get_effective_values(
+                c=c
+            )
+        )
 
     def get_transmission(self, c):
         """Method to obtain the transmission.
@@ -941,21 +1518,14 @@ class BEC_10(BaseSystem):
 
         Returns
         -------
-        T : float
+        T : float or numpy.ndarray
             Transmission.
         """
 
-        # get transmission coefficient
-        # anti-Stokes field
-        if self.params['t_line'] == 'as':
-            _, _t = self.get_transmission_coeffs(
-                c=c
-            )
-        # Stokes field
-        else:
-            _t, _ = self.get_transmission_coeffs(
-                c=c
-            )
+        # get transmission coefficient of the selected line
+        _t = self.get_transmission_kernel()(
+            c=c
+        )
 
         # calculate transmission
         T = np.real(np.conjugate(_t) * (_t))
@@ -964,6 +1534,8 @@ class BEC_10(BaseSystem):
 
     def get_transmission_coeffs(self, c):
         """Method to obtain the transmission coefficient for the probe field of the system.
+
+        The probe detuning ``c[1]`` can either be a scalar or an array, in which case the coefficients for all the values are calculated in a single vectorized pass.
         
         Parameters
         ----------
@@ -972,80 +1544,163 @@ class BEC_10(BaseSystem):
         
         Returns
         -------
-        t_s : complex
+        t_s : complex or numpy.ndarray
             Transmission coefficient for Stokes field.
-        t_as : complex
+        t_as : complex or numpy.ndarray
             Transmission coefficient for anti-Stokes field.
         """
 
         # extract frequently used variables
-        Delta_tilde = c[0]
-        delta = c[1]
-        eta_lc = c[2]
-        G = c[4]
-        gamma_m = c[6]
-        gamma_o = c[7]
-        mu = c[8]
         t_approx = self.params['t_approx']
-        t_oss_method = self.params['t_oss_method']
 
-        # get effective values
-        A_mathcal, Omegas, omega_tildes, C = self.get_effective_values(
+        # get steady-state values
+        _, alpha_s, Delta, (A_mathcal, Omegas, omega_tildes, _) = self.get_values_steady_state(
             c=c
         )
 
-        # get mean occupancy amplitude
-        if 'cubic' in t_oss_method:
-            N_os = self.get_mean_optical_occupancies()
-            alpha_s = eta_lc / (gamma_o / 2.0 - 1.0j * (Delta_tilde + C * N_os[0]))
-        else:
-            alpha_s = eta_lc / (gamma_o / 2.0 - 1.0j * Delta_tilde)
+        # get transmission coefficients of both lines
+        t_s, t_as = [kernels.get_kernel_transmission(
+            approx_del='del' in t_approx,
+            approx_res='res' in t_approx,
+            line_as=line_as
+        )(c, alpha_s, Delta, A_mathcal, Omegas, omega_tildes) for line_as in [False, True]]
 
-        # # display steady-state values
-        # logger.debug('alpha_s={} alpha_s_basic={}\n'.format(alpha_s, eta_lc / (gamma_o / 2 - 1j * Delta_tilde)))
+        return t_s, t_as
 
-        # mean optical occupancy
-        N_o = np.real(np.conjugate(alpha_s) * alpha_s)
+    def get_transmission_coeffs_dynamics(self, c, t_settle, t_window, dt=None):
+        r"""Method to obtain the transmission coefficients for the probe field from the nonlinear dynamics of the modes.
+
+        The modes for all the values of the derived constants and controls are integrated together from the steady state of the control field using ``get_mode_rates``. After the settling time, the optical mode is demodulated at the probe detuning over a Hann window to obtain the sideband amplitudes :math:`A_{\mp}` of :math:`\alpha = \alpha_{s} + A_{-} e^{- i \delta t} + A_{+} e^{i \delta t}`, which give :math:`t_{s} = 1 - \mu \gamma_{o} A_{-} / \eta_{lp}` and :math:`t_{as} = - \mu \gamma_{o} A_{+} / \eta_{lp}`.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        t_settle : float
+            Time for the transients to decay.
+        t_window : float
+            Duration of the demodulation window. The window should span several periods of the smallest probe detuning.
+        dt : float, optional
+            Step size of the integration. Default is ``1 / 32`` of the shortest period among the detunings, the mechanical frequencies and the optical decay rate.
 
-        # effiective detuning
-        Delta = Delta_tilde + (C * N_o if 'cubic' in t_oss_method else 0)
+        Returns
+        -------
+        t_s : complex or numpy.ndarray
+            Transmission coefficient for Stokes field.
+        t_as : complex or numpy.ndarray
+            Transmission coefficient for anti-Stokes field.
+        """
 
-        # effective decays
-        Gamma_m = gamma_o / 2 - 1j * (Delta + delta)
-        Gamma_p = gamma_o / 2 + 1j * (Delta - delta)
+        # extract frequently used variables
+        delta = c[1]
+        eta_lp = c[3]
+        gamma_o = c[7]
+        mu = c[8]
+        dims = np.broadcast(*c).shape
+        dt = dt if dt is not None else 2 * np.pi / max(np.max(np.abs(c[i])) for i in [0, 1, 7, 10, 11]) / 32
+        num_settle = int(np.ceil(t_settle / dt))
+        num_window = int(np.ceil(t_window / dt))
 
-        # approximation for delta
-        if 'del' in t_approx:
-            delta_approx = - Delta_tilde
-            if delta_approx >= 0:
-                chis =  [1 / ((Omegas[i] - delta) * (Omegas[i] + delta_approx) - 1j * delta_approx * gamma_m) for i in range(2)]
-            else:
-                chis =  [1 / ((Omegas[i] - delta_approx) * (Omegas[i] + delta) - 1j * delta_approx * gamma_m) for i in range(2)]
-        else:
-            chis =  [1 / (Omegas[i]**2 - 1j * delta * gamma_m - delta**2) for i in range(2)]
+        # initial modes from the lowest branch of the steady state without the probe
+        modes_0 = self._get_modes_lowest(
+            c=c
+        )
 
-        # substitution term
-        _num = A_mathcal * chis[0] * chis[1] * (omega_tildes[0] - omega_tildes[1])
-        _num += sum([chis[i] * omega_tildes[i] for i in range(2)])
-        _den = A_mathcal**2 * chis[0] * chis[1] + 1
-        Lambda = _num / _den
+        # rates of the modes
+        def func(modes, t):
+            return self.get_mode_rates(
+                modes=modes,
+                c=c,
+                t=t
+            )
+
+        # settle transients
+        modes = get_modes_rk4(
+            func=func,
+            modes_0=modes_0,
+            t_0=0.0,
+            dt=dt,
+            num_steps=num_settle
+        )
 
-        # resolved sideband approximation
-        if 'res' in t_approx:
-            _num_s = mu * gamma_o
-            _num_as = 1
-            _den = Gamma_m - 1j * G**2 * Lambda * N_o
-        else:
-            _num_s = mu * gamma_o * (Gamma_p + 1j * G**2 * Lambda * N_o)
-            _num_as = mu * gamma_o * (- 1j * G**2 * Lambda * np.conjugate(alpha_s)**2)
-            _den = Gamma_m * Gamma_p + 2 * Delta * G**2 * Lambda * N_o
+        # demodulate the optical mode at the probe sidebands
+        _weights = np.sin(np.pi * (np.arange(num_window) + 1) / (num_window + 1))**2
+        _sums = np.zeros((2, ) + dims, dtype=np.complex_)
+        def func_step(i, t, modes):
+            _phase = np.exp(1j * delta * t)
+            _sums[0] += _weights[i] * modes[0] * _phase
+            _sums[1] += _weights[i] * modes[0] / _phase
+
+        get_modes_rk4(
+            func=func,
+            modes_0=modes,
+            t_0=num_settle * dt,
+            dt=dt,
+            num_steps=num_window,
+            func_step=func_step
+        )
+        A_m, A_p = _sums / np.sum(_weights)
 
         # transmission coefficients
-        t_s = 1 - _num_s / _den
-        t_as = - np.conjugate(_num_as / _den)
+        t_s = 1 - mu * gamma_o * A_m / eta_lp
+        t_as = - mu * gamma_o * A_p / eta_lp
 
         return t_s, t_as
 
+    def get_transmission_kernel(self, grad=False):
+        """Method to obtain the transmission kernel specialized for the approximations and the scattering line.
+
+        The options ``'t_approx'``, ``'t_line'`` and ``'t_precision'`` are resolved once and the kernels are shared by all instances with the same options. Sweeps can call the returned function directly for each set of derived constants and controls. In single precision, each call also evaluates the kernel in double precision on at most ``num_samples_precision`` points, stores the largest normwise relative error in ``error_precision`` and logs a warning if it exceeds ``tol_precision``.
+
+        Parameters
+        ----------
+        grad : bool, optional
+            Option to also return the derivative with respect to the probe detuning. Default is ``False``.
+
+        Returns
+        -------
+        func : callable
+            Function formatted as ``func(c)`` returning the transmission coefficient of the selected line and, if ``grad`` is ``True``, its derivative.
+        """
+
+        # extract frequently used variables
+        t_approx = self.params['t_approx']
+        single = self.params['t_precision'] == 'single'
+
+        # get kernels with the reference in double precision
+        _kernels = [kernels.get_kernel_transmission(
+            approx_del='del' in t_approx,
+            approx_res='res' in t_approx,
+            line_as=self.params['t_line'] == 'as' or self.params['t_line'] == 'aS',
+            grad=grad,
+            single=_single
+        ) for _single in ([False, True] if single else [False])]
+        kernel = _kernels[-1]
+        kernel_ref = _kernels[0]
+
+        def func(c):
+            # get steady-state values
+            _, alpha_s, Delta, (A_mathcal, Omegas, omega_tildes, _) = self.get_values_steady_state(
+                c=c
+            )
+            args = (c, alpha_s, Delta, A_mathcal, Omegas, omega_tildes)
+            values = kernel(*args)
+
+            # estimate the error of the single precision
+            if single:
+                self.error_precision = kernels.get_error_precision(
+                    kernel_ref=kernel_ref,
+                    values=values,
+                    args=args,
+                    num_samples=self.num_samples_precision
+                )
+                if self.error_precision > self.tol_precision:
+                    logger.warning('Error of the single precision transmission kernel is {:0.2e}'.format(self.error_precision))
+
+            return values
+
+        return func
+
     def get_transmission_phase(self, c):
         """Method to obtain the phase of transmission phase.
         
@@ -1056,21 +1711,14 @@ class BEC_10(BaseSystem):
 
         Returns
         -------
-        phi : float
+        phi : float or numpy.ndarray
             Transmission phase.
         """
 
-        # get transmission coefficient
-        # anti-Stokes field
-        if self.params['t_line'] == 'as':
-            _, _t = self.get_transmission_coeffs(
-                c=c
-            )
-        # Stokes field
-        else:
-            _t, _ = self.get_transmission_coeffs(
-                c=c
-            )
+        # get transmission coefficient of the selected line
+        _t = self.get_transmission_kernel()(
+            c=c
+        )
 
         # calculate transmission phase
         phi = np.angle(_t)
@@ -1099,4 +1747,58 @@ class BEC_10(BaseSystem):
         # calculate transmission
         T = (C_mathcal / (1 + C_mathcal))**2
 
-        return T
\ No newline at end of file
+        return T
+
+    def get_values_steady_state(self, c):
+        """Method to obtain the steady-state values independent of the probe detuning.
+
+        The values are cached over the derived constants and controls (except the probe detuning and amplitude) in a bounded cache shared by all instances, so that a sweep over the probe detuning solves for the steady state only once. Batched constants are instead memoized for the instance (refer to ``_get_memoized``).
+        
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        N_os : list or numpy.ndarray
+            Mean optical occupancies.
+        alpha_s : complex or numpy.ndarray
+            Steady-state optical amplitude.
+        Delta : float or numpy.ndarray
+            Effective detuning.
+        values : tuple
+            Effective values returned by ``get_effective_values``.
+        """
+
+        # extract frequently used variables
+        t_oss_method = self.params['t_oss_method']
+
+        # batched constants are memoized for the instance
+        _batched = any(np.ndim(c[i]) > 0 for i in [0, 2, 4, 5, 7, 9, 10, 11])
+        if _batched:
+            return self._get_memoized(
+                name='values_steady_state_' + t_oss_method,
+                c=c,
+                idxs=[0, 2, 4, 5, 7, 9, 10, 11],
+                func=lambda: self._get_values_steady_state(
+                    c=c,
+                    batched=True
+                )
+            )
+
+        # cached steady states for unbatched constants
+        key = (t_oss_method, ) + tuple(float(c[i]) for i in [0, 2, 4, 5, 7, 9, 10, 11])
+        if key in self._cache_steady_state:
+            self._cache_steady_state.move_to_end(key)
+            return self._cache_steady_state[key]
+
+        # update cache
+        self._cache_steady_state[key] = self._get_values_steady_state(
+            c=c,
+            batched=False
+        )
+        if len(self._cache_steady_state) > self.cache_size_steady_state:
+            self._cache_steady_state.popitem(last=False)
+
+        return self._cache_steady_state[key]
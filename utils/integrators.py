@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing fixed-step integrators for batches of modes."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+def get_modes_rk4(func, modes_0, t_0, dt, num_steps, func_step=None):
+    """Function to integrate a batch of modes using the classical fourth-order Runge-Kutta method with a fixed step.
+
+    All the elements of the batch are advanced together, so that each step evaluates the rates once for the complete batch.
+
+    Parameters
+    ----------
+    func : callable
+        Rates of the modes formatted as ``func(modes, t)``, returning an array with the same shape as the modes.
+    modes_0 : numpy.ndarray
+        Initial modes with shape ``(num_modes, *dims)``.
+    t_0 : float
+        Initial time.
+    dt : float
+        Step size.
+    num_steps : int
+        Number of steps.
+    func_step : callable, optional
+        Function called after each step formatted as ``func_step(i, t, modes)``, where ``i`` is the index of the step.
+
+    Returns
+    -------
+    modes : numpy.ndarray
+        Modes at the final time.
+    """
+
+    # initialize modes
+    modes = np.array(modes_0, dtype=np.complex_)
+
+    # for each step
+    for i in range(num_steps):
+        t = t_0 + i * dt
+        k_1 = func(modes, t)
+        k_2 = func(modes + dt / 2 * k_1, t + dt / 2)
+        k_3 = func(modes + dt / 2 * k_2, t + dt / 2)
+        k_4 = func(modes + dt * k_3, t + dt)
+        modes = modes + dt / 6 * (k_1 + 2 * k_2 + 2 * k_3 + k_4)
+
+        # update callback
+        if func_step is not None:
+            func_step(i, t + dt, modes)
+
+    return modes
@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing numeric evaluation kernels for the systems.
+
+The module depends only on NumPy and the local solvers, so that workers and short evaluations can use the kernels with the derived constants and controls of a system without importing the toolbox or SymPy.
+"""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import logging
+import numpy as np
+
+# local modules
+from utils.solvers import get_N_os_cubic, get_stability_routh_hurwitz
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# transmission kernels specialized for each combination of options
+_kernels_transmission = dict()
+
+def get_coeffs_A(modes, c, values, t_oss_method='cubic'):
+    """Function to obtain the coefficients of the characteristic equation of the drift matrix of ``BEC_10``.
+
+    Parameters
+    ----------
+    modes : numpy.ndarray
+        Classical modes.
+    c : numpy.ndarray
+        Derived constants and controls.
+    values : tuple
+        Effective values returned by ``get_effective_values``.
+    t_oss_method : str, optional
+        Method to calculate the optical steady state. Default is ``'cubic'``.
+
+    Returns
+    -------
+    coeffs : list or numpy.ndarray
+        Coefficients of the characteristic equation of the drift matrix. For batched modes or constants, an array with shape ``(*dims, 7)`` is returned.
+    """
+
+    # extract frequently used variables
+    Delta_tilde = c[0]
+    G = c[4]
+    gamma_m = c[6]
+    gamma_o = c[7]
+    alpha = modes[0]
+    A_mathcal, Omegas, omega_tildes, C = values
+
+    # calculate mean optical occupancy
+    N_o = np.real(np.conjugate(alpha) * alpha)
+    # calculate effiective detuning
+    Delta = Delta_tilde + (C * N_o if 'cubic' in t_oss_method else 0)
+
+    # frequently used expressions
+    A_2 = A_mathcal**2 + Omegas[0]**2 * Omegas[1]**2
+    D_2 = Delta**2 + gamma_o**2 / 4
+    D_N = 2 * Delta * G**2 * N_o * (omega_tildes[0] + omega_tildes[1])
+    O_2 = Omegas[0]**2 + Omegas[1]**2
+
+    # coefficients
+    coeffs = list()
+    # a_0
+    coeffs.append(1)
+    # a_1
+    coeffs.append(2 * gamma_m + gamma_o)
+    # a_2
+    coeffs.append(D_2 + O_2 + gamma_m**2 + 2 * gamma_m * gamma_o)
+    # a_3
+    coeffs.append(2 * D_2 * gamma_m + O_2 * (gamma_m + gamma_o) + gamma_m**2 * gamma_o)
+    # a_4
+    coeffs.append(A_2 + D_2 * (O_2 + gamma_m**2) + D_N + O_2 * gamma_m * gamma_o)
+    # a_5
+    coeffs.append(A_2 * gamma_o + D_2 * O_2 * gamma_m + D_N * gamma_m)
+    # a_6
+    coeffs.append(A_2 * D_2 + np.sqrt(A_2) * D_N)
+    # # alternate expression
+    # coeffs.append(A_2 * D_2 + 2 * A_mathcal * Delta * G**2 * N_o * (omega_tildes[0] - omega_tildes[1]) + 2 * Delta * G**2 * N_o * (Omegas[0]**2 * omega_tildes[1] + Omegas[1]**2 * omega_tildes[0]))
+
+    # stack batched coefficients
+    if np.ndim(coeffs[-1]) > 0:
+        return np.stack(np.broadcast_arrays(*coeffs), axis=-1)
+
+    return coeffs
+
+def get_effective_values(c):
+    """Function to obtain the effective values of ``BEC_10``.
+
+    Parameters
+    ----------
+    c : numpy.ndarray
+        Derived constants and controls.
+
+    Returns
+    -------
+    A_mathcal : float
+        The effective interaction.
+    Omegas : list
+        The effective sidemode frequencies.
+    omega_tildes : list
+        The modified sidemode frequencies.
+    C : float
+        The coefficient of the mean optical occupancy.
+    """
+
+    # extract frequently used variables
+    G = c[4]
+    g_tilde = c[5]
+    N = c[9]
+    omegas = [c[10], c[11]]
+    temp = 2 * g_tilde * N
+
+    # first element
+    A_mathcal = temp * (omegas[0] - omegas[1])
+    # second element
+    Omega_c = np.sqrt((omegas[0] + 2 * temp)**2 - temp**2)
+    Omega_d = np.sqrt((omegas[1] + 2 * temp)**2 - temp**2)
+    Omegas = [Omega_c, Omega_d]
+    # third element
+    omega_c_tilde = omegas[0] + temp
+    omega_d_tilde = omegas[1] + temp
+    omega_tildes = [omega_c_tilde, omega_d_tilde]
+    # fourth element
+    A_2 = A_mathcal**2 + Omega_c**2 * Omega_d**2
+    C = G**2 * (omega_c_tilde + omega_d_tilde) / np.sqrt(A_2)
+    # # alternate expression
+    # C = G**2 * (A_mathcal * (omega_c_tilde - omega_d_tilde) + Omega_c**2 * omega_d_tilde + Omega_d**2 * omega_c_tilde) / A2
+
+    return A_mathcal, Omegas, omega_tildes, C
+
+def get_error_precision(kernel_ref, values, args, num_samples=64):
+    """Function to estimate the error of the values of a kernel evaluated in reduced precision against a reference kernel evaluated on a sample of the points.
+
+    Parameters
+    ----------
+    kernel_ref : callable
+        Reference kernel in double precision, formatted as ``kernel_ref(c, *args)``.
+    values : numpy.ndarray or tuple
+        Values of the kernel in reduced precision for all the points.
+    args : tuple
+        Arguments of the kernels, where the first element is the derived constants and controls and the list elements are sampled element-wise.
+    num_samples : int, optional
+        Maximum number of points evenly spaced in the flattened grid. Default is ``64``.
+
+    Returns
+    -------
+    error : float
+        Largest normwise relative error of the values over the sampled points.
+    """
+
+    # frequently used variables
+    values = values if isinstance(values, tuple) else (values, )
+    shape = np.shape(values[0])
+    size = int(np.prod(shape))
+
+    # sampled points
+    if len(shape) > 0:
+        idxs = np.unravel_index(np.unique(np.linspace(0, size - 1, min(num_samples, size)).astype(int)), shape)
+        def get_sample(value):
+            return np.broadcast_to(value, shape)[idxs]
+    else:
+        def get_sample(value):
+            return value
+
+    # reference values
+    c = [get_sample(c_i) for c_i in args[0]]
+    args = [[get_sample(arg_i) for arg_i in arg] if isinstance(arg, list) else get_sample(arg) for arg in args[1:]]
+    values_ref = kernel_ref(c, *args)
+    values_ref = values_ref if isinstance(values_ref, tuple) else (values_ref, )
+
+    # normwise relative errors
+    errors = list()
+    for _values, _values_ref in zip(values, values_ref):
+        _values = get_sample(_values)
+        _finite = np.isfinite(_values_ref)
+        _norm = np.max(np.abs(_values_ref[_finite]), initial=0.0)
+        errors.append(np.max(np.abs(_values[_finite] - _values_ref[_finite]), initial=0.0) / _norm if _norm > 0 else 0.0)
+
+    return float(max(errors))
+
+def get_group_delay(c, t_approx='none', t_line='s', t_oss_method='cubic'):
+    """Function to obtain the group delay of the transmitted probe field of ``BEC_10`` using the analytical derivative of the transmission phase.
+
+    Parameters
+    ----------
+    c : numpy.ndarray
+        Derived constants and controls with broadcastable elements, for example from ``BEC_10.get_ivc``.
+    t_approx : str, optional
+        Approximations of the transmission, containing ``'del'`` or ``'res'``. Default is ``'none'``.
+    t_line : str, optional
+        Scattering line, either ``'s'`` or ``'S'`` (fallback) for Stokes and ``'as'`` or ``'aS'`` for anti-Stokes. Default is ``'s'``.
+    t_oss_method : str, optional
+        Method to calculate the optical steady state. Default is ``'cubic'``.
+
+    Returns
+    -------
+    tau : float or numpy.ndarray
+        Group delay.
+    """
+
+    # get steady-state values
+    _, alpha_s, Delta, (A_mathcal, Omegas, omega_tildes, _) = get_values_steady_state(
+        c=c,
+        t_oss_method=t_oss_method,
+        branches=False
+    )
+
+    # get transmission coefficient of the selected line and its derivative
+    _t, _dt = get_kernel_transmission(
+        approx_del='del' in t_approx,
+        approx_res='res' in t_approx,
+        line_as=t_line == 'as' or t_line == 'aS',
+        grad=True
+    )(c, alpha_s, Delta, A_mathcal, Omegas, omega_tildes)
+
+    return np.imag(_dt / _t)
+
+def get_kernel_transmission(approx_del, approx_res, line_as, grad=False, single=False):
+    r"""Function to obtain the kernel for the transmission coefficient of a single scattering line.
+
+    The options are resolved once while building the kernel, so that the kernel only evaluates the expressions required by the selected approximations and line. The kernels are built once for each combination of options and shared within the process. The mechanical susceptibilities are evaluated in the offset coordinates :math:`x = \delta - \Omega` around the sidemodes as :math:`\chi^{-1} = - x (2 \Omega + x) - i \delta \gamma_{m}`, which avoids the cancellation in :math:`\Omega^{2} - \delta^{2}` near the resonances.
+
+    Parameters
+    ----------
+    approx_del : bool
+        Option to approximate the probe detuning in the mechanical susceptibilities.
+    approx_res : bool
+        Option to use the resolved sideband approximation.
+    line_as : bool
+        Option to select the anti-Stokes line instead of the Stokes line.
+    grad : bool, optional
+        Option to also return the derivative with respect to the probe detuning. Default is ``False``.
+    single : bool, optional
+        Option to evaluate in single precision. The offsets and the sums of the detunings are obtained in the precision of the inputs before rounding. Default is ``False``.
+
+    Returns
+    -------
+    kernel : callable
+        Kernel formatted as ``kernel(c, alpha_s, Delta, A_mathcal, Omegas, omega_tildes)`` returning the transmission coefficient :math:`t` and, if ``grad`` is ``True``, its derivative :math:`dt / d \delta`.
+    """
+
+    # kernel built for the same options
+    key = (approx_del, approx_res, line_as, grad, single)
+    if key in _kernels_transmission:
+        return _kernels_transmission[key]
+
+    # mechanical susceptibilities with the probe detuning approximated
+    if approx_del:
+        def get_chis(delta, xs, Delta_tilde, Omegas, gamma_m):
+            delta_approx = - Delta_tilde
+            _pos = delta_approx >= 0
+            chis = [1 / (np.where(_pos, - xs[i] * (Omegas[i] + delta_approx), (Omegas[i] - delta_approx) * (2 * Omegas[i] + xs[i])) - 1j * delta_approx * gamma_m) for i in range(2)]
+            dchis = [np.where(_pos, Omegas[i] + delta_approx, delta_approx - Omegas[i]) * chis[i]**2 for i in range(2)] if grad else None
+            return chis, dchis
+    # exact mechanical susceptibilities
+    else:
+        def get_chis(delta, xs, Delta_tilde, Omegas, gamma_m):
+            chis = [1 / (- xs[i] * (2 * Omegas[i] + xs[i]) - 1j * delta * gamma_m) for i in range(2)]
+            dchis = [(1j * gamma_m + 2 * delta) * chis[i]**2 for i in range(2)] if grad else None
+            return chis, dchis
+
+    # numerator and denominator in the resolved sideband approximation
+    if approx_res:
+        if line_as:
+            def get_num_den(Delta, Delta_p, Delta_m, G, gamma_o, mu, alpha_s, N_o, Lambda, dLambda):
+                _den = gamma_o / 2 - 1j * Delta_p - 1j * G**2 * Lambda * N_o
+                _dden = - 1j - 1j * G**2 * dLambda * N_o if grad else None
+                return 1, _den, 0, _dden
+        else:
+            def get_num_den(Delta, Delta_p, Delta_m, G, gamma_o, mu, alpha_s, N_o, Lambda, dLambda):
+                _den = gamma_o / 2 - 1j * Delta_p - 1j * G**2 * Lambda * N_o
+                _dden = - 1j - 1j * G**2 * dLambda * N_o if grad else None
+                return mu * gamma_o, _den, 0, _dden
+    # numerator and denominator without approximation
+    else:
+        def get_den(Delta, Delta_p, Delta_m, G, gamma_o, N_o, Lambda, dLambda):
+            Gamma_m = gamma_o / 2 - 1j * Delta_p
+            Gamma_p = gamma_o / 2 + 1j * Delta_m
+            _den = Gamma_m * Gamma_p + 2 * Delta * G**2 * Lambda * N_o
+            _dden = - 1j * (Gamma_m + Gamma_p) + 2 * Delta * G**2 * dLambda * N_o if grad else None
+            return Gamma_p, _den, _dden
+
+        if line_as:
+            def get_num_den(Delta, Delta_p, Delta_m, G, gamma_o, mu, alpha_s, N_o, Lambda, dLambda):
+                _, _den, _dden = get_den(Delta, Delta_p, Delta_m, G, gamma_o, N_o, Lambda, dLambda)
+                _alpha_s_sq = np.conjugate(alpha_s)**2
+                _num = mu * gamma_o * (- 1j * G**2 * Lambda * _alpha_s_sq)
+                _dnum = mu * gamma_o * (- 1j * G**2 * dLambda * _alpha_s_sq) if grad else None
+                return _num, _den, _dnum, _dden
+        else:
+            def get_num_den(Delta, Delta_p, Delta_m, G, gamma_o, mu, alpha_s, N_o, Lambda, dLambda):
+                Gamma_p, _den, _dden = get_den(Delta, Delta_p, Delta_m, G, gamma_o, N_o, Lambda, dLambda)
+                _num = mu * gamma_o * (Gamma_p + 1j * G**2 * Lambda * N_o)
+                _dnum = mu * gamma_o * (- 1j + 1j * G**2 * dLambda * N_o) if grad else None
+                return _num, _den, _dnum, _dden
+
+    # transmission coefficient of the selected line
+    if line_as:
+        def get_t(_num, _den):
+            return - np.conjugate(_num / _den)
+
+        def get_dt(_num, _den, _dnum, _dden):
+            return - np.conjugate((_dnum - _num / _den * _dden) / _den)
+    else:
+        def get_t(_num, _den):
+            return 1 - _num / _den
+
+        def get_dt(_num, _den, _dnum, _dden):
+            return - (_dnum - _num / _den * _dden) / _den
+
+    # rounding of the inputs
+    if single:
+        def get_rounded(values):
+            return [np.asarray(value, dtype=np.complex64 if np.iscomplexobj(value) else np.float32) for value in values]
+    else:
+        def get_rounded(values):
+            return values
+
+    def kernel(c, alpha_s, Delta, A_mathcal, Omegas, omega_tildes):
+        # extract frequently used variables
+        delta = np.asarray(c[1])
+
+        # offsets and sums prone to cancellation
+        xs = [delta - Omegas[i] for i in range(2)]
+        Delta_p = Delta + delta
+        Delta_m = Delta - delta
+        omega_tilde_diff = omega_tildes[0] - omega_tildes[1]
+
+        # round the inputs to the precision of the evaluation
+        Delta_tilde, delta, x_c, x_d, G, gamma_m, gamma_o, mu, alpha_s, Delta, Delta_p, Delta_m, A_mathcal, Omega_c, Omega_d, omega_c_tilde, omega_d_tilde, omega_tilde_diff = get_rounded([c[0], delta, xs[0], xs[1], c[4], c[6], c[7], c[8], alpha_s, Delta, Delta_p, Delta_m, A_mathcal, Omegas[0], Omegas[1], omega_tildes[0], omega_tildes[1], omega_tilde_diff])
+        xs = [x_c, x_d]
+        Omegas = [Omega_c, Omega_d]
+        omega_tildes = [omega_c_tilde, omega_d_tilde]
+
+        # mean optical occupancy
+        N_o = np.real(np.conjugate(alpha_s) * alpha_s)
+
+        # mechanical susceptibilities
+        chis, dchis = get_chis(delta, xs, Delta_tilde, Omegas, gamma_m)
+
+        # substitution term and its derivative
+        _chi_prod = chis[0] * chis[1]
+        _den = A_mathcal**2 * _chi_prod + 1
+        Lambda = (A_mathcal * _chi_prod * omega_tilde_diff + chis[0] * omega_tildes[0] + chis[1] * omega_tildes[1]) / _den
+        dLambda = None
+        if grad:
+            _dchi_prod = dchis[0] * chis[1] + chis[0] * dchis[1]
+            dLambda = (A_mathcal * _dchi_prod * omega_tilde_diff + dchis[0] * omega_tildes[0] + dchis[1] * omega_tildes[1] - Lambda * A_mathcal**2 * _dchi_prod) / _den
+
+        # transmission coefficient
+        _num, _den, _dnum, _dden = get_num_den(Delta, Delta_p, Delta_m, G, gamma_o, mu, alpha_s, N_o, Lambda, dLambda)
+        if not grad:
+            return get_t(_num, _den)
+
+        return get_t(_num, _den), get_dt(_num, _den, _dnum, _dden)
+
+    _kernels_transmission[key] = kernel
+
+    return kernel
+
+def get_modes_steady_state(c, N_os, values, t_oss_method='cubic'):
+    """Function to obtain the steady-state modes of ``BEC_10`` for each branch of the mean optical occupancy.
+
+    Parameters
+    ----------
+    c : numpy.ndarray
+        Derived constants and controls.
+    N_os : list or numpy.ndarray
+        Mean optical occupancies of the branches.
+    values : tuple
+        Effective values returned by ``get_effective_values``.
+    t_oss_method : str, optional
+        Method to calculate the optical steady state. Default is ``'cubic'``.
+
+    Returns
+    -------
+    Modes : numpy.ndarray
+        Steady state modes with shape ``(num_branches, 3, *dims)``.
+    """
+
+    # extract frequently used variables
+    Delta_tilde = c[0]
+    eta_lc = c[2]
+    G = c[4]
+    gamma_o = c[7]
+    A_mathcal, Omegas, omega_tildes, C = values
+
+    # frequently used expressions
+    A2 = A_mathcal**2 + Omegas[0]**2 * Omegas[1]**2
+    A2_sqrt = np.sqrt(A2)
+
+    # initialize lists
+    Modes = list()
+
+    # for each mean optical occupancy
+    for N_o in N_os:
+        # calculate mode amplitudes
+        alpha = eta_lc / (gamma_o / 2 - 1j * (Delta_tilde + (C * N_o if 'cubic' in t_oss_method else 0)))
+        q_c = - G * omega_tildes[1] * N_o / A2_sqrt
+        q_d = - G * omega_tildes[0] * N_o / A2_sqrt
+        # # alternate expressions
+        # q_c = - G * (Omegas[1]**2 * omega_tildes[0] - A_mathcal * omega_tildes[1]) * N_o / A2
+        # q_d = - G * (Omegas[0]**2 * omega_tildes[1] + A_mathcal * omega_tildes[0]) * N_o / A2
+
+        # append to list
+        Modes.append(np.broadcast_arrays(alpha, q_c, q_d))
+
+    return np.array(Modes, dtype=np.complex_)
+
+def get_stability(c, t_oss_method='cubic', values=None):
+    """Function to obtain the Routh-Hurwitz stability of the steady states of ``BEC_10``.
+
+    Parameters
+    ----------
+    c : numpy.ndarray
+        Derived constants and controls with broadcastable elements, for example from ``BEC_10.get_c_batch``.
+    t_oss_method : str, optional
+        Method to calculate the optical steady state. Default is ``'cubic'``.
+    values : tuple, optional
+        Effective values returned by ``get_effective_values``. If ``None``, the values are evaluated.
+
+    Returns
+    -------
+    num_unstable : numpy.ndarray
+        Number of eigenvalues of the drift matrix with positive real parts for each branch of the steady state, with shape ``(3, *dims)``. A value of ``0`` denotes a stable branch and ``-1`` denotes a missing branch.
+    margins : numpy.ndarray
+        Smallest normalized Hurwitz minor for each branch of the steady state, with shape ``(3, *dims)``. The values are ``numpy.nan`` for the missing branches.
+    """
+
+    # broadcast constants to at least one dimension
+    c = np.array(np.broadcast_arrays(*c), dtype=np.float_)
+    if c.ndim == 1:
+        c = c[:, np.newaxis]
+
+    # get steady-state modes and coefficients for all branches
+    with np.errstate(invalid='ignore'):
+        N_os, _, _, values = get_values_steady_state(
+            c=c,
+            t_oss_method=t_oss_method,
+            values=values
+        )
+        Modes = get_modes_steady_state(
+            c=c,
+            N_os=N_os,
+            values=values,
+            t_oss_method=t_oss_method
+        )
+        coeffs = get_coeffs_A(
+            modes=np.moveaxis(Modes, 1, 0),
+            c=c,
+            values=values,
+            t_oss_method=t_oss_method
+        )
+
+    # get stability
+    num_unstable, margins = get_stability_routh_hurwitz(
+        coeffs=coeffs
+    )
+
+    # mask missing branches
+    _missing = np.isnan(np.real(Modes[:, 0]))
+    num_unstable[_missing] = -1
+    margins[_missing] = np.nan
+
+    return num_unstable, margins
+
+def get_transmission(c, t_approx='none', t_line='s', t_oss_method='cubic', t_precision='double', tol_precision=1e-3):
+    """Function to obtain the transmission of the probe field of ``BEC_10``.
+
+    Parameters
+    ----------
+    c : numpy.ndarray
+        Derived constants and controls with broadcastable elements, for example from ``BEC_10.get_ivc`` or ``BEC_10.get_c_batch``.
+    t_approx : str, optional
+        Approximations of the transmission, containing ``'del'`` or ``'res'``. Default is ``'none'``.
+    t_line : str, optional
+        Scattering line, either ``'s'`` or ``'S'`` (fallback) for Stokes and ``'as'`` or ``'aS'`` for anti-Stokes. Default is ``'s'``.
+    t_oss_method : str, optional
+        Method to calculate the optical steady state. Default is ``'cubic'``.
+    t_precision : str, optional
+        Precision of the evaluation, either ``'double'`` or ``'single'``. For single precision, the error is estimated against a sample in double precision (refer to ``get_error_precision``) and a warning is logged if it exceeds ``tol_precision``. Default is ``'double'``.
+    tol_precision : float, optional
+        Tolerance of the error in single precision. Default is ``1e-3``.
+
+    Returns
+    -------
+    T : float or numpy.ndarray
+        Transmission.
+    """
+
+    # get kernels with the reference in double precision
+    _kernels = [get_kernel_transmission(
+        approx_del='del' in t_approx,
+        approx_res='res' in t_approx,
+        line_as=t_line == 'as' or t_line == 'aS',
+        single=single
+    ) for single in ([False, True] if t_precision == 'single' else [False])]
+
+    # get steady-state values
+    _, alpha_s, Delta, (A_mathcal, Omegas, omega_tildes, _) = get_values_steady_state(
+        c=c,
+        t_oss_method=t_oss_method,
+        branches=False
+    )
+
+    # get transmission coefficient of the selected line
+    args = (c, alpha_s, Delta, A_mathcal, Omegas, omega_tildes)
+    _t = _kernels[-1](*args)
+
+    # estimate the error of the single precision
+    if len(_kernels) > 1:
+        error = get_error_precision(
+            kernel_ref=_kernels[0],
+            values=_t,
+            args=args
+        )
+        if error > tol_precision:
+            logger.warning('Error of the single precision transmission coefficient is {:0.2e}'.format(error))
+
+    return np.real(np.conjugate(_t) * _t)
+
+def get_values_steady_state(c, t_oss_method='cubic', values=None, branches=True):
+    """Function to obtain the steady-state values of ``BEC_10`` independent of the probe detuning.
+
+    Parameters
+    ----------
+    c : numpy.ndarray
+        Derived constants and controls.
+    t_oss_method : str, optional
+        Method to calculate the optical steady state. Default is ``'cubic'``.
+    values : tuple, optional
+        Effective values returned by ``get_effective_values``. If ``None``, the values are evaluated.
+    branches : bool, optional
+        Option to solve for all the branches of the mean optical occupancy, which the steady-state modes require. If ``False``, the cubic equation is only solved for the ``'cubic'`` method. Default is ``True``.
+
+    Returns
+    -------
+    N_os : numpy.ndarray
+        Mean optical occupancies in ascending order with shape ``(3, *dims)``, padded with ``numpy.nan`` where the branches do not exist. The zero branch is retained in the absence of the control laser. The value is ``None`` if the branches are not solved for.
+    alpha_s : complex or numpy.ndarray
+        Steady-state optical amplitude at the lowest branch.
+    Delta : float or numpy.ndarray
+        Effective detuning.
+    values : tuple
+        Effective values returned by ``get_effective_values``.
+    """
+
+    # extract frequently used variables
+    Delta_tilde = c[0]
+    eta_lc = c[2]
+    gamma_o = c[7]
+
+    # get effective values
+    values = values if values is not None else get_effective_values(
+        c=c
+    )
+    C = values[3]
+
+    # solve the cubic equation for all points only if required
+    N_os = None
+    if branches or 'cubic' in t_oss_method:
+        N_os, _ = get_N_os_cubic(
+            C=C,
+            Delta_0=Delta_tilde,
+            kappa=gamma_o,
+            A_l_sq=np.real(np.conjugate(eta_lc) * eta_lc)
+        )
+
+    # get mean occupancy amplitude
+    if 'cubic' in t_oss_method:
+        alpha_s = eta_lc / (gamma_o / 2.0 - 1.0j * (Delta_tilde + C * N_os[0]))
+    else:
+        alpha_s = eta_lc / (gamma_o / 2.0 - 1.0j * Delta_tilde)
+
+    # effective detuning
+    Delta = Delta_tilde + (C * np.real(np.conjugate(alpha_s) * alpha_s) if 'cubic' in t_oss_method else 0)
+
+    return N_os, alpha_s, Delta, values
@@ -0,0 +1,605 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing loopers which evaluate the innermost axis of a sweep in a single call per row."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import itertools
+import logging
+import multiprocessing
+import numpy as np
+import os
+
+# local modules
+from utils import profiling
+from utils.storage import ChunkedStore
+
+# module logger
+logger = logging.getLogger(__name__)
+
+# state shared by the rows evaluated in a worker
+_state = None
+
+class RowReducer():
+    """Class to reduce a row of values streamed in chunks along the innermost axis.
+
+    Parameters
+    ----------
+    name : str
+        Name of the reduction. Options are ``'min'``, ``'max'``, ``'argmin'`` and ``'argmax'`` for the extrema and their positions on the axis, ``'integral'`` for the trapezoidal integral and ``'fwhm'`` for the full width at half maximum around the global maximum. The last option keeps only the points which can still be the crossing on the left of a later maximum, that is, the points lower than all the points after them and not lower than the half of the current maximum.
+    """
+
+    # available reductions
+    names = ['min', 'max', 'argmin', 'argmax', 'integral', 'fwhm']
+
+    def __init__(self, name):
+        """Class constructor for RowReducer."""
+
+        # validate name
+        if name not in self.names:
+            raise ValueError('Invalid reduction {}. Available options are: {}'.format(name, ', '.join(self.names)))
+
+        # set attributes
+        self.name = name
+        self.reset()
+
+    def reset(self):
+        """Method to reset the reduction for a new row."""
+
+        self._value = None
+        self._x = None
+        self._last = None
+        self._crossings = [None, None]
+        self._stack = None
+
+    def _update_fwhm(self, xs, vs):
+        """Method to update the crossings of the half maximum with a chunk of the row.
+
+        The crossings are formatted as ``(x, v, x_n, v_n)`` with the inner neighbour ``(x_n, v_n)`` for the interpolation, and the kept points are formatted as the arrays ``[xs, vs, xs_n, vs_n]`` in ascending order of the values.
+
+        Parameters
+        ----------
+        xs : numpy.ndarray
+            Values of the innermost axis in the chunk.
+        vs : numpy.ndarray
+            Values of the row in the chunk.
+        """
+
+        # invalid values
+        if np.any(np.isnan(vs)):
+            self._value = np.nan
+        if self._value is not None and np.isnan(self._value):
+            return
+
+        # link the last kept point to the chunk
+        if self._stack is not None:
+            self._stack[2][-1] = xs[0]
+            self._stack[3][-1] = vs[0]
+
+        # new maximum
+        _idx = np.argmax(vs)
+        if self._value is None or vs[_idx] > self._value:
+            self._value = vs[_idx]
+            _half = self._value / 2.0
+            # crossing on the left in the chunk or among the kept points
+            self._crossings[0] = None
+            _below = np.flatnonzero(vs[:_idx] <= _half)
+            if len(_below) > 0:
+                _l = _below[-1]
+                self._crossings[0] = (xs[_l], vs[_l], xs[_l + 1], vs[_l + 1])
+            elif self._stack is not None:
+                _pos = np.searchsorted(self._stack[1], _half, side='right') - 1
+                if _pos >= 0:
+                    self._crossings[0] = tuple(_s[_pos] for _s in self._stack)
+            # crossing on the right in the chunk
+            self._crossings[1] = None
+            _below = np.flatnonzero(vs[_idx + 1:] <= _half)
+            if len(_below) > 0:
+                _r = _idx + 1 + _below[0]
+                self._crossings[1] = (xs[_r], vs[_r], xs[_r - 1], vs[_r - 1])
+        # crossing on the right of the current maximum
+        elif self._crossings[1] is None:
+            _below = np.flatnonzero(vs <= self._value / 2.0)
+            if len(_below) > 0:
+                _r = _below[0]
+                self._crossings[1] = (xs[_r], vs[_r], xs[_r - 1], vs[_r - 1]) if _r > 0 else (xs[0], vs[0], self._last[0], self._last[1])
+        self._last = (xs[-1], vs[-1])
+
+        # points of the chunk lower than all the points after them
+        _mins = np.minimum.accumulate(vs[::-1])[::-1]
+        _keep = np.append(vs[:-1] < _mins[1:], True)
+        stack = [xs[_keep], vs[_keep], np.append(xs[1:], np.nan)[_keep], np.append(vs[1:], np.nan)[_keep]]
+        # kept points lower than the chunk
+        if self._stack is not None:
+            _num = np.searchsorted(self._stack[1], _mins[0], side='left')
+            stack = [np.concatenate([_s[:_num], _s_chunk]) for _s, _s_chunk in zip(self._stack, stack)]
+        # discard the points below the crossing on the left
+        _pos = np.searchsorted(stack[1], self._value / 2.0, side='right') - 1
+        self._stack = [_s[max(_pos, 0):] for _s in stack]
+
+    def update(self, xs, vs):
+        """Method to update the reduction with a chunk of the row.
+
+        Parameters
+        ----------
+        xs : numpy.ndarray
+            Values of the innermost axis in the chunk.
+        vs : numpy.ndarray
+            Values of the row in the chunk.
+        """
+
+        # extrema
+        if self.name in ['min', 'argmin', 'max', 'argmax']:
+            _idx = np.argmin(vs) if 'min' in self.name else np.argmax(vs)
+            _sign = 1.0 if 'min' in self.name else -1.0
+            if self._value is None or _sign * vs[_idx] < _sign * self._value or np.isnan(vs[_idx]):
+                self._value = vs[_idx]
+                self._x = xs[_idx]
+        # integral including the segment joining the previous chunk
+        elif self.name == 'integral':
+            self._value = (self._value if self._value is not None else 0.0) + np.trapz(vs, xs)
+            if self._last is not None:
+                self._value += (xs[0] - self._last[0]) * (vs[0] + self._last[1]) / 2.0
+            self._last = (xs[-1], vs[-1])
+        # full width at half maximum
+        else:
+            self._update_fwhm(
+                xs=np.asarray(xs, dtype=np.float_),
+                vs=np.asarray(vs, dtype=np.float_)
+            )
+
+    def get_result(self):
+        """Method to obtain the reduced value of the row.
+
+        Returns
+        -------
+        result : float
+            Reduced value.
+        """
+
+        # positions of extrema
+        if self.name in ['argmin', 'argmax']:
+            return self._x
+        # full width at half maximum for positive maxima with crossings on both sides
+        if self.name == 'fwhm':
+            if self._value is None or not self._value > 0 or None in self._crossings:
+                return np.nan
+            _half = self._value / 2.0
+            # linear interpolation with the inner neighbours
+            (x_l, v_l, x_l_n, v_l_n), (x_r, v_r, x_r_n, v_r_n) = self._crossings
+            return np.interp(_half, [v_r, v_r_n], [x_r, x_r_n]) - np.interp(_half, [v_l, v_l_n], [x_l, x_l_n])
+
+        return self._value
+
+def _get_indices(vals, vals_ref):
+    """Function to obtain the indices of values in an array of reference values, with ``-1`` for the missing ones."""
+
+    # frequently used variables
+    vals = np.asarray(vals)
+    vals_ref = np.asarray(vals_ref)
+    _order = np.argsort(vals_ref)
+    _sorted = vals_ref[_order]
+    _atol = 1e-12 * np.max(np.abs(vals_ref)) if len(vals_ref) > 0 else 0.0
+    idxs = np.full(len(vals), -1, dtype=np.int_)
+    if len(vals_ref) == 0:
+        return idxs
+
+    # match nearest neighbours in the sorted values
+    _pos = np.searchsorted(_sorted, vals)
+    for _p in [np.clip(_pos - 1, 0, len(_sorted) - 1), np.clip(_pos, 0, len(_sorted) - 1)]:
+        _match = (idxs < 0) & np.isclose(_sorted[_p], vals, rtol=1e-12, atol=_atol)
+        idxs[_match] = _order[_p][_match]
+
+    return idxs
+
+def _get_row(func, system_params, var, xs, dim_chunk, reducers=None, consts=None, idxs=None):
+    """Function to evaluate a row in chunks of the innermost axis, returning the values or the reduced values. If the constants of the row are given, the function is evaluated with the constants and the indices of the chunk in the row instead."""
+
+    # reset reductions
+    if reducers is not None:
+        for reducer in reducers:
+            reducer.reset()
+
+    # evaluate chunks
+    row = list()
+    for i in range(0, len(xs), dim_chunk):
+        if consts is not None:
+            _vs = func(consts, idxs[i:i + dim_chunk])
+        else:
+            system_params[var] = xs[i:i + dim_chunk]
+            _vs = func(system_params)
+        _vs = np.asarray(_vs, dtype=np.float_)
+        if reducers is not None:
+            for reducer in reducers:
+                reducer.update(xs[i:i + dim_chunk], _vs)
+        else:
+            row.append(_vs)
+
+    if reducers is not None:
+        return [reducer.get_result() for reducer in reducers]
+    return np.concatenate(row) if len(row) > 0 else np.zeros(0, dtype=np.float_)
+
+def _init_worker(state):
+    """Function to initialize a worker with the state shared by all rows, attaching the output buffers."""
+
+    global _state
+    # restore the profiled methods
+    if _state is not None and _state['profile'] is not None:
+        profiling.deinstrument()
+    _state = dict(state) if state is not None else None
+    if _state is None:
+        return
+
+    # profiled methods
+    if _state['profile'] is not None:
+        profiling.instrument(_state['profile'])
+
+    # shared or memory-mapped buffers
+    if _state['buffer'] is not None:
+        _state['values'] = np.frombuffer(_state['buffer'], dtype=np.float_).reshape(_state['shape'])
+    if _state['path_values'] is not None:
+        _state['values'] = np.load(_state['path_values'], mmap_mode='r+')
+    if _state['path_values_prev'] is not None:
+        _state['values_prev'] = np.load(_state['path_values_prev'], mmap_mode='r')
+
+def _evaluate_task(task):
+    """Function to evaluate a row of the sweep in a worker and write it to the output buffer, returning the indices of the row and the profiling statistics recorded for it."""
+
+    # frequently used variables
+    idx, idx_prev, consts = task
+    axes = _state['axes']
+    xs = axes[-1]['val']
+    system_params = get_system_params_row(
+        params_system=_state['params_system'],
+        axes=axes,
+        idx=idx
+    )
+    kwargs = {
+        'func': _state['func'],
+        'system_params': system_params,
+        'var': axes[-1]['var'],
+        'dim_chunk': _state['dim_chunk'],
+        'consts': consts
+    }
+
+    # evaluate the row in chunks
+    if idx_prev is None:
+        _state['values'][idx] = _get_row(
+            xs=xs,
+            idxs=np.arange(len(xs)),
+            reducers=[RowReducer(name) for name in _state['reductions']] if _state['reductions'] is not None else None,
+            **kwargs
+        )
+    # evaluate only the missing points
+    else:
+        idxs_x = _state['idxs_x']
+        _mask = idxs_x >= 0
+        row = np.zeros(len(xs), dtype=np.float_)
+        row[_mask] = _state['values_prev'][idx_prev][idxs_x[_mask]]
+        row[~_mask] = _get_row(
+            xs=xs[~_mask],
+            idxs=np.flatnonzero(~_mask),
+            **kwargs
+        )
+        _state['values'][idx] = row
+
+    return idx, profiling.get_stats(reset=True) if _state['profile'] is not None else None
+
+def _get_values(store):
+    """Function to load the values of a store into memory and release it."""
+
+    values = np.array(store.values)
+    store.close()
+
+    return values
+
+def get_axis_values(params_axis):
+    """Function to obtain the values of an axis of the looper.
+
+    Parameters
+    ----------
+    params_axis : dict
+        Parameters of the axis. Either the values are given by the key ``'val'`` or they are generated using the keys ``'min'``, ``'max'``, ``'dim'`` and ``'scale'`` (``'linear'`` (default) or ``'log'``).
+
+    Returns
+    -------
+    values : numpy.ndarray
+        Values of the axis.
+    """
+
+    # given values
+    if params_axis.get('val', None) is not None:
+        return np.asarray(params_axis['val'], dtype=np.float_)
+
+    # logarithmic scale
+    if params_axis.get('scale', 'linear') == 'log':
+        return np.logspace(np.log10(params_axis['min']), np.log10(params_axis['max']), params_axis['dim'])
+
+    return np.linspace(params_axis['min'], params_axis['max'], params_axis['dim'])
+
+def get_axes(params):
+    """Function to obtain the axes of the looper from the outermost to the innermost.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters of the looper containing the axes ``'X'`` and optionally ``'Y'`` and ``'Z'``.
+
+    Returns
+    -------
+    axes : list
+        Axes formatted as ``{'name': name, 'var': var, 'val': values}``, ordered as ``Z``, ``Y`` and ``X``.
+    """
+
+    return [{
+        'name': name,
+        'var': params[name]['var'],
+        'val': get_axis_values(params[name])
+    } for name in ['Z', 'Y', 'X'] if name in params]
+
+def get_system_params_row(params_system, axes, idx):
+    """Function to obtain the system parameters for a row of the sweep.
+
+    Parameters
+    ----------
+    params_system : dict
+        Parameters of the system.
+    axes : list
+        Axes of the looper ordered from the outermost to the innermost.
+    idx : tuple
+        Indices of the row along the outer axes.
+
+    Returns
+    -------
+    system_params : dict
+        Parameters of the system with the values of the outer axes and the array of values of the innermost axis.
+    """
+
+    # update parameters
+    system_params = dict(params_system)
+    for axis, i in zip(axes[:-1], idx):
+        system_params[axis['var']] = axis['val'][i]
+    system_params[axes[-1]['var']] = axes[-1]['val']
+
+    return system_params
+
+def run_loopers_rows(func, params, params_system, dir_path=None, chunk_size=16, reductions=None, dim_chunk=None, cache=None, num_processes=1, profile=None, func_consts=None):
+    """Function to run a sweep with the innermost axis evaluated as an array in a single call per row.
+
+    Parameters
+    ----------
+    func : callable
+        Function returning the values of a row, formatted as ``func(system_params)``, where the parameter of the innermost axis is an array. If ``func_consts`` is given, the function is formatted as ``func(consts, idxs)`` instead, where ``idxs`` are the indices of the chunk along the innermost axis.
+    params : dict
+        Parameters of the looper containing the axes ``'X'`` and optionally ``'Y'`` and ``'Z'`` along with the option ``'show_progress'``.
+    params_system : dict
+        Parameters of the system.
+    dir_path : str, optional
+        Path of the directory of a ``ChunkedStore`` to stream the rows into. If ``None``, the results are kept in memory.
+    chunk_size : int, optional
+        Number of rows written to the store at once. Default is ``16``.
+    reductions : list, optional
+        Names of the reductions over the innermost axis (refer to ``RowReducer``). If given, only the reduced values are stored.
+    dim_chunk : int, optional
+        Number of points of the innermost axis evaluated in a single call. Default is the full row.
+    cache : ResultCache, optional
+        Cache of the results. If given, the results are loaded from or streamed into its entry for the inputs of the sweep and are returned in memory unless ``dir_path`` is given, in which case the store of the entry is returned. On a miss, the points of the most recent compatible entry over a different grid are reused and only the missing points are evaluated. For reductions, only rows with the same innermost axis are reused.
+    num_processes : int, optional
+        Number of worker processes. The rows are dispatched one at a time to the next free worker, so that rows of uneven cost are balanced. The function and the parameters are shared once with each worker, and the workers write the rows directly into a shared buffer or the memory-mapped store. If ``None``, all available cores are used. Default is ``1``.
+    profile : list, optional
+        Classes whose methods are profiled during the sweep (refer to ``utils.profiling``). If given, the call counts and the cumulative and self times of the methods are collected from all workers, added to the statistics of ``utils.profiling`` and logged as a merged report at the end of the sweep.
+    func_consts : callable, optional
+        Function returning the constants shared by the chunks of a row, formatted as ``func_consts(system_params)``, where the parameter of the innermost axis is the whole array. If given, the constants of each row are obtained once in the main process as the row is dispatched and are passed to the worker along with the row, so that the workers do not rebuild the system for each chunk.
+
+    Returns
+    -------
+    axes : list
+        Axes of the results ordered from the outermost to the innermost. For reductions, the innermost axis is replaced by the names of the reductions.
+    vs : numpy.ndarray or ChunkedStore
+        Results with shape ``(dim_Z, dim_Y, dim_X)`` for the available axes, or the store containing them.
+    """
+
+    # frequently used variables
+    axes = get_axes(params)
+    show_progress = params.get('show_progress', False)
+    xs = axes[-1]['val']
+    dim_chunk = dim_chunk if dim_chunk is not None else len(xs)
+
+    # reductions replace the innermost axis
+    reducers = [RowReducer(name) for name in reductions] if reductions is not None else None
+    axes_results = axes[:-1] + [{
+        'name': 'V',
+        'var': 'reduction',
+        'val': np.array(reductions)
+    }] if reducers is not None else axes
+    shape = tuple(len(axis['val']) for axis in axes_results)
+
+    # load cached results
+    if cache is not None:
+        key = cache.get_key(
+            params=params,
+            params_system=params_system,
+            func=[func_consts, func] if func_consts is not None else func,
+            attrs={
+                'reductions': reductions
+            }
+        )
+        store = cache.get(
+            key=key
+        )
+        if store is not None:
+            logger.info('Loaded cached results {}'.format(key))
+            return axes_results, store if dir_path is not None else _get_values(store)
+        path_store = cache.get_path(key)
+
+        # compatible results over a different grid
+        key_base = cache.get_key(
+            params=params,
+            params_system=params_system,
+            func=[func_consts, func] if func_consts is not None else func,
+            attrs={
+                'reductions': reductions,
+                'X': params['X'] if reductions is not None else None
+            },
+            base=True
+        )
+        store_prev = cache.get_compatible(
+            key_base=key_base
+        )
+        if store_prev is not None:
+            logger.info('Extending cached results {}'.format(os.path.basename(store_prev.dir_path)))
+            idxs_prev = [_get_indices(axis['val'], axis_prev['val']) for axis, axis_prev in zip(axes[:-1], store_prev.axes[:-1])]
+            idxs_x = _get_indices(xs, store_prev.axes[-1]['val']) if reducers is None else None
+    else:
+        path_store = dir_path
+        store_prev = None
+
+    # number of workers
+    parallel = num_processes != 1
+    if parallel:
+        num_processes = num_processes if num_processes is not None else os.cpu_count()
+
+    # initialize results
+    if path_store is not None:
+        vs = ChunkedStore(
+            dir_path=path_store,
+            axes=axes_results,
+            attrs={
+                'key_base': key_base
+            } if cache is not None else None,
+            chunk_size=chunk_size,
+            mode='w'
+        )
+        values = vs.values
+    # buffer shared with the workers
+    elif parallel:
+        buffer = multiprocessing.RawArray('d', int(np.prod(shape)))
+        values = np.frombuffer(buffer, dtype=np.float_).reshape(shape)
+        vs = values
+    else:
+        values = np.zeros(shape, dtype=np.float_)
+        vs = values
+
+    # tasks for the rows, formatted as the indices of the row and the indices of the reusable row
+    tasks = list()
+    _idxs = list(itertools.product(*[range(dim) for dim in shape[:-1]]))
+    for idx in _idxs:
+        # reusable row
+        _idx_prev = tuple(int(_idxs_prev[i]) for _idxs_prev, i in zip(idxs_prev, idx)) if store_prev is not None else None
+        if _idx_prev is None or not all(i >= 0 for i in _idx_prev):
+            tasks.append((idx, None))
+        # reuse reduced values
+        elif reducers is not None:
+            values[idx] = store_prev.values[_idx_prev]
+            if path_store is not None:
+                vs.done[idx] = True
+        # evaluate only the missing points
+        else:
+            tasks.append((idx, _idx_prev))
+
+    # shared state of the workers with the output buffers attached in place or by path
+    state = {
+        'func': func,
+        'params_system': params_system,
+        'axes': axes,
+        'dim_chunk': dim_chunk,
+        'reductions': reductions,
+        'idxs_x': idxs_x if store_prev is not None and reducers is None else None,
+        'shape': shape,
+        'buffer': buffer if path_store is None and parallel else None,
+        'values': values if path_store is None and not parallel else None,
+        'path_values': os.path.join(path_store, 'values.npy') if path_store is not None else None,
+        'path_values_prev': os.path.join(store_prev.dir_path, 'values.npy') if store_prev is not None else None,
+        'profile': profile
+    }
+
+    # keep statistics recorded before the sweep aside
+    if profile is not None:
+        stats_prev = profiling.get_stats(
+            reset=True
+        )
+        stats = dict()
+
+    # constants of the rows obtained as the rows are dispatched
+    _tasks = ((idx, idx_prev, func_consts(get_system_params_row(
+        params_system=params_system,
+        axes=axes,
+        idx=idx
+    )) if func_consts is not None else None) for idx, idx_prev in tasks)
+
+    # evaluate rows in the main process
+    pool = None
+    try:
+        if not parallel or len(tasks) <= 1:
+            _init_worker(state)
+            results = map(_evaluate_task, _tasks)
+        # dispatch rows to the next free worker
+        else:
+            pool = multiprocessing.Pool(
+                processes=min(num_processes, len(tasks)),
+                initializer=_init_worker,
+                initargs=(state, )
+            )
+            results = pool.imap_unordered(_evaluate_task, _tasks, chunksize=1)
+
+        # for each evaluated row
+        for count, (idx, _stats) in enumerate(results):
+            # merge statistics of the row
+            if _stats is not None:
+                profiling.merge_stats(
+                    stats=_stats,
+                    stats_into=stats
+                )
+
+            # update completed rows
+            if path_store is not None:
+                vs.done[idx] = True
+                if (count + 1) % chunk_size == 0:
+                    vs.flush()
+
+            # display progress
+            if show_progress:
+                logger.info('Progress: {:0.2f}%'.format((count + 1) / len(tasks) * 100))
+
+        # wait for the workers to exit
+        if pool is not None:
+            pool.close()
+            pool.join()
+    # release workers also on errors
+    finally:
+        if pool is not None:
+            pool.terminate()
+        _init_worker(None)
+
+    # report profiling statistics
+    if profile is not None:
+        profiling.merge_stats(
+            stats=stats_prev
+        )
+        profiling.merge_stats(
+            stats=stats
+        )
+        logger.info('Profile of {} rows:\n{}'.format(len(tasks), profiling.get_report(
+            stats=stats
+        )))
+
+    # write remaining rows
+    if path_store is not None:
+        vs.flush()
+
+    # limit the size of the cache
+    if cache is not None:
+        if store_prev is not None:
+            store_prev.close()
+        cache.evict(
+            keys_kept=[key]
+        )
+        if dir_path is None:
+            vs = _get_values(vs)
+
+    return axes_results, vs
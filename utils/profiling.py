@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing opt-in profiling hooks for the methods of the systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import contextlib
+import functools
+import inspect
+import time
+
+# statistics of the profiled methods formatted as ``{name: [count, cumulative, self]}``
+_stats = dict()
+# times spent in the children of the active calls
+_stack = list()
+# original methods formatted as ``{(cls, name): (method, inherited)}``
+_originals = dict()
+
+def _wrap(name, func):
+    """Function to wrap a method to record its call count and its cumulative and self times."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _stack.append(0.0)
+        t_start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            t = time.perf_counter() - t_start
+            t_children = _stack.pop()
+            # add to the children time of the caller
+            if len(_stack) > 0:
+                _stack[-1] += t
+            stats = _stats.setdefault(name, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += t
+            stats[2] += t - t_children
+
+    return wrapper
+
+def instrument(classes):
+    """Function to replace the methods of classes with profiled wrappers.
+
+    Parameters
+    ----------
+    classes : list
+        Classes whose methods, including the inherited ones, are profiled. Special methods are skipped.
+    """
+
+    for cls in classes:
+        for name in dir(cls):
+            # skip special and instrumented methods
+            if name.startswith('__') or (cls, name) in _originals:
+                continue
+            method = inspect.getattr_static(cls, name)
+            if not inspect.isfunction(method):
+                continue
+            _originals[(cls, name)] = (method, name not in vars(cls))
+            setattr(cls, name, _wrap('{}.{}'.format(cls.__name__, name), method))
+
+def deinstrument():
+    """Function to restore the original methods of all the instrumented classes."""
+
+    for (cls, name), (method, inherited) in _originals.items():
+        if inherited:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, method)
+    _originals.clear()
+
+@contextlib.contextmanager
+def profiling(classes):
+    """Function to profile the methods of classes within a context.
+
+    Parameters
+    ----------
+    classes : list
+        Classes whose methods are profiled.
+    """
+
+    instrument(classes)
+    try:
+        yield
+    finally:
+        deinstrument()
+
+def get_stats(reset=False):
+    """Function to obtain a copy of the recorded statistics.
+
+    Parameters
+    ----------
+    reset : bool, optional
+        Option to clear the recorded statistics after copying them. Default is ``False``.
+
+    Returns
+    -------
+    stats : dict
+        Statistics formatted as ``{name: [count, cumulative, self]}`` with the times in seconds.
+    """
+
+    stats = {name: list(_stats_name) for name, _stats_name in _stats.items()}
+    if reset:
+        _stats.clear()
+
+    return stats
+
+def merge_stats(stats, stats_into=None):
+    """Function to add statistics recorded elsewhere, for example in other processes.
+
+    Parameters
+    ----------
+    stats : dict
+        Statistics formatted as ``{name: [count, cumulative, self]}``.
+    stats_into : dict, optional
+        Statistics to add to. Default is the recorded statistics.
+
+    Returns
+    -------
+    stats_into : dict
+        Merged statistics.
+    """
+
+    # frequently used variables
+    stats_into = stats_into if stats_into is not None else _stats
+
+    for name, _stats_other in stats.items():
+        _stats_name = stats_into.setdefault(name, [0, 0.0, 0.0])
+        for i in range(3):
+            _stats_name[i] += _stats_other[i]
+
+    return stats_into
+
+def reset():
+    """Function to clear the recorded statistics."""
+
+    _stats.clear()
+
+def get_report(stats=None):
+    """Function to obtain a report of the statistics ordered by the self time.
+
+    Parameters
+    ----------
+    stats : dict, optional
+        Statistics formatted as ``{name: [count, cumulative, self]}``. Default is the recorded statistics.
+
+    Returns
+    -------
+    report : str
+        Table of the call counts and the cumulative and self times.
+    """
+
+    # frequently used variables
+    stats = stats if stats is not None else _stats
+
+    lines = ['{:<48}{:>12}{:>16}{:>16}'.format('method', 'calls', 'cumulative (s)', 'self (s)')]
+    for name, (count, t_cum, t_self) in sorted(stats.items(), key=lambda item: item[1][2], reverse=True):
+        lines.append('{:<48}{:>12}{:>16.6f}{:>16.6f}'.format(name, count, t_cum, t_self))
+
+    return '\n'.join(lines)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing samplers for non-uniform sweeps of the system parameters."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+def get_samples_adaptive(func, x_min, x_max, seeds=None, widths=None, tol=1e-3, dim_init=101, dim_max=10001):
+    """Function to obtain an adaptive non-uniform grid for a vectorized function of one variable.
+
+    The grid is initialized with uniformly spaced points along with the seeds and the points around them at multiples of their widths. Each interval is then bisected until the deviation of the function at its midpoint from the linear interpolation is below the tolerance.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized function returning real values for an array of points, formatted as ``func(xs)``.
+    x_min : float
+        Minimum value of the variable.
+    x_max : float
+        Maximum value of the variable.
+    seeds : array_like, optional
+        Positions of the features to seed the grid.
+    widths : array_like, optional
+        Widths of the features around each seed.
+    tol : float, optional
+        Tolerance of the interpolation error relative to the range of the values. Default is ``1e-3``.
+    dim_init : int, optional
+        Number of uniformly spaced initial points. Default is ``101``.
+    dim_max : int, optional
+        Maximum number of points. Default is ``10001``.
+
+    Returns
+    -------
+    xs : numpy.ndarray
+        Sorted points of the grid.
+    vs : numpy.ndarray
+        Values of the function at the points.
+    """
+
+    # initial points
+    xs = [np.linspace(x_min, x_max, dim_init)]
+    if seeds is not None:
+        seeds = np.ravel(np.asarray(seeds, dtype=np.float_))
+        xs.append(seeds)
+        if widths is not None:
+            widths = np.broadcast_to(np.abs(np.ravel(np.asarray(widths, dtype=np.float_))), seeds.shape)
+            for factor in [0.5, 1.0, 2.0, 4.0, 8.0]:
+                xs += [seeds - factor * widths, seeds + factor * widths]
+    xs = np.unique(np.concatenate(xs))
+    xs = xs[(xs >= x_min) & (xs <= x_max)]
+    vs = np.asarray(func(xs), dtype=np.float_)
+
+    # intervals to be checked
+    _active = np.ones(len(xs) - 1, dtype=np.bool_)
+    while np.any(_active) and len(xs) < dim_max:
+        # limit number of new points
+        _idxs = np.flatnonzero(_active)[:dim_max - len(xs)]
+
+        # evaluate at midpoints
+        _xs_mid = (xs[_idxs] + xs[_idxs + 1]) / 2
+        _vs_mid = np.asarray(func(_xs_mid), dtype=np.float_)
+
+        # interpolation errors relative to the range of values
+        _scale = max(np.max(vs) - np.min(vs), np.finfo(np.float_).tiny)
+        _refine = np.abs(_vs_mid - (vs[_idxs] + vs[_idxs + 1]) / 2) > tol * _scale
+        # stop refining intervals at the floating point resolution
+        _refine &= (_xs_mid > xs[_idxs]) & (_xs_mid < xs[_idxs + 1])
+
+        # insert midpoints
+        xs = np.insert(xs, _idxs + 1, _xs_mid)
+        vs = np.insert(vs, _idxs + 1, _vs_mid)
+
+        # both halves of the refined intervals are checked next
+        _active = np.zeros(len(xs) - 1, dtype=np.bool_)
+        _new = _idxs + np.arange(1, len(_idxs) + 1)
+        _active[_new[_refine] - 1] = True
+        _active[_new[_refine]] = True
+
+    return xs, vs
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing vectorized solvers for batches of system parameters."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+def get_N_os_cubic(C, Delta_0, kappa, A_l_sq, num_iters=2):
+    r"""Function to obtain the real branches of the mean optical occupancy from the cubic equation.
+
+    The equation :math:`4 C^{2} N_{o}^{3} + 8 C \Delta_{0} N_{o}^{2} + (4 \Delta_{0}^{2} + \kappa^{2}) N_{o} - 4 |A_{l}|^{2} = 0` is solved for the shift :math:`x = C N_{o}` using the trigonometric method for three real roots and Cardano's method otherwise, followed by Newton iterations to polish the roots.
+
+    Parameters
+    ----------
+    C : float or numpy.ndarray
+        Coefficient of the mean optical occupancy in the effective detuning.
+    Delta_0 : float or numpy.ndarray
+        Detuning of the laser.
+    kappa : float or numpy.ndarray
+        Optical decay rate.
+    A_l_sq : float or numpy.ndarray
+        Squared amplitude of the laser.
+    num_iters : int, optional
+        Number of Newton iterations. Default is ``2``.
+
+    Returns
+    -------
+    N_os : numpy.ndarray
+        Non-negative real branches in ascending order with shape ``(3, *dims)``, padded with ``numpy.nan`` where the branches do not exist. In the absence of the laser, the only branch is :math:`N_{o} = 0`.
+    num_branches : numpy.ndarray
+        Number of non-negative real branches at each point.
+    """
+
+    # broadcast inputs
+    C, Delta_0, kappa, A_l_sq = np.broadcast_arrays(*[np.asarray(v, dtype=np.float_) for v in [C, Delta_0, kappa, A_l_sq]])
+
+    # coefficients of the monic cubic in x
+    b = 2.0 * Delta_0
+    c = Delta_0**2 + kappa**2 / 4.0
+    d = - C * A_l_sq
+
+    # depressed cubic y^3 + p y + q = 0 with x = y - b / 3
+    p = c - b**2 / 3.0
+    q = 2.0 * b**3 / 27.0 - b * c / 3.0 + d
+    D = q**2 / 4.0 + p**3 / 27.0
+
+    # initialize roots
+    xs = np.full((3, ) + C.shape, np.nan, dtype=np.float_)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # three real roots using the trigonometric method
+        _mask = D < 0.0
+        _r = 2.0 * np.sqrt(- p[_mask] / 3.0)
+        _theta = np.arccos(np.clip(3.0 * q[_mask] / p[_mask] / _r, -1.0, 1.0)) / 3.0
+        for k in range(3):
+            xs[k, _mask] = _r * np.cos(_theta - 2.0 * np.pi * k / 3.0) - b[_mask] / 3.0
+
+        # single real root using the stable form of Cardano's method
+        _mask = ~ _mask
+        _u = np.cbrt(- q[_mask] / 2.0 - np.sign(q[_mask]) * np.sqrt(D[_mask]))
+        xs[0, _mask] = np.where(_u == 0.0, 0.0, _u - p[_mask] / 3.0 / _u) - b[_mask] / 3.0
+
+        # polish using Newton iterations
+        for _ in range(num_iters):
+            _f = ((xs + b) * xs + c) * xs + d
+            _df = (3.0 * xs + 2.0 * b) * xs + c
+            xs = np.where(_df != 0.0, xs - _f / _df, xs)
+
+        # exact zero root in the absence of the laser
+        _scale = np.abs(b) + np.sqrt(np.abs(c))
+        xs = np.where((d == 0.0) & (np.abs(xs) <= 16.0 * np.finfo(np.float_).eps * _scale), 0.0, xs)
+
+        # convert to mean optical occupancies
+        N_os = np.where(C != 0.0, np.where(xs != 0.0, xs / C, 0.0), np.nan)
+    # linear equation in the absence of the shift
+    N_os[0] = np.where(C != 0.0, N_os[0], A_l_sq / c)
+
+    # retain non-negative branches in ascending order
+    N_os[~ (N_os >= 0.0)] = np.nan
+    N_os = np.sort(N_os, axis=0)
+    num_branches = np.sum(~ np.isnan(N_os), axis=0)
+
+    return N_os, num_branches
+
+def get_roots_batch(coeffs):
+    """Function to obtain the roots of a batch of polynomials using the eigenvalues of their companion matrices.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Coefficients of the polynomials in descending powers with shape ``(*dims, n + 1)``. The leading coefficients should be non-zero.
+
+    Returns
+    -------
+    roots : numpy.ndarray
+        Complex roots of the polynomials with shape ``(*dims, n)``, in the same order as ``numpy.roots``.
+    """
+
+    # frequently used variables
+    coeffs = np.asarray(coeffs)
+    n = coeffs.shape[-1] - 1
+
+    # stack companion matrices
+    companions = np.zeros(coeffs.shape[:-1] + (n, n), dtype=np.complex_)
+    companions[..., 0, :] = - coeffs[..., 1:] / coeffs[..., :1]
+    companions[..., np.arange(1, n), np.arange(n - 1)] = 1.0
+
+    return np.linalg.eigvals(companions)
+
+def get_hurwitz_minors(coeffs):
+    """Function to obtain the leading principal minors of the Hurwitz matrices for a batch of polynomials.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Real coefficients of the polynomials in descending powers with shape ``(*dims, n + 1)``.
+
+    Returns
+    -------
+    minors : numpy.ndarray
+        Leading principal minors of the Hurwitz matrices with shape ``(*dims, n)``.
+    """
+
+    # frequently used variables
+    coeffs = np.asarray(coeffs, dtype=np.float_)
+    n = coeffs.shape[-1] - 1
+
+    # pad coefficients with zeros on both sides
+    _padded = np.concatenate([np.zeros(coeffs.shape[:-1] + (n, )), coeffs, np.zeros(coeffs.shape[:-1] + (n, ))], axis=-1)
+    # indices of the elements of the Hurwitz matrix
+    _idxs = 2 * np.arange(1, n + 1)[np.newaxis, :] - np.arange(1, n + 1)[:, np.newaxis] + n
+    hurwitz = _padded[..., _idxs]
+
+    return np.stack([np.linalg.det(hurwitz[..., :k, :k]) for k in range(1, n + 1)], axis=-1)
+
+def get_stability_routh_hurwitz(coeffs):
+    """Function to obtain the Routh-Hurwitz stability of a batch of characteristic polynomials.
+
+    The polynomials are first made monic and rescaled by the characteristic frequency :math:`|a_{n} / a_{0}|^{1 / n}` so that the Hurwitz minors are dimensionless.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Real coefficients of the characteristic polynomials in descending powers with shape ``(*dims, n + 1)``.
+
+    Returns
+    -------
+    num_unstable : numpy.ndarray
+        Number of roots with positive real parts, obtained from the sign changes in the first column of the Routh array. A value of ``0`` denotes a stable system.
+    margins : numpy.ndarray
+        Smallest normalized Hurwitz minor, which is positive only for stable systems.
+    """
+
+    # normalize coefficients
+    coeffs = np.asarray(coeffs, dtype=np.float_)
+    n = coeffs.shape[-1] - 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        _omega = np.abs(coeffs[..., -1:] / coeffs[..., :1])**(1.0 / n)
+        _omega = np.where(_omega > 0.0, _omega, 1.0)
+        coeffs = coeffs / coeffs[..., :1] / _omega**np.arange(n + 1)
+
+        # get Hurwitz minors
+        minors = get_hurwitz_minors(
+            coeffs=coeffs
+        )
+
+        # first column of the Routh array
+        _column = np.concatenate([coeffs[..., :2], minors[..., 1:] / minors[..., :-1]], axis=-1)
+    num_unstable = np.sum(np.sign(_column[..., 1:]) != np.sign(_column[..., :-1]), axis=-1)
+
+    return num_unstable, np.min(minors, axis=-1)
+
+def get_lyapunov_solutions(As, Ds):
+    r"""Function to obtain the solutions of a batch of continuous Lyapunov equations.
+
+    The equations :math:`A V + V A^{T} + D = 0` are vectorized as :math:`(A \otimes I + I \otimes A) \mathrm{vec}(V) = - \mathrm{vec}(D)` and solved together.
+
+    Parameters
+    ----------
+    As : numpy.ndarray
+        Drift matrices with shape ``(*dims, n, n)``.
+    Ds : numpy.ndarray
+        Noise matrices with shape ``(*dims, n, n)``.
+
+    Returns
+    -------
+    Vs : numpy.ndarray
+        Solutions with shape ``(*dims, n, n)``.
+    """
+
+    # frequently used variables
+    As = np.asarray(As)
+    Ds = np.broadcast_to(Ds, As.shape)
+    n = As.shape[-1]
+    _eye = np.eye(n)
+
+    # Kronecker sums for the row-major vectorization
+    _kron = np.einsum('...ij,kl->...ikjl', As, _eye) + np.einsum('ij,...kl->...ikjl', _eye, As)
+    _kron = _kron.reshape(As.shape[:-2] + (n**2, n**2))
+
+    # solve linear systems
+    Vs = np.linalg.solve(_kron, - Ds.reshape(As.shape[:-2] + (n**2, 1)))
+
+    return Vs.reshape(As.shape)
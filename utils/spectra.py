@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing vectorized extractors of spectral features from sweep results."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+def _get_mid(dim):
+    """Function to obtain the index from which the features are searched outwards.
+
+    Parameters
+    ----------
+    dim : int
+        Number of points along the sweep axis.
+
+    Returns
+    -------
+    mid : int
+        Index of the center.
+    """
+
+    return int(dim / 2) + 1 if dim % 2 == 0 else int(dim / 2)
+
+def _get_first(mask, axis=-1):
+    """Function to obtain the index of the first ``True`` value along an axis.
+
+    Parameters
+    ----------
+    mask : numpy.ndarray
+        Boolean array.
+    axis : int, optional
+        Axis to search. Default is ``-1``.
+
+    Returns
+    -------
+    idxs : numpy.ndarray
+        Indices of the first ``True`` values, or ``-1`` if none exist.
+    """
+
+    return np.where(np.any(mask, axis=axis), np.argmax(mask, axis=axis), -1)
+
+def _get_maxima_sides(vs, mid, num=1):
+    """Function to obtain the indices of the first local maxima on the right and the left of the center, searched outwards.
+
+    Parameters
+    ----------
+    vs : numpy.ndarray
+        Profiles with shape ``(*dims, dim)``.
+    mid : int
+        Index of the center.
+    num : int, optional
+        Number of maxima on each side. Default is ``1``.
+
+    Returns
+    -------
+    idxs_r : numpy.ndarray
+        Indices of the maxima on the right in the order of the search with shape ``(*dims, num)``, or ``-1`` if they do not exist.
+    idxs_l : numpy.ndarray
+        Indices of the maxima on the left in the order of the search with shape ``(*dims, num)``, or ``-1`` if they do not exist.
+    """
+
+    # frequently used variables
+    dim = vs.shape[-1]
+
+    # local maxima
+    _is_max = np.zeros(vs.shape, dtype=np.bool_)
+    _is_max[..., 1:-1] = (vs[..., 1:-1] >= vs[..., :-2]) & (vs[..., 2:] <= vs[..., 1:-1])
+
+    # maxima ordered outwards from the center
+    _is_max_r = np.array(_is_max[..., mid:dim - 1])
+    _is_max_l = np.array(_is_max[..., 1:dim - mid][..., ::-1])
+
+    idxs_r = list()
+    idxs_l = list()
+    for _ in range(num):
+        _idxs_r = _get_first(_is_max_r)
+        _idxs_l = _get_first(_is_max_l)
+        idxs_r.append(np.where(_idxs_r >= 0, _idxs_r + mid, -1))
+        idxs_l.append(np.where(_idxs_l >= 0, dim - mid - 1 - _idxs_l, -1))
+        # exclude the maxima found
+        np.put_along_axis(_is_max_r, np.maximum(_idxs_r, 0)[..., np.newaxis], False, axis=-1)
+        np.put_along_axis(_is_max_l, np.maximum(_idxs_l, 0)[..., np.newaxis], False, axis=-1)
+
+    return np.stack(idxs_r, axis=-1), np.stack(idxs_l, axis=-1)
+
+def _get_peaks(xs, vs, idxs, interpolate=True):
+    """Function to obtain the positions and the values of local maxima at given indices.
+
+    Parameters
+    ----------
+    xs : numpy.ndarray
+        Values of the sweep axis with shape ``(dim, )``.
+    vs : numpy.ndarray
+        Profiles with shape ``(*dims, dim)``.
+    idxs : numpy.ndarray
+        Indices of the maxima with shape ``(*dims, num)``, or ``-1`` if they do not exist.
+    interpolate : bool, optional
+        Option to locate the maxima between the grid points using parabolic interpolation. Default is ``True``.
+
+    Returns
+    -------
+    xs_peak : numpy.ndarray
+        Positions of the maxima with shape ``(*dims, num)``, with ``numpy.nan`` where the maxima do not exist.
+    vs_peak : numpy.ndarray
+        Values of the maxima with shape ``(*dims, num)``.
+    """
+
+    # frequently used variables
+    _found = idxs >= 0
+    idxs = np.where(_found, idxs, 1)
+
+    # values at the grid points
+    _vs_0 = np.take_along_axis(vs, idxs - 1, axis=-1)
+    _vs_1 = np.take_along_axis(vs, idxs, axis=-1)
+    _vs_2 = np.take_along_axis(vs, idxs + 1, axis=-1)
+    xs_peak = xs[idxs]
+    vs_peak = _vs_1
+
+    # parabolic interpolation around the grid points
+    if interpolate:
+        _h_0 = xs[idxs - 1] - xs_peak
+        _h_2 = xs[idxs + 1] - xs_peak
+        _d_0 = _vs_0 - _vs_1
+        _d_2 = _vs_2 - _vs_1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            _a = (_d_2 * _h_0 - _d_0 * _h_2) / _h_0 / _h_2 / (_h_2 - _h_0)
+            _b = (_d_0 * _h_2**2 - _d_2 * _h_0**2) / _h_0 / _h_2 / (_h_2 - _h_0)
+            _shift = - _b / 2 / _a
+        _valid = (_a < 0) & (_shift >= _h_0) & (_shift <= _h_2)
+        xs_peak = np.where(_valid, xs_peak + _shift, xs_peak)
+        vs_peak = np.where(_valid, _vs_1 - _b**2 / 4 / _a, vs_peak)
+
+    # mask missing maxima
+    xs_peak = np.where(_found, xs_peak, np.nan)
+    vs_peak = np.where(_found, vs_peak, np.nan)
+
+    return xs_peak, vs_peak
+
+def get_peaks_center(xs, vs, interpolate=True):
+    """Function to obtain the local maxima nearest to the center on either side for each profile.
+
+    Parameters
+    ----------
+    xs : numpy.ndarray
+        Values of the sweep axis with shape ``(dim, )``.
+    vs : numpy.ndarray
+        Profiles with shape ``(*dims, dim)``.
+    interpolate : bool, optional
+        Option to locate the maxima between the grid points using parabolic interpolation. Default is ``True``.
+
+    Returns
+    -------
+    xs_peak : numpy.ndarray
+        Positions of the maxima on the left and the right of the center with shape ``(*dims, 2)``, with ``numpy.nan`` where no maxima exist.
+    vs_peak : numpy.ndarray
+        Values of the maxima with shape ``(*dims, 2)``.
+    """
+
+    # frequently used variables
+    xs = np.asarray(xs, dtype=np.float_)
+    vs = np.asarray(vs, dtype=np.float_)
+
+    # nearest maxima on the left and the right
+    idxs_r, idxs_l = _get_maxima_sides(
+        vs=vs,
+        mid=_get_mid(xs.shape[0])
+    )
+
+    return _get_peaks(
+        xs=xs,
+        vs=vs,
+        idxs=np.concatenate([idxs_l, idxs_r], axis=-1),
+        interpolate=interpolate
+    )
+
+def get_maxima_center(xs, vs, interpolate=True):
+    """Function to obtain the value of the first local maximum found outwards from the center for each profile.
+
+    The points on the right and the left of the center are visited alternately, starting on the right, so that a maximum on the right is preferred at equal numbers of steps.
+
+    Parameters
+    ----------
+    xs : numpy.ndarray
+        Values of the sweep axis with shape ``(dim, )``.
+    vs : numpy.ndarray
+        Profiles with shape ``(*dims, dim)``.
+    interpolate : bool, optional
+        Option to locate the maxima between the grid points using parabolic interpolation. Default is ``True``.
+
+    Returns
+    -------
+    vs_maxi : numpy.ndarray
+        Values of the first maxima with shape ``dims``, with ``numpy.nan`` where no maxima exist.
+    """
+
+    # frequently used variables
+    xs = np.asarray(xs, dtype=np.float_)
+    vs = np.asarray(vs, dtype=np.float_)
+    dim = xs.shape[0]
+    mid = _get_mid(dim)
+
+    # nearest maxima on the left and the right
+    idxs_r, idxs_l = _get_maxima_sides(
+        vs=vs,
+        mid=mid
+    )
+
+    # number of steps from the center
+    _steps_r = np.where(idxs_r >= 0, idxs_r - mid, dim)
+    _steps_l = np.where(idxs_l >= 0, dim - 1 - mid - idxs_l, dim)
+
+    # get first maxima
+    _, vs_peak = _get_peaks(
+        xs=xs,
+        vs=vs,
+        idxs=np.where(_steps_r <= _steps_l, idxs_r, idxs_l),
+        interpolate=interpolate
+    )
+
+    return vs_peak[..., 0]
+
+def get_splittings_center(xs, vs, interpolate=True):
+    """Function to obtain the separation between the local maxima found outwards from the center for each profile.
+
+    The points on the right and the left of the center are visited alternately, starting on the right, until at least two maxima are found, which may lie on the same side. The separation is obtained between the first and the last maxima found, so that it vanishes if only a single maximum exists.
+
+    Parameters
+    ----------
+    xs : numpy.ndarray
+        Values of the sweep axis with shape ``(dim, )``.
+    vs : numpy.ndarray
+        Profiles with shape ``(*dims, dim)``.
+    interpolate : bool, optional
+        Option to locate the maxima between the grid points using parabolic interpolation. Default is ``True``.
+
+    Returns
+    -------
+    splittings : numpy.ndarray
+        Separations between the maxima with shape ``dims``, with ``numpy.nan`` where no maxima exist.
+    """
+
+    # frequently used variables
+    xs = np.asarray(xs, dtype=np.float_)
+    vs = np.asarray(vs, dtype=np.float_)
+    dim = xs.shape[0]
+    mid = _get_mid(dim)
+
+    # first two maxima on the right and the left
+    idxs_r, idxs_l = _get_maxima_sides(
+        vs=vs,
+        mid=mid,
+        num=2
+    )
+    idxs = np.concatenate([idxs_r, idxs_l], axis=-1)
+
+    # positions of the maxima
+    xs_peak, _ = _get_peaks(
+        xs=xs,
+        vs=vs,
+        idxs=idxs,
+        interpolate=interpolate
+    )
+
+    # order of the search with the right visited first at each step
+    _orders = np.concatenate([2 * (idxs_r - mid), 2 * (dim - 1 - mid - idxs_l) + 1], axis=-1)
+    _orders = np.where(idxs >= 0, _orders, 4 * dim)
+    _sorter = np.argsort(_orders, axis=-1)
+    _orders = np.take_along_axis(_orders, _sorter, axis=-1)
+    xs_peak = np.take_along_axis(xs_peak, _sorter, axis=-1)
+
+    # last maxima visited up to the step of the second maxima
+    _num = np.sum(_orders <= 2 * (_orders[..., 1:2] // 2) + 1, axis=-1, keepdims=True)
+    _num = np.where(_orders[..., 1:2] < 4 * dim, _num, 1)
+    _xs_last = np.take_along_axis(xs_peak, _num - 1, axis=-1)[..., 0]
+
+    return np.abs(_xs_last - xs_peak[..., 0])
+
+def get_fwhm_center(xs, vs, vs_ref=None, interpolate=True):
+    """Function to obtain the full width at half maximum around the center for each profile.
+
+    Parameters
+    ----------
+    xs : numpy.ndarray
+        Values of the sweep axis with shape ``(dim, )``.
+    vs : numpy.ndarray
+        Profiles with shape ``(*dims, dim)``.
+    vs_ref : numpy.ndarray, optional
+        Reference values whose halves define the crossings, with shape ``dims``. Default is the value at the center of each profile.
+    interpolate : bool, optional
+        Option to locate the crossings between the grid points using linear interpolation. Default is ``True``.
+
+    Returns
+    -------
+    fwhm : numpy.ndarray
+        Full widths at half maxima with shape ``dims``, with ``0`` where the crossing exists on only one side and ``numpy.nan`` where it exists on neither.
+    """
+
+    # frequently used variables
+    xs = np.asarray(xs, dtype=np.float_)
+    vs = np.asarray(vs, dtype=np.float_)
+    dim = xs.shape[0]
+    mid = _get_mid(dim)
+    if vs_ref is None:
+        vs_ref = vs[..., int(dim / 2)]
+    _vs_half = np.asarray(vs_ref, dtype=np.float_)[..., np.newaxis] / 2
+
+    # crossings below the half maxima
+    _below = vs <= _vs_half
+    _idx_r = _get_first(_below[..., mid:dim - 1])
+    _idx_r = np.where(_idx_r >= 0, _idx_r + mid, -1)
+    _idx_l = _get_first(_below[..., 1:dim - mid][..., ::-1])
+    _idx_l = np.where(_idx_l >= 0, dim - mid - 1 - _idx_l, -1)
+    _found_r = _idx_r >= 0
+    _found_l = _idx_l >= 0
+    _idx_r = np.where(_found_r, _idx_r, mid)[..., np.newaxis]
+    _idx_l = np.where(_found_l, _idx_l, mid)[..., np.newaxis]
+    xs_r = xs[_idx_r]
+    xs_l = xs[_idx_l]
+
+    # linear interpolation with the inner neighbours
+    if interpolate:
+        _vs_r = np.take_along_axis(vs, _idx_r, axis=-1)
+        _vs_r_in = np.take_along_axis(vs, _idx_r - 1, axis=-1)
+        _vs_l = np.take_along_axis(vs, _idx_l, axis=-1)
+        _vs_l_in = np.take_along_axis(vs, _idx_l + 1, axis=-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            _frac_r = np.clip((_vs_r_in - _vs_half) / (_vs_r_in - _vs_r), 0.0, 1.0)
+            _frac_l = np.clip((_vs_l_in - _vs_half) / (_vs_l_in - _vs_l), 0.0, 1.0)
+        xs_r = np.where(np.isnan(_frac_r), xs_r, xs[_idx_r - 1] + _frac_r * (xs_r - xs[_idx_r - 1]))
+        xs_l = np.where(np.isnan(_frac_l), xs_l, xs[_idx_l + 1] + _frac_l * (xs_l - xs[_idx_l + 1]))
+
+    return np.where(_found_r & _found_l, np.abs(xs_r - xs_l)[..., 0], np.where(_found_r | _found_l, 0.0, np.nan))
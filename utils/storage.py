@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module containing on-disk storages for sweep results."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import hashlib
+import inspect
+import json
+import numpy as np
+import os
+import shutil
+import sys
+
+# root directory of the local modules
+_dir_path_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class ChunkedStore():
+    r"""Class to stream the rows of sweep results into a memory-mapped array on disk.
+
+    The store is a directory containing the values (``values.npy``), the flags for the completed rows (``done.npy``), the values of the axes (``axes.npz``) and the metadata (``meta.json``). Rows are buffered in memory and written to disk in chunks, so that the memory usage is limited to a few chunks.
+
+    Parameters
+    ----------
+    dir_path : str
+        Path of the directory of the store.
+    axes : list, optional
+        Axes of the results in the order of the dimensions, each formatted as ``{'var': name, 'val': values}``. The last axis is spanned by each row. Required when ``mode`` is ``'w'``.
+    attrs : dict, optional
+        JSON-serializable attributes saved with the store.
+    dtype : str, optional
+        Data type of the values. Default is ``'float64'``.
+    chunk_size : int, optional
+        Number of rows buffered before writing to disk. Default is ``16``.
+    mode : str, optional
+        Mode to open the store. Options are ``'r'`` (default) to read lazily, ``'r+'`` to update an existing store and ``'w'`` to create a new store, overwriting any existing one.
+    """
+
+    def __init__(self, dir_path, axes=None, attrs=None, dtype='float64', chunk_size=16, mode='r'):
+        """Class constructor for ChunkedStore."""
+
+        # set attributes
+        self.dir_path = dir_path
+        self.chunk_size = chunk_size
+        self.mode = mode
+        self._buffer = dict()
+
+        # create new store
+        if mode == 'w':
+            if axes is None:
+                raise ValueError('Axes are required to create a new store')
+            os.makedirs(dir_path, exist_ok=True)
+            self.axes = [{
+                'var': axis['var'],
+                'val': np.asarray(axis['val'])
+            } for axis in axes]
+            self.attrs = attrs if attrs is not None else dict()
+            shape = tuple(len(axis['val']) for axis in self.axes)
+            # save metadata
+            with open(os.path.join(dir_path, 'meta.json'), 'w') as file:
+                json.dump({
+                    'vars': [axis['var'] for axis in self.axes],
+                    'shape': shape,
+                    'dtype': str(np.dtype(dtype)),
+                    'attrs': self.attrs
+                }, file)
+            np.savez(os.path.join(dir_path, 'axes.npz'), *[axis['val'] for axis in self.axes])
+            # allocate arrays
+            self.values = np.lib.format.open_memmap(os.path.join(dir_path, 'values.npy'), mode='w+', dtype=dtype, shape=shape)
+            self.done = np.lib.format.open_memmap(os.path.join(dir_path, 'done.npy'), mode='w+', dtype=np.bool_, shape=shape[:-1])
+        # open existing store
+        else:
+            with open(os.path.join(dir_path, 'meta.json'), 'r') as file:
+                meta = json.load(file)
+            with np.load(os.path.join(dir_path, 'axes.npz')) as file:
+                self.axes = [{
+                    'var': var,
+                    'val': file['arr_{}'.format(i)]
+                } for i, var in enumerate(meta['vars'])]
+            self.attrs = meta['attrs']
+            self.values = np.load(os.path.join(dir_path, 'values.npy'), mmap_mode=mode)
+            self.done = np.load(os.path.join(dir_path, 'done.npy'), mmap_mode=mode)
+
+    @property
+    def shape(self):
+        """tuple: Shape of the values."""
+
+        return self.values.shape
+
+    def write_row(self, idx, row):
+        """Method to write a row of values.
+
+        Parameters
+        ----------
+        idx : tuple
+            Indices of the row along the outer axes.
+        row : numpy.ndarray
+            Values of the row.
+        """
+
+        # buffer row
+        self._buffer[tuple(idx)] = np.asarray(row, dtype=self.values.dtype)
+
+        # write chunk
+        if len(self._buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Method to write the buffered rows to disk."""
+
+        for idx, row in self._buffer.items():
+            self.values[idx] = row
+            self.done[idx] = True
+        self._buffer = dict()
+
+        # flush memory maps
+        if self.mode != 'r':
+            self.values.flush()
+            self.done.flush()
+
+    def close(self):
+        """Method to flush the buffered rows and release the memory maps."""
+
+        if self.mode != 'r':
+            self.flush()
+        self.values = None
+        self.done = None
+
+def _default_json(obj):
+    """Function to convert the non-serializable objects of the parameters for hashing."""
+
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return repr(obj)
+
+def _get_source(obj):
+    """Function to obtain the source code of an object or its compiled bytecode if the source is unavailable."""
+
+    try:
+        return inspect.getsource(obj)
+    # objects defined interactively
+    except (OSError, TypeError):
+        code = getattr(obj, '__code__', None)
+        return '{}.{}:{}'.format(getattr(obj, '__module__', ''), getattr(obj, '__qualname__', repr(obj)), code.co_code.hex() if code is not None else '')
+
+def _get_modules_local(obj):
+    """Function to obtain the local modules referenced directly by the namespace of a module or by the code of a function, excluding the module of the object itself."""
+
+    # objects referenced by the module or the function
+    if inspect.ismodule(obj):
+        name = obj.__name__
+        values = list(vars(obj).values())
+    else:
+        name = getattr(obj, '__module__', None)
+        code = getattr(obj, '__code__', None)
+        _globals = getattr(obj, '__globals__', dict())
+        values = [_globals[_name] for _name in code.co_names if _name in _globals] if code is not None else list()
+
+    modules = dict()
+    for value in values:
+        _module = value if inspect.ismodule(value) else sys.modules.get(getattr(value, '__module__', None) or '')
+        # only modules defined in the files of the repository
+        _file_path = getattr(_module, '__file__', None)
+        if _module is not None and _module.__name__ != name and _file_path is not None and os.path.abspath(_file_path).startswith(_dir_path_root + os.sep):
+            modules[_module.__name__] = _module
+
+    return modules
+
+def get_fingerprint(obj):
+    """Function to obtain the fingerprint of the source code defining an object.
+
+    Parameters
+    ----------
+    obj : object
+        Module, class or function. For classes and functions, the source of the complete module is used so that the helpers defined alongside are included. The sources of the local modules imported directly by the module, such as the solvers and the kernels, are included as well.
+
+    Returns
+    -------
+    fingerprint : str
+        SHA-256 hash of the source code.
+    """
+
+    # module containing the object
+    module = obj if inspect.ismodule(obj) else sys.modules.get(obj.__module__)
+    if module is None or getattr(module, '__file__', None) is None:
+        sources = [_get_source(module if module is not None else obj)]
+    # module and its direct local dependencies
+    else:
+        modules = dict(_get_modules_local(module), **{module.__name__: module})
+        sources = ['{}\n{}'.format(name, _get_source(modules[name])) for name in sorted(modules)]
+
+    return hashlib.sha256('\n'.join(sources).encode('utf-8')).hexdigest()
+
+def get_key(params, params_system, func=None, attrs=None, fingerprints=None, base=False):
+    """Function to obtain the key of the inputs of a sweep.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters of the looper. The options in ``ResultCache.keys_ignored`` are excluded.
+    params_system : dict
+        Parameters of the system.
+    func : callable or list, optional
+        Function or functions evaluated by the looper. The fingerprints of the local modules referenced by their code, such as the kernels, are included.
+    attrs : dict, optional
+        Additional options of the sweep affecting the results.
+    fingerprints : list, optional
+        Fingerprints of the models (refer to ``get_fingerprint``).
+    base : bool, optional
+        Option to exclude the values of the axes so that sweeps of the same quantity over different grids share the key. Default is ``False``.
+
+    Returns
+    -------
+    key : str
+        SHA-256 hash of the inputs.
+    """
+
+    # frequently used variables
+    params_looper = {k: v for k, v in params.items() if k not in ResultCache.keys_ignored}
+    funcs = (func if isinstance(func, list) else [func]) if func is not None else list()
+
+    # retain only the swept variables
+    if base:
+        vars_axes = [params_looper[axis]['var'] for axis in ['X', 'Y', 'Z'] if axis in params_looper]
+        params_looper = {k: v['var'] if k in ['X', 'Y', 'Z'] else v for k, v in params_looper.items()}
+        params_system = {k: v for k, v in params_system.items() if k not in vars_axes}
+
+    # serialize inputs
+    inputs = json.dumps({
+        'looper': params_looper,
+        'system': params_system,
+        'func': ([_get_source(_func) for _func in func] if isinstance(func, list) else _get_source(func)) if func is not None else None,
+        'modules': {name: get_fingerprint(module) for _func in funcs for name, module in _get_modules_local(_func).items()},
+        'attrs': attrs,
+        'fingerprints': fingerprints if fingerprints is not None else list()
+    }, sort_keys=True, default=_default_json)
+
+    return hashlib.sha256(inputs.encode('utf-8')).hexdigest()
+
+def get_params_looper(params, params_system, func=None, models=None):
+    """Function to obtain the parameters of a looper of the toolbox with the file path prefix suffixed by the key of its inputs.
+
+    The loopers of the toolbox reuse the results saved with the same file path prefix, so that the key ensures that the saved results are only reused for the same looper parameters, system parameters, function and models. Results saved without the suffix keep their file path prefix as long as the file ``keys.json`` in their directory records the same key for the name of the prefix.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters of the looper containing the option ``'file_path_prefix'``.
+    params_system : dict
+        Parameters of the system.
+    func : callable, optional
+        Function evaluated by the looper.
+    models : list, optional
+        Modules, classes or functions whose source code determines the results, for example ``[BEC_10]``.
+
+    Returns
+    -------
+    params : dict
+        Copy of the parameters of the looper with the updated file path prefix.
+    """
+
+    # key of the inputs
+    key = get_key(
+        params=params,
+        params_system=params_system,
+        func=func,
+        fingerprints=[get_fingerprint(model) for model in models] if models is not None else None
+    )
+
+    # keys of the results saved without the suffix
+    file_path_keys = os.path.join(os.path.dirname(params['file_path_prefix']), 'keys.json')
+    if os.path.isfile(file_path_keys):
+        with open(file_path_keys, 'r') as file:
+            keys = json.load(file)
+        if keys.get(os.path.basename(params['file_path_prefix']), None) == key:
+            return dict(params)
+
+    return dict(params, file_path_prefix='{}_{}'.format(params['file_path_prefix'], key[:16]))
+
+class ResultCache():
+    """Class to cache the results of sweeps in a directory of stores addressed by the hash of their inputs.
+
+    Each entry is a ``ChunkedStore`` named by the hash of the looper parameters, the system parameters, the source of the evaluated function and the fingerprints of the models. The least recently used entries are evicted once the total size exceeds the limit.
+
+    Parameters
+    ----------
+    dir_path : str
+        Path of the directory of the cache.
+    models : list, optional
+        Modules, classes or functions whose source code determines the results, for example ``[BEC_10]``.
+    size_limit : int, optional
+        Maximum total size of the entries in bytes. Default is ``2**30``.
+    """
+
+    # looper parameters not affecting the results
+    keys_ignored = ['show_progress', 'file_path_prefix']
+
+    def __init__(self, dir_path, models=None, size_limit=2**30):
+        """Class constructor for ResultCache."""
+
+        # set attributes
+        self.dir_path = dir_path
+        self.size_limit = size_limit
+        self.fingerprints = [get_fingerprint(model) for model in models] if models is not None else list()
+
+        os.makedirs(dir_path, exist_ok=True)
+
+    def get_key(self, params, params_system, func=None, attrs=None, base=False):
+        """Method to obtain the key of an entry.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters of the looper.
+        params_system : dict
+            Parameters of the system.
+        func : callable or list, optional
+            Function or functions evaluated by the looper.
+        attrs : dict, optional
+            Additional options of the sweep affecting the results.
+        base : bool, optional
+            Option to exclude the values of the axes so that sweeps of the same quantity over different grids share the key. Default is ``False``.
+
+        Returns
+        -------
+        key : str
+            SHA-256 hash of the inputs.
+        """
+
+        return get_key(
+            params=params,
+            params_system=params_system,
+            func=func,
+            attrs=attrs,
+            fingerprints=self.fingerprints,
+            base=base
+        )
+
+    def get_path(self, key):
+        """Method to obtain the path of the store of an entry.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+
+        Returns
+        -------
+        dir_path : str
+            Path of the directory of the store.
+        """
+
+        return os.path.join(self.dir_path, key)
+
+    def get(self, key):
+        """Method to obtain a completed entry and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+
+        Returns
+        -------
+        store : ChunkedStore or None
+            Store of the entry or ``None`` if it is missing or incomplete.
+        """
+
+        # frequently used variables
+        dir_path = self.get_path(key)
+
+        # missing entry
+        if not os.path.isfile(os.path.join(dir_path, 'done.npy')):
+            return None
+        store = ChunkedStore(
+            dir_path=dir_path,
+            mode='r'
+        )
+        # incomplete entry
+        if not np.all(store.done):
+            store.close()
+            return None
+
+        # update access time
+        os.utime(dir_path)
+
+        return store
+
+    def get_compatible(self, key_base):
+        """Method to obtain the most recently used completed entry sharing the key of its inputs excluding the values of the axes.
+
+        Parameters
+        ----------
+        key_base : str
+            Key of the inputs excluding the values of the axes (refer to ``get_key``).
+
+        Returns
+        -------
+        store : ChunkedStore or None
+            Store of the entry or ``None`` if no entry is compatible.
+        """
+
+        # entries ordered by the most recent access
+        keys = sorted(os.listdir(self.dir_path), key=lambda key: os.path.getmtime(self.get_path(key)), reverse=True)
+
+        for key in keys:
+            # filter entries
+            file_path = os.path.join(self.get_path(key), 'meta.json')
+            if not os.path.isfile(file_path):
+                continue
+            with open(file_path, 'r') as file:
+                if json.load(file)['attrs'].get('key_base') != key_base:
+                    continue
+            store = self.get(
+                key=key
+            )
+            if store is not None:
+                return store
+
+        return None
+
+    def get_size(self, key):
+        """Method to obtain the size of an entry.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+
+        Returns
+        -------
+        size : int
+            Total size of the files of the entry in bytes.
+        """
+
+        # frequently used variables
+        dir_path = self.get_path(key)
+
+        return sum(os.path.getsize(os.path.join(dir_path, file_name)) for file_name in os.listdir(dir_path))
+
+    def evict(self, keys_kept=None):
+        """Method to remove the least recently used entries exceeding the size limit.
+
+        Parameters
+        ----------
+        keys_kept : list, optional
+            Keys of the entries never removed, for example the ones currently in use.
+        """
+
+        # entries ordered by the most recent access
+        keys = sorted(os.listdir(self.dir_path), key=lambda key: os.path.getmtime(self.get_path(key)), reverse=True)
+        keys_kept = keys_kept if keys_kept is not None else list()
+
+        # remove entries exceeding the limit
+        size = 0
+        for key in keys:
+            _size = self.get_size(key)
+            if size + _size > self.size_limit and key not in keys_kept:
+                shutil.rmtree(self.get_path(key))
+            else:
+                size += _size